@@ -10,6 +10,16 @@ import altair as alt
 from datetime import datetime, timedelta
 from faker import Faker
 from GoogleNews import GoogleNews
+import sys
+import os
+
+# Adiciona o diretório src ao path para imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from media_engine import TOPIC_TAGGER, UPSTREAM_CACHE
+from tagging import build_tag_index
+from schema import SENTIMENT_DTYPE
+from cube import Cube, summarize_clips
 
 # Configuração da página
 st.set_page_config(
@@ -114,29 +124,97 @@ def generate_mock_clips(fake: Faker, n: int = 50) -> pd.DataFrame:
     data = []
     for _ in range(n):
         source = fake.random_element(sources)
+        titulo = fake.sentence(nb_words=8)
+        topico = fake.random_element(topics)
+        # Tags atribuídas na geração/ingestão: o próprio tópico + tags do tagger
+        tags = [topico] + [t for t in TOPIC_TAGGER.tag(f"{titulo} {topico}") if t != topico]
         data.append({
             'data_hora': fake.date_time_between(start_date='-7d', end_date='now'),
             'fonte': source,
             'veiculo': fake.random_element(channels[source]),
-            'titulo': fake.sentence(nb_words=8),
-            'topico': fake.random_element(topics),
+            'titulo': titulo,
+            'topico': topico,
+            'tags': tags,
             'sentimento': fake.random_element(sentiments),
             'alcance': fake.random_int(min=1000, max=500000),
             'relevancia': fake.random_int(min=1, max=10)
         })
     
-    return pd.DataFrame(data).sort_values('data_hora', ascending=False)
+    # Colunas repetidas como category; contagens em inteiros compactos
+    df = pd.DataFrame(data).astype({
+        'fonte': pd.CategoricalDtype(sources),
+        'veiculo': 'category',
+        'topico': pd.CategoricalDtype(topics),
+        'sentimento': SENTIMENT_DTYPE,
+        'alcance': 'int32',
+        'relevancia': 'int8',
+    })
+    return df.sort_values('data_hora', ascending=False)
+
+
+@st.cache_resource
+def get_clip_store():
+    """
+    Armazenamento da clipagem no processo: clippings ingeridos uma vez (não a
+    cada interação), o cubo de agregados e o índice de tags mantidos na ingestão.
+    """
+    store = {'fake': init_faker(), 'clips': pd.DataFrame(), 'cube': Cube(), 'tag_index': None, 'topic_index': None}
+    ingest_clips(store, generate_mock_clips(store['fake'], n=100))
+    return store
+
+
+def ingest_clips(store, new_clips: pd.DataFrame):
+    """
+    Acrescenta clippings ao armazenamento e atualiza o cubo incrementalmente.
+    Os índices tag → posições e tópico → posições são refeitos aqui, quando as
+    posições mudam.
+    """
+    new_clips = new_clips.assign(dia=new_clips['data_hora'].dt.normalize())
+    store['cube'].add_frame(new_clips)
+    clips = pd.concat([store['clips'], new_clips]) if not store['clips'].empty else new_clips
+    store['clips'] = clips.sort_values('data_hora', ascending=False)
+    store['tag_index'] = build_tag_index(store['clips'], 'tags')
+    store['topic_index'] = build_tag_index(store['clips'].assign(
+        topicos=[[topico] for topico in store['clips']['topico']]
+    ), 'topicos')
+
+
+def filter_clips(store, topico_busca='', fontes=None):
+    """
+    Clippings e tópicos selecionados pela busca e pelas fontes. A busca casa
+    tags, mas o recorte é pela dimensão tópico do cubo (tópicos cujas tags
+    casam), para que a lista e os KPIs de summarize_clips contem os mesmos
+    itens. Retorna (clippings, tópicos ou None sem busca).
+    """
+    df_clips = store['clips']
+    topicos = None
+    if topico_busca:
+        # Busca nas tags (poucas) e resolve os itens pelo índice de tópicos
+        # (posições sobre store['clips']: aplicado antes do filtro de fontes)
+        matched_tags = set(store['tag_index'].search_tags(topico_busca))
+        topicos = {
+            topico for topico in df_clips['topico'].cat.categories
+            if matched_tags & {topico, *TOPIC_TAGGER.tag(topico)}
+        }
+        positions = store['topic_index'].lookup_any(sorted(topicos))
+        df_clips = df_clips.iloc[sorted(positions)]
+    if fontes:
+        df_clips = df_clips[df_clips['fonte'].isin(fontes)]
+    return df_clips, topicos
 
 
 def fetch_real_news(query: str = "agronegócio brasil", lang: str = "pt") -> pd.DataFrame:
-    """Busca notícias reais usando GoogleNews"""
-    try:
+    """Busca notícias reais usando GoogleNews (cache compartilhado entre sessões)"""
+    def fetch():
         gn = GoogleNews(lang=lang, region='BR', period='7d')
         gn.search(query)
-        results = gn.results()
+        return tuple(gn.results())
+    
+    try:
+        results = UPSTREAM_CACHE.get_or_fetch(('googlenews', query, lang, '7d'), fetch)
         
         if results:
-            df = pd.DataFrame(results)
+            df = pd.DataFrame(list(results))
             df = df.rename(columns={
                 'title': 'titulo',
                 'media': 'veiculo', 
@@ -150,11 +228,8 @@ def fetch_real_news(query: str = "agronegócio brasil", lang: str = "pt") -> pd.
     return pd.DataFrame()
 
 
-def create_sentiment_chart(df: pd.DataFrame) -> alt.Chart:
-    """Cria gráfico de sentimento minimalista"""
-    sentiment_counts = df['sentimento'].value_counts().reset_index()
-    sentiment_counts.columns = ['sentimento', 'contagem']
-    
+def create_sentiment_chart(sentiment_counts: pd.DataFrame) -> alt.Chart:
+    """Cria gráfico de sentimento minimalista (contagens já agregadas pelo cubo)"""
     colors = {'Positivo': '#00FF88', 'Neutro': '#FAFAFA', 'Negativo': '#FF4444'}
     
     chart = alt.Chart(sentiment_counts).mark_arc(innerRadius=50).encode(
@@ -179,12 +254,8 @@ def create_sentiment_chart(df: pd.DataFrame) -> alt.Chart:
     return chart
 
 
-def create_timeline_chart(df: pd.DataFrame) -> alt.Chart:
-    """Cria gráfico de timeline de menções"""
-    df_timeline = df.copy()
-    df_timeline['data'] = pd.to_datetime(df_timeline['data_hora']).dt.date
-    timeline = df_timeline.groupby(['data', 'fonte']).size().reset_index(name='mencoes')
-    
+def create_timeline_chart(timeline: pd.DataFrame) -> alt.Chart:
+    """Cria gráfico de timeline de menções (dia × fonte, agregado pelo cubo)"""
     chart = alt.Chart(timeline).mark_area(opacity=0.7).encode(
         x=alt.X('data:T', title='Data'),
         y=alt.Y('mencoes:Q', title='Menções', stack='zero'),
@@ -248,16 +319,14 @@ def main():
         if usar_dados_reais:
             query_news = st.text_input("Termo de busca", value="agronegócio brasil")
     
-    # Inicializa dados
-    fake = init_faker()
-    df_clips = generate_mock_clips(fake, n=100)
+    # Dados ingeridos uma vez por processo; KPIs e gráficos vêm do cubo
+    store = get_clip_store()
+    fake = store['fake']
     
-    # Aplica filtros
-    if fontes:
-        df_clips = df_clips[df_clips['fonte'].isin(fontes)]
+    # Aplica filtros (mesmo recorte na lista e nos KPIs)
+    df_clips, topicos = filter_clips(store, topico_busca, fontes)
     
-    if topico_busca:
-        df_clips = df_clips[df_clips['topico'].str.contains(topico_busca, case=False, na=False)]
+    summary = summarize_clips(store['cube'], fontes=fontes or None, topicos=topicos)
     
     # Métricas principais
     col1, col2, col3, col4 = st.columns(4)
@@ -265,12 +334,12 @@ def main():
     with col1:
         st.metric(
             label="📊 Total de Clippings",
-            value=len(df_clips),
+            value=summary['total'],
             delta=f"+{fake.random_int(5, 20)} hoje"
         )
     
     with col2:
-        alcance_total = df_clips['alcance'].sum()
+        alcance_total = summary['alcance']
         st.metric(
             label="👥 Alcance Total",
             value=f"{alcance_total:,.0f}",
@@ -278,17 +347,17 @@ def main():
         )
     
     with col3:
-        positivos = len(df_clips[df_clips['sentimento'] == 'Positivo'])
+        positivos = summary['positivos']
         st.metric(
             label="✅ Menções Positivas",
             value=positivos,
-            delta=f"{(positivos/len(df_clips)*100):.1f}%"
+            delta=f"{(positivos/max(summary['total'], 1)*100):.1f}%"
         )
     
     with col4:
         st.metric(
             label="📡 Veículos Monitorados",
-            value=df_clips['veiculo'].nunique(),
+            value=summary['veiculos'],
             delta=None
         )
     
@@ -298,10 +367,10 @@ def main():
     col_chart1, col_chart2 = st.columns([1, 2])
     
     with col_chart1:
-        st.altair_chart(create_sentiment_chart(df_clips), use_container_width=True)
+        st.altair_chart(create_sentiment_chart(summary['sentimento']), use_container_width=True)
     
     with col_chart2:
-        st.altair_chart(create_timeline_chart(df_clips), use_container_width=True)
+        st.altair_chart(create_timeline_chart(summary['timeline']), use_container_width=True)
     
     st.markdown("---")
     
@@ -8,18 +8,41 @@ import streamlit as st
 import pandas as pd
 import altair as alt
 from datetime import datetime, timedelta
+import hmac
 import re
 import sys
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Adiciona o diretório src ao path para imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from media_engine import (
-    get_web_news,
-    simulate_radio_listening,
-    simulate_social_buzz,
-    get_sentiment_summary
+    FETCH_DEADLINE_SECONDS,
+    find_similar,
+    get_data_version,
+    get_recent_alerts,
+    get_trending_terms,
+    get_radio_listening,
+    get_sentiment_summary,
+    load_dashboard_sources,
+)
+from snapshot import load_snapshot, save_snapshot
+from tagging import TagIndex, build_tag_index
+from clustering import collapse_clusters
+from schema import PLATFORM_DTYPE, SOCIAL_PLATFORMS
+from data_service import DataService, views
+from html_templates import (
+    KPI_CARD,
+    RADIO_CARD,
+    THEMES,
+    TICKER,
+    news_link,
+    news_table,
+    render,
+    theme_stylesheet,
 )
 
 # ============================================
@@ -61,6 +84,20 @@ TRANSLATIONS = {
         'mentions': 'Menções',
         'language': 'Idioma',
         'theme': 'Tema Visual',
+        'late_sources': '⏳ Algumas fontes demoraram a responder; exibindo dados parciais (completando em segundo plano)',
+        'snapshot_notice': '⚡ Exibindo o último snapshot salvo — atualizando dados em segundo plano…',
+        'alerts': 'alertas (24h)',
+        'alerts_log': 'Log de Alertas da Watchlist',
+        'alerts_empty': 'Nenhum alerta registrado.',
+        'source': 'Fonte',
+        'terms': 'Termos',
+        'text': 'Texto',
+        'collapse_clusters': 'Agrupar a mesma pauta em vários veículos',
+        'trending': 'Termos em Alta',
+        'trending_empty': 'Ainda não há termos suficientes na janela atual.',
+        'related': 'Cobertura Relacionada',
+        'related_pick': 'Escolha uma manchete',
+        'related_empty': 'Nenhuma cobertura relacionada encontrada.',
     },
     'es-uy': {
         'title': '📡 AgroPulse Media Watch',
@@ -86,51 +123,20 @@ TRANSLATIONS = {
         'mentions': 'Menciones',
         'language': 'Idioma',
         'theme': 'Tema Visual',
-    }
-}
-
-# ============================================
-# TEMAS VISUAIS
-# ============================================
-THEMES = {
-    'dark': {
-        'name': '🌙 Dark',
-        'bg_primary': '#0E1117',
-        'bg_secondary': '#1A1F2E',
-        'bg_card': '#151922',
-        'accent': '#00FF88',
-        'text_primary': '#FAFAFA',
-        'text_secondary': '#A0AEC0',
-        'text_muted': '#718096',
-        'border': '#2D3748',
-        'negative': '#FF4444',
-        'chart_bg': '#0E1117',
-    },
-    'grey': {
-        'name': '🌫️ Grey',
-        'bg_primary': '#2D3748',
-        'bg_secondary': '#4A5568',
-        'bg_card': '#3D4A5C',
-        'accent': '#48BB78',
-        'text_primary': '#F7FAFC',
-        'text_secondary': '#CBD5E0',
-        'text_muted': '#A0AEC0',
-        'border': '#5A6A7A',
-        'negative': '#FC8181',
-        'chart_bg': '#2D3748',
-    },
-    'white': {
-        'name': '☀️ White',
-        'bg_primary': '#FFFFFF',
-        'bg_secondary': '#F7FAFC',
-        'bg_card': '#EDF2F7',
-        'accent': '#38A169',
-        'text_primary': '#1A202C',
-        'text_secondary': '#4A5568',
-        'text_muted': '#718096',
-        'border': '#E2E8F0',
-        'negative': '#E53E3E',
-        'chart_bg': '#FFFFFF',
+        'late_sources': '⏳ Algunas fuentes tardaron en responder; mostrando datos parciales (completando en segundo plano)',
+        'snapshot_notice': '⚡ Mostrando el último snapshot guardado — actualizando datos en segundo plano…',
+        'alerts': 'alertas (24h)',
+        'alerts_log': 'Registro de Alertas de la Watchlist',
+        'alerts_empty': 'No hay alertas registradas.',
+        'source': 'Fuente',
+        'terms': 'Términos',
+        'text': 'Texto',
+        'collapse_clusters': 'Agrupar la misma noticia en varios medios',
+        'trending': 'Términos en Alza',
+        'trending_empty': 'Todavía no hay términos suficientes en la ventana actual.',
+        'related': 'Cobertura Relacionada',
+        'related_pick': 'Elija un titular',
+        'related_empty': 'No se encontró cobertura relacionada.',
     }
 }
 
@@ -164,263 +170,203 @@ t = TRANSLATIONS[st.session_state.language]
 theme = THEMES[st.session_state.theme]
 
 # ============================================
-# CSS CUSTOMIZADO - DINÂMICO POR TEMA
+# CSS CUSTOMIZADO - PRÉ-MONTADO E MINIFICADO POR TEMA
 # ============================================
-st.markdown(f"""
-<style>
-    /* Remove padding superior e configura fundo */
-    .stApp {{
-        background-color: {theme['bg_primary']};
-    }}
-    
-    .block-container {{
-        padding-top: 3.5rem !important;
-        padding-bottom: 1rem !important;
-    }}
-    
-    /* Esconde sidebar completamente */
-    [data-testid="stSidebar"] {{
-        display: none !important;
-    }}
-    
-    [data-testid="stSidebarCollapsedControl"] {{
-        display: none !important;
-    }}
-    
-    button[kind="header"] {{
-        display: none !important;
-    }}
-    
-    /* Header do Streamlit - ajusta altura para não sobrepor */
-    header[data-testid="stHeader"] {{
-        background-color: {theme['bg_primary']};
-        height: 3rem;
-    }}
-    
-    /* Ticker de rolagem */
-    .ticker-wrapper {{
-        background: linear-gradient(90deg, {theme['bg_secondary']} 0%, {theme['bg_primary']} 50%, {theme['bg_secondary']} 100%);
-        border-bottom: 2px solid {theme['accent']};
-        padding: 10px 0;
-        margin-bottom: 20px;
-        margin-top: 10px;
-        overflow: hidden;
-    }}
-    
-    .ticker-content {{
-        color: {theme['accent']};
-        font-size: 1.1rem;
-        font-weight: 600;
-        white-space: nowrap;
-        animation: scroll-left 20s linear infinite;
-    }}
-    
-    @keyframes scroll-left {{
-        0% {{ transform: translateX(100%); }}
-        100% {{ transform: translateX(-100%); }}
-    }}
-    
-    /* Cards de KPI */
-    .kpi-card {{
-        background: linear-gradient(135deg, {theme['bg_secondary']} 0%, {theme['bg_card']} 100%);
-        border: 1px solid {theme['border']};
-        border-radius: 12px;
-        padding: 20px;
-        text-align: center;
-        transition: border-color 0.3s;
-    }}
-    
-    .kpi-card:hover {{
-        border-color: {theme['accent']};
-    }}
-    
-    .kpi-value {{
-        color: {theme['accent']};
-        font-size: 2.5rem;
-        font-weight: 700;
-        margin: 0;
-    }}
-    
-    .kpi-label {{
-        color: {theme['text_secondary']};
-        font-size: 0.9rem;
-        margin-top: 5px;
-    }}
-    
-    /* Timeline de Rádio */
-    .radio-card {{
-        background: {theme['bg_secondary']};
-        border-left: 4px solid {theme['accent']};
-        border-radius: 0 8px 8px 0;
-        padding: 12px 15px;
-        margin-bottom: 10px;
-        transition: transform 0.2s;
-    }}
-    
-    .radio-card:hover {{
-        transform: translateX(5px);
-    }}
-    
-    .radio-card.negativo, .radio-card.negative {{
-        border-left-color: {theme['negative']};
-        background: linear-gradient(90deg, rgba(255,68,68,0.15) 0%, {theme['bg_secondary']} 30%);
-    }}
-    
-    .radio-card.positivo, .radio-card.positive {{
-        border-left-color: {theme['accent']};
-    }}
-    
-    .radio-card.neutro, .radio-card.neutral {{
-        border-left-color: {theme['text_secondary']};
-    }}
-    
-    .radio-header {{
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        margin-bottom: 8px;
-    }}
-    
-    .radio-station {{
-        color: {theme['accent']};
-        font-weight: 600;
-        font-size: 0.95rem;
-    }}
-    
-    .radio-time {{
-        color: {theme['text_muted']};
-        font-size: 0.8rem;
-    }}
-    
-    .radio-text {{
-        color: {theme['text_primary']};
-        font-size: 0.9rem;
-        line-height: 1.4;
-        font-style: italic;
-    }}
-    
-    /* Seções */
-    .section-title {{
-        color: {theme['text_primary']};
-        font-size: 1.2rem;
-        font-weight: 600;
-        border-bottom: 2px solid {theme['accent']};
-        padding-bottom: 8px;
-        margin-bottom: 15px;
-    }}
-    
-    /* Tabela de notícias */
-    .news-table {{
-        background: {theme['bg_secondary']};
-        border-radius: 8px;
-        padding: 10px;
-        width: 100%;
-        border-collapse: collapse;
-    }}
-    
-    .news-table th {{
-        background: {theme['bg_card']};
-        color: {theme['text_primary']};
-        padding: 12px;
-        text-align: left;
-        border-bottom: 2px solid {theme['accent']};
-    }}
-    
-    .news-table td {{
-        padding: 10px 12px;
-        border-bottom: 1px solid {theme['border']};
-        color: {theme['text_primary']};
-    }}
-    
-    .news-table tr:hover {{
-        background: {theme['bg_card']};
-    }}
-    
-    /* Links clicáveis */
-    a {{
-        color: {theme['accent']} !important;
-        text-decoration: none !important;
-    }}
-    
-    a:hover {{
-        text-decoration: underline !important;
-    }}
-    
-    /* Footer */
-    .footer-container {{
-        text-align: center;
-        color: {theme['text_muted']};
-        font-size: 0.85rem;
-        border-top: 1px solid {theme['border']};
-        padding-top: 20px;
-        margin-top: 30px;
-    }}
-    
-    .footer-title {{
-        color: {theme['accent']};
-        font-weight: 700;
-        font-size: 1rem;
-        margin-bottom: 5px;
-    }}
-    
-    .footer-contact {{
-        margin: 15px 0;
-    }}
-    
-    .footer-contact a {{
-        margin: 0 10px;
-        color: {theme['accent']} !important;
-    }}
-    
-    .footer-copyright {{
-        margin-top: 15px;
-        padding-top: 15px;
-        border-top: 1px solid {theme['border']};
-        color: {theme['text_muted']};
-    }}
-</style>
-""", unsafe_allow_html=True)
+st.markdown(theme_stylesheet(st.session_state.theme), unsafe_allow_html=True)
 
 # ============================================
 # CARREGA DADOS
 # ============================================
-@st.cache_data(ttl=600)  # Cache de 10 minutos para respeitar janela de 10 dias
-def load_data(lang='pt-br'):
+@st.cache_resource
+def get_data_service():
+    """
+    Dados compartilhados por todas as sessões do processo: cada carga é
+    publicada uma vez e as sessões recebem visões sem cópia (em vez da cópia
+    desserializada do st.cache_data a cada rerun).
+    """
+    return DataService(max_entries=8, ttl=600)  # 10 minutos para respeitar janela de 10 dias
+
+
+def load_data(lang='pt-br', data_version=0):
+    """
+    Dados do dashboard no idioma selecionado, do serviço compartilhado.
+    `data_version` entra na chave: quando outra réplica (ou esta) grava
+    notícias novas, a carga é refeita antes do TTL.
+    """
+    return get_data_service().get(
+        ('dashboard', lang, data_version), lambda: _load_sources(lang, data_version)
+    )
+
+
+def _load_sources(lang, data_version):
     """Carrega todos os dados das fontes baseado no idioma selecionado."""
-    web_news_pt = get_web_news('pt-br')
-    web_news_es = get_web_news('es-uy')
-    web_news = pd.concat([web_news_pt, web_news_es], ignore_index=True)
+    # Os dois idiomas compartilham o mesmo prazo: fontes lentas não atrasam a página
+    web_news, radio_data, social_buzz, sentiment = load_dashboard_sources(
+        lang, deadline=FETCH_DEADLINE_SECONDS
+    )
+    # Índice tag → posições construído uma vez por versão de dados
+    if 'Tags' in web_news.columns:
+        web_news.attrs['tag_index'] = build_tag_index(web_news).to_dict()
+    # Identidade desta carga: chave do cache de HTML das abas de notícias
+    web_news.attrs['data_key'] = f"{data_version}:{datetime.now().isoformat()}"
     if not web_news.empty:
-        dedupe_cols = [col for col in ['Título', 'Veículo', 'Link'] if col in web_news.columns]
-        if dedupe_cols:
-            web_news = web_news.drop_duplicates(subset=dedupe_cols)
-    radio_data = simulate_radio_listening(lang)
-    social_buzz = simulate_social_buzz()
-    sentiment = get_sentiment_summary(radio_data)
+        # Snapshot para primeira renderização instantânea após deploy/despertar,
+        # gravado fora do caminho da página (um gravador por processo). Cópias
+        # rasas: o serviço de dados converte as colunas do original ao publicar
+        frames = (df.copy(deep=False) for df in (web_news, radio_data, social_buzz))
+        get_snapshot_writer().submit(save_snapshot, lang, *frames, sentiment)
     return web_news, radio_data, social_buzz, sentiment
 
+
+@st.cache_resource
+def get_snapshot_writer():
+    """Grava snapshots em segundo plano, um de cada vez (arquivos temporários por processo)."""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix='snapshot')
+
+
+@st.cache_resource
+def get_warm_start():
+    """
+    Estado de inicialização do processo: snapshots lidos do disco na primeira
+    execução e threads de atualização em segundo plano por idioma.
+    """
+    snapshots = {lang: load_snapshot(lang) for lang in TRANSLATIONS}
+    for snapshot in snapshots.values():
+        if snapshot is not None:
+            snapshot[0].attrs['data_key'] = f"snapshot:{snapshot[4].get('created_at', '')}"
+    return {
+        'snapshots': snapshots,
+        'refreshes': {},
+        'lock': threading.Lock(),
+    }
+
+
+def _refresh_data(lang):
+    """Aquece o cache de load_data em segundo plano."""
+    load_data(lang, get_data_version())
+    # A primeira carga pode gravar notícias novas e mudar a versão; aquece a nova chave
+    load_data(lang, get_data_version())
+
+
+def get_dashboard_data(lang):
+    """
+    Retorna (dados, refresh_pendente). Com o cache frio e um snapshot em disco,
+    devolve o snapshot imediatamente e dispara a atualização em segundo plano.
+    """
+    warm = get_warm_start()
+    snapshot = warm['snapshots'].get(lang)
+    if snapshot is None:
+        return load_data(lang, get_data_version()), None
+
+    with warm['lock']:
+        refresh = warm['refreshes'].get(lang)
+        if refresh is None:
+            refresh = threading.Thread(target=_refresh_data, args=(lang,), daemon=True)
+            warm['refreshes'][lang] = refresh
+            refresh.start()
+
+    if not refresh.is_alive():
+        # Dados atualizados prontos: o snapshot deste idioma já cumpriu seu papel
+        warm['snapshots'][lang] = None
+        return load_data(lang, get_data_version()), None
+    return views(snapshot[:4]), refresh
+
+
+# ============================================
+# AQUECIMENTO (?warmup=1&token=..., usado pelo keep-alive)
+# ============================================
+WARMUP_PARAM = 'warmup'
+WARMUP_TOKEN_PARAM = 'token'
+# Segredo compartilhado com o keep-alive (variável de ambiente ou st.secrets)
+WARMUP_TOKEN_ENV = 'AGROPULSE_WARMUP_TOKEN'
+WARMUP_DONE = 'AgroPulse warm-up ok'
+
+
+def _warmup_token():
+    token = os.environ.get(WARMUP_TOKEN_ENV, '')
+    if not token:
+        try:
+            token = str(st.secrets.get(WARMUP_TOKEN_ENV, ''))
+        except FileNotFoundError:  # sem secrets.toml
+            token = ''
+    return token
+
+
+def warmup_requested():
+    """
+    Só `?warmup=1` com o token configurado aquece o processo: sem token no
+    servidor, ou com token errado, a URL abre o dashboard normalmente.
+    """
+    if st.query_params.get(WARMUP_PARAM) != '1':
+        return False
+    token = _warmup_token()
+    return bool(token) and hmac.compare_digest(st.query_params.get(WARMUP_TOKEN_PARAM, ''), token)
+
+
+def warm_dashboard():
+    """
+    Carrega os dois idiomas no serviço compartilhado deste processo (o mesmo
+    caminho das sessões) e grava os snapshots. Retorna o relatório por idioma.
+    """
+    report = {}
+    for lang in TRANSLATIONS:
+        started = time.perf_counter()
+        _refresh_data(lang)
+        web_news, radio_data, social_buzz, _ = load_data(lang, get_data_version())
+        report[lang] = {
+            'seconds': round(time.perf_counter() - started, 3),
+            'news_rows': len(web_news),
+            'radio_rows': len(radio_data),
+            'social_rows': len(social_buzz),
+        }
+    return report
+
+
+if warmup_requested():
+    warmup_report = warm_dashboard()
+    st.success(WARMUP_DONE)
+    st.json({'data_version': get_data_version(), 'langs': warmup_report})
+    st.stop()
+
 # Carrega dados com o idioma selecionado
 current_lang = st.session_state.language
-web_news_df, radio_df, social_df, sentiment_summary = load_data(current_lang)
+# O rádio da página (ticker, KPIs e feed) vem de load_radio_feed, não desta carga
+(web_news_df, _, social_df, _), pending_refresh = get_dashboard_data(current_lang)
+
+# ============================================
+# RÁDIO AO VIVO: UMA FONTE PARA TICKER, KPIs E FEED
+# ============================================
+RADIO_REFRESH_SECONDS = 30
+
+
+def load_radio_feed(lang='pt-br'):
+    """
+    Leitura ao vivo do monitoramento de rádio (renovada a cada
+    RADIO_REFRESH_SECONDS). Ticker, KPIs de rádio e feed leem esta mesma
+    entrada, em fragmentos com o mesmo intervalo.
+    """
+    return get_data_service().get(
+        ('radio', lang), lambda: get_radio_listening(lang), ttl=RADIO_REFRESH_SECONDS
+    )
+
 
 # ============================================
 # TICKER SUPERIOR - ÚLTIMA MENÇÃO EM RÁDIO
 # ============================================
-if not radio_df.empty:
-    latest_mention = radio_df.iloc[0]
-    ticker_text = f"🎙️ {t['last_mention']}: [{latest_mention['Emissora']}] {latest_mention['Transcrição']} — {latest_mention['Timestamp']}"
-else:
-    ticker_text = f"🎙️ AGROPULSE MEDIA WATCH — {t['coverage']}"
+@st.fragment(run_every=RADIO_REFRESH_SECONDS)
+def render_ticker(lang):
+    """Última menção em rádio, renovada junto com o feed."""
+    radio_df = load_radio_feed(lang)
+    if not radio_df.empty:
+        latest_mention = radio_df.iloc[0]
+        ticker_text = f"🎙️ {t['last_mention']}: [{latest_mention['Emissora']}] {latest_mention['Transcrição']} — {latest_mention['Timestamp']:%H:%M:%S}"
+    else:
+        ticker_text = f"🎙️ AGROPULSE MEDIA WATCH — {t['coverage']}"
 
-st.markdown(f"""
-<div class="ticker-wrapper">
-    <div class="ticker-content">
-        {ticker_text} &nbsp;&nbsp;&nbsp;•&nbsp;&nbsp;&nbsp; 
-        📊 {t['coverage']} &nbsp;&nbsp;&nbsp;•&nbsp;&nbsp;&nbsp;
-        {ticker_text}
-    </div>
-</div>
-""", unsafe_allow_html=True)
+    st.markdown(render(TICKER, ticker=ticker_text, coverage=t['coverage']), unsafe_allow_html=True)
+
+
+render_ticker(current_lang)
 
 # ============================================
 # BARRA DE CONTROLES NO TOPO (UX: Toggle Switches)
@@ -430,64 +376,28 @@ lang_label = "🇧🇷 PT" if st.session_state.language == 'pt-br' else "🇺
 theme_icon = {'dark': '🌙', 'grey': '🌫️', 'white': '☀️'}[st.session_state.theme]
 theme_label = theme_icon
 
-# Container com CSS para alinhar à direita
-st.markdown(f"""
-<style>
-    .top-controls {{
-        display: flex;
-        justify-content: flex-end;
-        align-items: center;
-        gap: 8px;
-        padding: 0 0 15px 0;
-        margin-top: -10px;
-    }}
-    .control-btn {{
-        background: {theme['bg_secondary']};
-        border: 1px solid {theme['border']};
-        border-radius: 20px;
-        padding: 6px 14px;
-        color: {theme['text_primary']};
-        font-size: 0.85rem;
-        font-weight: 500;
-        cursor: pointer;
-        transition: all 0.2s ease;
-        display: inline-flex;
-        align-items: center;
-        gap: 6px;
-    }}
-    .control-btn:hover {{
-        background: {theme['accent']};
-        color: {theme['bg_primary']};
-        transform: scale(1.05);
-    }}
-    /* Esconde labels dos botões Streamlit */
-    .stButton > button {{
-        background: {theme['bg_secondary']} !important;
-        border: 1px solid {theme['border']} !important;
-        border-radius: 20px !important;
-        color: {theme['text_primary']} !important;
-        font-weight: 500 !important;
-        padding: 0.4rem 1rem !important;
-        transition: all 0.2s ease !important;
-    }}
-    .stButton > button:hover {{
-        background: {theme['accent']} !important;
-        color: {theme['bg_primary']} !important;
-        border-color: {theme['accent']} !important;
-    }}
-    .stButton > button:focus {{
-        box-shadow: none !important;
-    }}
-    div[data-testid="stHorizontalBlock"] > div:last-child {{
-        display: flex;
-        justify-content: flex-end;
-    }}
-</style>
-""", unsafe_allow_html=True)
+
+@st.cache_data(ttl=60)
+def load_alerts(data_version=0, limit=50):
+    """Alertas recentes da watchlist (gravados na ingestão de notícias e rádio)."""
+    alerts = get_recent_alerts(limit * 10)
+    cutoff = (datetime.now() - timedelta(hours=24)).isoformat()
+    recent_count = sum(1 for alert in alerts if alert.get('at', '') >= cutoff)
+    return alerts[:limit], recent_count
+
+
+recent_alerts, recent_alert_count = load_alerts(get_data_version())
 
 # Botões de controle alinhados à direita
 col_spacer, col_lang, col_theme = st.columns([8, 1, 1])
 
+with col_spacer:
+    if recent_alert_count:
+        st.markdown(
+            f'<span class="alert-badge">🔔 {recent_alert_count} {t["alerts"]}</span>',
+            unsafe_allow_html=True
+        )
+
 with col_lang:
     if st.button(lang_label, key="lang_toggle", help="Alternar idioma / Cambiar idioma", use_container_width=True):
         toggle_language()
@@ -510,72 +420,96 @@ st.markdown(f"""
 </p>
 """, unsafe_allow_html=True)
 
+if pending_refresh is not None:
+    st.caption(t['snapshot_notice'])
+elif web_news_df.attrs.get('timed_out_sources'):
+    st.caption(t['late_sources'])
+
+with st.expander(f"🔔 {t['alerts_log']} ({recent_alert_count})"):
+    if recent_alerts:
+        alerts_df = pd.DataFrame([
+            {
+                t['hour']: str(alert.get('at', ''))[11:16],
+                t['source']: ('🎙️ ' if alert.get('kind') == 'radio' else '🌐 ') + str(alert.get('source', '')),
+                t['terms']: ', '.join(alert.get('terms', [])),
+                t['text']: alert.get('text', ''),
+            }
+            for alert in recent_alerts
+        ])
+        st.dataframe(alerts_df, hide_index=True, use_container_width=True)
+    else:
+        st.info(t['alerts_empty'])
+
+# Termos em alta: contagem na janela atual e crescimento sobre a linha de base
+trending_terms = get_trending_terms(k=12)
+st.markdown(f'<p class="section-title">📈 {t["trending"]}</p>', unsafe_allow_html=True)
+if trending_terms:
+    st.markdown(''.join(
+        f'<span class="trend-chip">{row["term"]} <b>↑{row["growth"]}×</b> ({row["count"]})</span>'
+        for row in trending_terms
+    ), unsafe_allow_html=True)
+else:
+    st.caption(t['trending_empty'])
+
 st.markdown("<br>", unsafe_allow_html=True)
 
 # ============================================
 # KPIs - MÉTRICAS PRINCIPAIS
 # ============================================
-kpi_cols = st.columns(3)
+@st.fragment(run_every=RADIO_REFRESH_SECONDS)
+def render_kpis(lang, web_news_count):
+    """KPIs: notícias desta carga; citações e sentimento do rádio ao vivo (mesma leitura do feed)."""
+    radio_df = load_radio_feed(lang)
+    sentiment_summary = get_sentiment_summary(radio_df)
+    kpi_cols = st.columns(3)
+
+    with kpi_cols[0]:
+        st.markdown(render(KPI_CARD, value=f"🌐 {web_news_count}", label=t['web_news']), unsafe_allow_html=True)
+
+    with kpi_cols[1]:
+        st.markdown(render(KPI_CARD, value=f"📻 {len(radio_df)}", label=t['radio_citations']), unsafe_allow_html=True)
+
+    with kpi_cols[2]:
+        # Calcula sentimento global
+        total = sum(sentiment_summary.values())
+        if total > 0:
+            positivo_pct = (sentiment_summary['Positivo'] / total) * 100
+            if positivo_pct >= 60:
+                sentiment_icon = "🟢"
+                sentiment_text = f"{positivo_pct:.0f}% {t['positive']}"
+            elif positivo_pct >= 40:
+                sentiment_icon = "⚪"
+                sentiment_text = t['neutral']
+            else:
+                sentiment_icon = "🔴"
+                sentiment_text = t['attention']
+        else:
+            sentiment_icon = "⚪"
+            sentiment_text = "N/A"
+        
+        st.markdown(render(
+            KPI_CARD, value=sentiment_icon, label=f"{t['global_sentiment']}: {sentiment_text}"
+        ), unsafe_allow_html=True)
 
-with kpi_cols[0]:
-    st.markdown(f"""
-    <div class="kpi-card">
-        <p class="kpi-value">🌐 {len(web_news_df)}</p>
-        <p class="kpi-label">{t['web_news']}</p>
-    </div>
-    """, unsafe_allow_html=True)
 
-with kpi_cols[1]:
-    st.markdown(f"""
-    <div class="kpi-card">
-        <p class="kpi-value">📻 {len(radio_df)}</p>
-        <p class="kpi-label">{t['radio_citations']}</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-with kpi_cols[2]:
-    # Calcula sentimento global
-    total = sum(sentiment_summary.values())
-    if total > 0:
-        positivo_pct = (sentiment_summary['Positivo'] / total) * 100
-        if positivo_pct >= 60:
-            sentiment_icon = "🟢"
-            sentiment_text = f"{positivo_pct:.0f}% {t['positive']}"
-        elif positivo_pct >= 40:
-            sentiment_icon = "⚪"
-            sentiment_text = t['neutral']
-        else:
-            sentiment_icon = "🔴"
-            sentiment_text = t['attention']
-    else:
-        sentiment_icon = "⚪"
-        sentiment_text = "N/A"
-    
-    st.markdown(f"""
-    <div class="kpi-card">
-        <p class="kpi-value">{sentiment_icon}</p>
-        <p class="kpi-label">{t['global_sentiment']}: {sentiment_text}</p>
-    </div>
-    """, unsafe_allow_html=True)
+render_kpis(current_lang, len(web_news_df))
 
 st.markdown("<br>", unsafe_allow_html=True)
 
 # ============================================
-# DIVISÃO PRINCIPAL (30% / 70%)
+# REGIÕES COM RE-EXECUÇÃO PARCIAL (st.fragment)
 # ============================================
-col_radio, col_web = st.columns([0.30, 0.70])
-
-# --------------------------------------------
-# COLUNA ESQUERDA - RÁDIO ESCUTA (30%)
-# --------------------------------------------
-with col_radio:
-    st.markdown(f'<p class="section-title">{t["radio_feed"]}</p>', unsafe_allow_html=True)
-    
+@st.fragment(run_every=RADIO_REFRESH_SECONDS)
+def render_radio_feed(lang):
+    """
+    Feed de rádio como fragmento: re-executa sozinho a cada
+    RADIO_REFRESH_SECONDS sem reprocessar o restante do dashboard.
+    """
     # Container com scroll para o feed
     radio_container = st.container(height=500)
     
     with radio_container:
-        for _, row in radio_df.iterrows():
+        for _, row in load_radio_feed(lang).iterrows():
             # Define classe CSS baseada no sentimento
             sentiment_class = row['Sentimento'].lower()
             
@@ -587,15 +521,221 @@ with col_radio:
             else:
                 sent_icon = "⚪"
             
-            st.markdown(f"""
-            <div class="radio-card {sentiment_class}">
-                <div class="radio-header">
-                    <span class="radio-station">🎙️ {row['Emissora']}</span>
-                    <span class="radio-time">{row['Timestamp']} {sent_icon}</span>
-                </div>
-                <p class="radio-text">"{row['Transcrição']}"</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(render(
+                RADIO_CARD,
+                sentiment_class=sentiment_class,
+                station=row['Emissora'],
+                time=f"{row['Timestamp']:%H:%M:%S}",
+                icon=sent_icon,
+                text=row['Transcrição'],
+            ), unsafe_allow_html=True)
+
+
+def parse_news_time(value):
+    """Converte strings de tempo (PT/ES) para datetime para ordenação."""
+    if not value or not isinstance(value, str):
+        return None
+
+    text = value.strip()
+    now = datetime.now()
+    lower = text.lower()
+
+    # Formato HH:MM
+    if re.match(r'^\d{1,2}:\d{2}$', text):
+        try:
+            parsed_time = datetime.strptime(text, '%H:%M').time()
+            return datetime.combine(now.date(), parsed_time)
+        except ValueError:
+            return None
+
+    # Formato ISO yyyy-mm-dd HH:MM
+    try:
+        return datetime.strptime(text, '%Y-%m-%d %H:%M')
+    except ValueError:
+        pass
+
+    # Relativo PT/ES: "Há 2 h", "Hace 10 min"
+    match = re.search(r'(há|ha|hace)\s*(\d+)\s*(min|minutos|m|hora|horas|h|dia|dias|día|días|d)\b', lower)
+    if match:
+        amount = int(match.group(2))
+        unit = match.group(3)
+        if unit in ['min', 'minutos', 'm']:
+            return now - timedelta(minutes=amount)
+        if unit in ['hora', 'horas', 'h']:
+            return now - timedelta(hours=amount)
+        if unit in ['dia', 'dias', 'día', 'días', 'd']:
+            return now - timedelta(days=amount)
+
+    return None
+
+
+def prepare_news_df(df, collapse=False):
+    """Adiciona coluna de ordenação baseada em tempo (mais recente primeiro)."""
+    if df.empty:
+        return df
+    # Copy-on-Write: assign/sort criam quadros novos sem copiar as demais colunas
+    parsed = df['Hora'].apply(parse_news_time).fillna(datetime.now())
+    df = df.assign(_parsed_ts=parsed).sort_values('_parsed_ts', ascending=False)
+    if collapse and 'Cluster' in df.columns:
+        df = collapse_clusters(df)
+        extra = df['Veículos'].fillna(1).astype(int) - 1
+        df['Veículo'] = [
+            f"{v} (+{n})" if n > 0 else v for v, n in zip(df['Veículo'], extra)
+        ]
+    return df
+
+
+def _tag_positions(web_news_df, tag):
+    """
+    Posições das notícias com a tag (índice de load_data ou construído na hora).
+    Quadros sem 'Tags' (ex.: snapshot antigo) caem na 'Categoria'.
+    """
+    if 'tag_index' in web_news_df.attrs:
+        tag_index = TagIndex(web_news_df.attrs['tag_index'])
+    elif 'Tags' in web_news_df.columns:
+        tag_index = build_tag_index(web_news_df)
+    elif 'Categoria' in web_news_df.columns:
+        return [i for i, categoria in enumerate(web_news_df['Categoria']) if categoria == tag]
+    else:
+        return []
+    return tag_index.lookup(tag)
+
+
+def _agro_rows(web_news_df):
+    return web_news_df.iloc[_tag_positions(web_news_df, 'Agro en Punta')]
+
+
+def _other_rows(web_news_df):
+    agro_set = set(_tag_positions(web_news_df, 'Agro en Punta'))
+    return web_news_df.iloc[[i for i in range(len(web_news_df)) if i not in agro_set]]
+
+
+# Abas da seção de notícias: rótulo por idioma, seleção de linhas, janela de
+# exibição e mensagens de vazio. Novas abas entram aqui.
+NEWS_TABS = {
+    'agro': {
+        'label': {'pt-br': '🎯 Agro en Punta', 'es-uy': '🎯 Agro en Punta'},
+        'rows': _agro_rows,
+        'max_age_days': 90,  # 3 meses
+        'empty_window': {
+            'pt-br': 'Nenhuma notícia sobre Agro en Punta nos últimos 3 meses.',
+            'es-uy': 'No hay noticias sobre Agro en Punta en los últimos 3 meses.',
+        },
+        'empty': {
+            'pt-br': 'Nenhuma notícia sobre Agro en Punta no momento.',
+            'es-uy': 'No hay noticias sobre Agro en Punta en este momento.',
+        },
+    },
+    'outros': {
+        'label': {'pt-br': '📰 Outras Notícias', 'es-uy': '📰 Otras Noticias'},
+        'rows': _other_rows,
+        'max_age_days': 30,  # 1 mês
+        'empty_window': {
+            'pt-br': 'Nenhuma outra notícia no último mês.',
+            'es-uy': 'No hay otras noticias en el último mes.',
+        },
+        'empty': {
+            'pt-br': 'Nenhuma outra notícia no momento.',
+            'es-uy': 'No hay otras noticias en este momento.',
+        },
+    },
+}
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def render_news_tab(tab, lang, collapse, data_key, _web_news_df):
+    """
+    Conteúdo de uma aba: ('html', tabela) ou ('info', mensagem).
+    Só a aba ativa é calculada; o resultado fica em cache por
+    (aba, idioma, agrupamento, data_key) até os dados mudarem.
+    """
+    spec = NEWS_TABS[tab]
+    labels = TRANSLATIONS[lang]
+    if _web_news_df.empty:
+        return 'info', labels['no_news']
+    rows = spec['rows'](_web_news_df)
+    if rows.empty:
+        return 'info', spec['empty'][lang]
+    display_df = prepare_news_df(rows, collapse)
+    cutoff_date = datetime.now() - timedelta(days=spec['max_age_days'])
+    display_df = display_df[display_df['_parsed_ts'] >= cutoff_date]
+    if display_df.empty:
+        return 'info', spec['empty_window'][lang]
+    titles = [
+        news_link(title, link)
+        for title, link in zip(display_df['Título'], display_df.get('Link', [''] * len(display_df)))
+    ]
+    return 'html', news_table(
+        (labels['hour'], labels['vehicle'], labels['title_col']),
+        zip(display_df['Hora'], display_df['Veículo'], titles),
+    )
+
+
+def news_data_key(web_news_df):
+    """Identidade do conjunto de notícias exibido (versão de dados + carga)."""
+    return web_news_df.attrs.get('data_key') or f"rows:{len(web_news_df)}"
+
+
+@st.fragment
+def render_news_section(web_news_df):
+    """
+    Abas de notícias e cobertura relacionada como fragmento: trocar de aba,
+    o toggle de agrupamento e a escolha de manchete re-executam apenas esta
+    região, e apenas a aba ativa é calculada e serializada.
+    """
+    lang = st.session_state.language
+    # BAIXO: Tabela de Notícias COM ABAS
+    st.markdown(f'<p class="section-title">{t["web_news_title"]}</p>', unsafe_allow_html=True)
+    
+    # Uma linha por pauta (cluster de quase-duplicatas) com contagem de veículos
+    collapse = st.toggle(t['collapse_clusters'], value=True, key='collapse_clusters')
+    
+    # Abas preguiçosas: controle segmentado em vez de st.tabs (que renderiza todas)
+    active_tab = st.segmented_control(
+        t['web_news_title'],
+        list(NEWS_TABS),
+        format_func=lambda key: NEWS_TABS[key]['label'][lang],
+        default='agro',
+        key='news_tab',
+        label_visibility='collapsed',
+    ) or 'agro'
+    
+    kind, content = render_news_tab(active_tab, lang, collapse, news_data_key(web_news_df), web_news_df)
+    if kind == 'html':
+        st.markdown(content, unsafe_allow_html=True)
+    else:
+        st.info(content)
+
+    # Cobertura relacionada: vizinhos por cosseno TF-IDF (notícias e rádio)
+    if not web_news_df.empty and 'Link' in web_news_df.columns:
+        with st.expander(f"🔗 {t['related']}"):
+            headlines = dict(zip(web_news_df['Título'], web_news_df['Link']))
+            selected_title = st.selectbox(t['related_pick'], list(headlines), key='related_pick')
+            related = find_similar(headlines[selected_title], k=5) if selected_title else []
+            if related:
+                for item in related:
+                    icon = '🎙️' if item.get('kind') == 'radio' else '🌐'
+                    title = item.get('title', '')
+                    if item.get('link') and item['link'] != '#':
+                        title = f"[{title}]({item['link']})"
+                    st.markdown(f"{icon} {title} — *{item.get('source', '')}* `{item['score']:.2f}`")
+            else:
+                st.info(t['related_empty'])
+
+
+# ============================================
+# DIVISÃO PRINCIPAL (30% / 70%)
+# ============================================
+col_radio, col_web = st.columns([0.30, 0.70])
+
+# --------------------------------------------
+# COLUNA ESQUERDA - RÁDIO ESCUTA (30%)
+# --------------------------------------------
+with col_radio:
+    st.markdown(f'<p class="section-title">{t["radio_feed"]}</p>', unsafe_allow_html=True)
+    
+    # Feed ao vivo: fragmento com atualização própria (run_every)
+    render_radio_feed(current_lang)
 
 # --------------------------------------------
 # COLUNA DIREITA - WEB & ANÁLISE (70%)
@@ -605,9 +745,9 @@ with col_web:
     st.markdown(f'<p class="section-title">{t["mentions_volume"]}</p>', unsafe_allow_html=True)
     
     # Prepara dados para o gráfico - usando as novas redes sociais
-    redes_sociais = ['X', 'Instagram', 'Facebook', 'Threads', 'LinkedIn', 'TikTok']
-    chart_data = social_df[['Hora'] + redes_sociais].copy()
-    chart_data = chart_data.melt(id_vars=['Hora'], var_name='Plataforma', value_name='Menções')
+    redes_sociais = list(SOCIAL_PLATFORMS)
+    chart_data = social_df[['Hora'] + redes_sociais].melt(id_vars=['Hora'], var_name='Plataforma', value_name='Menções')
+    chart_data['Plataforma'] = chart_data['Plataforma'].astype(PLATFORM_DTYPE)
     
     # Cores para cada rede social
     social_colors = {
@@ -621,7 +761,7 @@ with col_web:
     chart = alt.Chart(chart_data).mark_bar(
         opacity=0.85
     ).encode(
-        x=alt.X('Hora:N', title=t['hour'], axis=alt.Axis(labelAngle=-45, labelColor=theme['text_secondary'], titleColor=theme['text_primary'])),
+        x=alt.X('Hora:N', title=t['hour'], sort=None, axis=alt.Axis(labelAngle=-45, labelColor=theme['text_secondary'], titleColor=theme['text_primary'])),
         y=alt.Y('sum(Menções):Q', title=t['mentions'], axis=alt.Axis(labelColor=theme['text_secondary'], titleColor=theme['text_primary'])),
         color=alt.Color('Plataforma:N', 
                        scale=alt.Scale(domain=redes_sociais, range=colors),
@@ -639,135 +779,9 @@ with col_web:
     
     st.markdown("<br>", unsafe_allow_html=True)
     
-    # BAIXO: Tabela de Notícias COM ABAS
-    st.markdown(f'<p class="section-title">{t["web_news_title"]}</p>', unsafe_allow_html=True)
-    
-    # Textos das abas por idioma
-    tab_agro_punta = "🎯 Agro en Punta" if st.session_state.language == 'pt-br' else "🎯 Agro en Punta"
-    tab_outros = "📰 Outras Notícias" if st.session_state.language == 'pt-br' else "📰 Otras Noticias"
-    
-    # Cria as abas
-    tab1, tab2 = st.tabs([tab_agro_punta, tab_outros])
-    
-    # Função para criar link clicável
-    def make_link(row):
-        link = row.get('Link', '')
-        title = row.get('Título', 'Sem título')
-        
-        # Verifica se é um link válido
-        if link and link != '#' and not link.startswith('https://exemplo.com'):
-            return f'<a href="{link}" target="_blank">{title}</a>'
-        else:
-            return title
-    
-    def parse_news_time(value):
-        """Converte strings de tempo (PT/ES) para datetime para ordenação."""
-        if not value or not isinstance(value, str):
-            return None
+    # BAIXO: Tabela de Notícias COM ABAS (fragmento)
+    render_news_section(web_news_df)
 
-        text = value.strip()
-        now = datetime.now()
-        lower = text.lower()
-
-        # Formato HH:MM
-        if re.match(r'^\d{1,2}:\d{2}$', text):
-            try:
-                parsed_time = datetime.strptime(text, '%H:%M').time()
-                return datetime.combine(now.date(), parsed_time)
-            except ValueError:
-                return None
-
-        # Formato ISO yyyy-mm-dd HH:MM
-        try:
-            return datetime.strptime(text, '%Y-%m-%d %H:%M')
-        except ValueError:
-            pass
-
-        # Relativo PT/ES: "Há 2 h", "Hace 10 min"
-        match = re.search(r'(há|ha|hace)\s*(\d+)\s*(min|minutos|m|hora|horas|h|dia|dias|día|días|d)\b', lower)
-        if match:
-            amount = int(match.group(2))
-            unit = match.group(3)
-            if unit in ['min', 'minutos', 'm']:
-                return now - timedelta(minutes=amount)
-            if unit in ['hora', 'horas', 'h']:
-                return now - timedelta(hours=amount)
-            if unit in ['dia', 'dias', 'día', 'días', 'd']:
-                return now - timedelta(days=amount)
-
-        return None
-
-    def prepare_news_df(df):
-        """Adiciona coluna de ordenação baseada em tempo (mais recente primeiro)."""
-        if df.empty:
-            return df
-        df = df.copy()
-        df['_parsed_ts'] = df['Hora'].apply(parse_news_time)
-        df['_parsed_ts'] = df['_parsed_ts'].fillna(datetime.now())
-        df = df.sort_values('_parsed_ts', ascending=False)
-        return df
-
-    # Formata DataFrame para exibição
-    if not web_news_df.empty:
-        # Verifica se tem coluna Categoria (dados simulados) ou não (GoogleNews)
-        has_categoria = 'Categoria' in web_news_df.columns
-        
-        if has_categoria:
-            # Separa as notícias por categoria
-            df_agro_punta = web_news_df[web_news_df['Categoria'] == 'Agro en Punta'].copy()
-            df_outros = web_news_df[web_news_df['Categoria'] != 'Agro en Punta'].copy()
-        else:
-            # Filtra por palavras-chave no título
-            mask_agro = web_news_df['Título'].str.contains('Agro en Punta|Punta del Este|evento em Punta', case=False, na=False)
-            df_agro_punta = web_news_df[mask_agro].copy()
-            df_outros = web_news_df[~mask_agro].copy()
-        
-        # Aba 1: Agro en Punta (até 3 meses, visível por 10 dias)
-        with tab1:
-            if not df_agro_punta.empty:
-                display_df = prepare_news_df(df_agro_punta)
-                cutoff_date = datetime.now() - timedelta(days=90)  # 3 meses
-                display_df = display_df[display_df['_parsed_ts'] >= cutoff_date]
-                if not display_df.empty:
-                    display_df['Título'] = display_df.apply(make_link, axis=1)
-                    display_df = display_df[['Hora', 'Veículo', 'Título']]
-                    display_df.columns = [t['hour'], t['vehicle'], t['title_col']]
-                    st.markdown(
-                        display_df.to_html(escape=False, index=False, classes='news-table'),
-                        unsafe_allow_html=True
-                    )
-                else:
-                    no_news_agro = "Nenhuma notícia sobre Agro en Punta nos últimos 3 meses." if st.session_state.language == 'pt-br' else "No hay noticias sobre Agro en Punta en los últimos 3 meses."
-                    st.info(no_news_agro)
-            else:
-                no_news_agro = "Nenhuma notícia sobre Agro en Punta no momento." if st.session_state.language == 'pt-br' else "No hay noticias sobre Agro en Punta en este momento."
-                st.info(no_news_agro)
-        
-        # Aba 2: Outras Notícias (até 1 mês)
-        with tab2:
-            if not df_outros.empty:
-                display_df = prepare_news_df(df_outros)
-                cutoff_date = datetime.now() - timedelta(days=30)  # 1 mês
-                display_df = display_df[display_df['_parsed_ts'] >= cutoff_date]
-                if not display_df.empty:
-                    display_df['Título'] = display_df.apply(make_link, axis=1)
-                    display_df = display_df[['Hora', 'Veículo', 'Título']]
-                    display_df.columns = [t['hour'], t['vehicle'], t['title_col']]
-                    st.markdown(
-                        display_df.to_html(escape=False, index=False, classes='news-table'),
-                        unsafe_allow_html=True
-                    )
-                else:
-                    no_news_other = "Nenhuma outra notícia no último mês." if st.session_state.language == 'pt-br' else "No hay otras noticias en el último mes."
-                    st.info(no_news_other)
-            else:
-                no_news_other = "Nenhuma outra notícia no momento." if st.session_state.language == 'pt-br' else "No hay otras noticias en este momento."
-                st.info(no_news_other)
-    else:
-        with tab1:
-            st.info(t['no_news'])
-        with tab2:
-            st.info(t['no_news'])
 
 # ============================================
 # FOOTER COM INFORMAÇÕES PROFISSIONAIS
@@ -809,3 +823,23 @@ st.markdown(f"""
     </div>
 </div>
 """, unsafe_allow_html=True)
+
+# ============================================
+# ATUALIZAÇÃO APÓS SNAPSHOT
+# ============================================
+REFRESH_POLL_SECONDS = 2
+
+
+@st.fragment(run_every=REFRESH_POLL_SECONDS)
+def watch_refresh(refresh):
+    """
+    A página já foi enviada com os dados do snapshot: o fragmento confere a
+    atualização em segundo plano a cada REFRESH_POLL_SECONDS, sem prender a
+    execução do script, e re-executa a página inteira quando ela termina.
+    """
+    if not refresh.is_alive():
+        st.rerun(scope='app')
+
+
+if pending_refresh is not None:
+    watch_refresh(pending_refresh)
@@ -1,22 +1,128 @@
-"""Keep Streamlit app alive with headless Selenium."""
+"""Keep Streamlit app alive and its caches warm.
+
+Default mode is plain HTTP: it hits the Streamlit health endpoint and,
+optionally, the standalone warm-up server (``src/warmup.py``), reporting
+latency and cache state. A plain GET never runs the Streamlit script, so it
+neither wakes a hibernated app nor warms the app's in-process caches.
+
+``--selenium`` is for apps that hibernate (Streamlit Community Cloud): only a
+real browser session wakes them. The page is opened in headless Chrome with
+``?warmup=1&token=...`` (token from ``AGROPULSE_WARMUP_TOKEN``, the same
+secret configured in the app), so the app process itself loads news, radio
+and social data for both languages into its shared caches and writes the
+startup snapshots; the run waits for the warm-up marker and saves a
+screenshot.
+
+Local test:
+    streamlit run app/main.py &
+    python keep_alive.py --url http://localhost:8501
+    AGROPULSE_WARMUP_TOKEN=segredo python keep_alive.py --selenium --url http://localhost:8501
+"""
 
 from __future__ import annotations
 
+import argparse
+import json
+import os
+import sys
 import time
 from datetime import datetime
-
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from urllib.error import HTTPError, URLError
+from urllib.parse import quote
+from urllib.request import Request, urlopen
 
 
 TARGET_URL = "https://agropulse.streamlit.app/"
+HEALTH_PATH = "/_stcore/health"
+WARMUP_URL = os.environ.get("AGROPULSE_WARMUP_URL", "")
+HTTP_TIMEOUT = 30
+WARMUP_TIMEOUT = 180
 WAIT_SECONDS = 10
+WARMUP_PARAM = "warmup"
+WARMUP_TOKEN_PARAM = "token"
+WARMUP_TOKEN = os.environ.get("AGROPULSE_WARMUP_TOKEN", "")
+WARMUP_DONE = "AgroPulse warm-up ok"
 SCREENSHOT_PATH = "keep_alive_screenshot.png"
 
 
-def build_driver() -> webdriver.Chrome:
+def _http_get(url: str, timeout: float) -> tuple[int, bytes, float]:
+    """GET simples; retorna (status, corpo, latência em segundos)."""
+    request = Request(url, headers={"User-Agent": "AgroPulse-KeepAlive/1.0"})
+    start = time.perf_counter()
+    try:
+        with urlopen(request, timeout=timeout) as response:
+            body = response.read()
+            status = response.status
+    except HTTPError as exc:
+        body = exc.read()
+        status = exc.code
+    return status, body, time.perf_counter() - start
+
+
+def check_health(base_url: str) -> dict:
+    status, body, latency = _http_get(base_url.rstrip("/") + HEALTH_PATH, HTTP_TIMEOUT)
+    return {
+        "status": status,
+        "body": body.decode("utf-8", errors="replace").strip()[:200],
+        "latency_ms": round(latency * 1000, 1),
+    }
+
+
+def warmup_page_url(base_url: str, token: str = WARMUP_TOKEN) -> str:
+    """URL da aplicação que dispara o aquecimento no próprio processo do app."""
+    separator = "&" if "?" in base_url else "?"
+    url = f"{base_url}{separator}{WARMUP_PARAM}=1"
+    if token:
+        url += f"&{WARMUP_TOKEN_PARAM}={quote(token, safe='')}"
+    return url
+
+
+def trigger_warmup(warmup_url: str) -> dict:
+    status, body, latency = _http_get(warmup_url.rstrip("/") + "/warmup", WARMUP_TIMEOUT)
+    try:
+        payload = json.loads(body.decode("utf-8"))
+    except ValueError:
+        payload = {"raw": body.decode("utf-8", errors="replace")[:200]}
+    return {"status": status, "latency_ms": round(latency * 1000, 1), "report": payload}
+
+
+def run_http(base_url: str, warmup_url: str) -> bool:
+    ok = True
+    try:
+        health = check_health(base_url)
+        print(f"Health {health['status']} em {health['latency_ms']} ms: {health['body']}")
+        ok = health["status"] == 200
+    except (URLError, OSError) as exc:
+        print(f"Keep-alive failed (health): {exc}")
+        ok = False
+
+    if warmup_url:
+        try:
+            warmup = trigger_warmup(warmup_url)
+            report = warmup["report"]
+            print(f"Warm-up {warmup['status']} em {warmup['latency_ms']} ms")
+            if "langs" in report:
+                print(
+                    f"  notícias: {report['news_rows']} linhas; "
+                    + ", ".join(f"{lang}: {info['seconds']}s" for lang, info in report["langs"].items())
+                )
+            print(json.dumps(report.get("cache_state", report), ensure_ascii=False, indent=2))
+            ok = ok and warmup["status"] == 200
+        except (URLError, OSError) as exc:
+            print(f"Keep-alive failed (warm-up): {exc}")
+            ok = False
+    return ok
+
+
+# ============================================
+# --selenium: ACORDA E AQUECE UM APP HIBERNADO
+# ============================================
+def build_driver():
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
+
     options = Options()
     options.add_argument("--headless")
     options.add_argument("--no-sandbox")
@@ -28,13 +134,31 @@ def build_driver() -> webdriver.Chrome:
     return webdriver.Chrome(service=service, options=options)
 
 
-def run() -> None:
-    driver: webdriver.Chrome | None = None
+def wait_for_warmup(driver: object) -> None:
+    """Espera o app terminar o aquecimento (a tela de despertar pode vir antes)."""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    try:
+        WebDriverWait(driver, WARMUP_TIMEOUT).until(
+            lambda d: WARMUP_DONE in d.find_element(By.TAG_NAME, "body").text
+        )
+        print("Warm-up concluído no app")
+    except Exception as exc:
+        # Página aberta mesmo assim: a sessão já acordou o app
+        print(f"Warm-up não confirmado: {exc.__class__.__name__}")
+        time.sleep(WAIT_SECONDS)
+
+
+def run_selenium(target_url: str) -> bool:
+    if not WARMUP_TOKEN:
+        print("AGROPULSE_WARMUP_TOKEN não definido: o app acorda, mas não aquece os caches")
+    driver = None
     try:
         driver = build_driver()
         driver.set_page_load_timeout(60)
-        driver.get(TARGET_URL)
-        time.sleep(WAIT_SECONDS)
+        driver.get(warmup_page_url(target_url))
+        wait_for_warmup(driver)
 
         timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
         screenshot_file = SCREENSHOT_PATH.replace(
@@ -42,8 +166,10 @@ def run() -> None:
         )
         driver.save_screenshot(screenshot_file)
         print(f"Screenshot saved: {screenshot_file}")
+        return True
     except Exception as exc:
         print(f"Keep-alive failed: {exc}")
+        return False
     finally:
         if driver is not None:
             try:
@@ -52,5 +178,22 @@ def run() -> None:
                 pass
 
 
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Keep-alive / warm-up do AgroPulse")
+    parser.add_argument("--url", default=TARGET_URL, help="URL base da aplicação Streamlit")
+    parser.add_argument("--selenium", action="store_true",
+                        help="abre o app em Chrome headless: acorda apps hibernados e aquece o processo")
+    parser.add_argument("--warmup-url", default=WARMUP_URL,
+                        help="modo HTTP: URL base do servidor de aquecimento (src/warmup.py serve)")
+    args = parser.parse_args()
+
+    if args.selenium:
+        ok = run_selenium(args.url)
+    else:
+        ok = run_http(args.url, args.warmup_url)
+    if not ok:
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     run()
@@ -0,0 +1,421 @@
+"""Concurrent-session load test for the Streamlit dashboard (app/main.py).
+
+Simula N sessões simultâneas com o AppTest do Streamlit, executando o script
+em processo, com fontes externas (GoogleNews, GDELT e feeds RSS) simuladas
+para rodar offline. Reporta latência p50/p95/p99 por execução do script, bytes
+enviados ao navegador por execução, memória por sessão e throughput.
+Com --similarity-docs, mede também a cobertura relacionada (find_similar)
+sobre um acervo sintético desse tamanho.
+
+Uso:
+    python load_test.py --sessions 20 --steps 6 --workers 8
+    python load_test.py --sessions 0 --memory-sessions 0 --similarity-docs 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import types
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from urllib.error import HTTPError
+from urllib.parse import quote, unquote
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_FILE = os.path.join(ROOT_DIR, "app", "main.py")
+SRC_DIR = os.path.join(ROOT_DIR, "src")
+
+# Interações realistas de um espectador: alternar idioma, ciclar tema e
+# trocar de aba de notícias (controle segmentado: re-executa só o fragmento
+# de notícias e calcula apenas a aba escolhida).
+ACTIONS = ("lang_toggle", "theme_toggle", "tab_switch")
+
+MOCK_OUTLETS = [
+    "El País Uruguay", "El Observador", "Canal Rural", "Agrolink",
+    "Notícias Agrícolas", "Valor Econômico", "La Nación Campo",
+]
+MOCK_HEADLINES = [
+    "Agro en Punta 2026 reúne produtores em Punta del Este",
+    "Exportações de soja crescem no Mercosul",
+    "Uruguai amplia mercado de carne bovina na Ásia",
+    "Crédito rural: novas linhas para pequenos produtores",
+    "Clima favorece safra de trigo no Sul",
+    "Tecnologia de precisão ganha espaço no campo",
+]
+
+
+# ============================================
+# FONTES EXTERNAS SIMULADAS (OFFLINE)
+# ============================================
+class _MockGoogleNews:
+    """Substituto offline da classe GoogleNews com resultados determinísticos."""
+
+    def __init__(self, lang: str = "pt", region: str = "BR", period: str = "1d", **_: object) -> None:
+        self.lang = lang
+        self._results: list[dict] = []
+
+    def set_period(self, period: str) -> None:
+        pass
+
+    def clear(self) -> None:
+        self._results = []
+
+    def search(self, term: str) -> None:
+        self._GoogleNews__key = quote(term)
+        self._results = self.page_at(1)
+
+    def page_at(self, page: int = 1) -> list[dict]:
+        # Chave codificada, como GoogleNews.search grava (googlenews_adapter a define direto)
+        term = unquote(self._GoogleNews__key)
+        # Volume do termo: de 1 a 3 páginas novas; depois disso repete a primeira
+        fresh_pages = random.Random(f"{self.lang}:{term}:pages").randint(1, 3)
+        index = page if page <= fresh_pages else 1
+        rng = random.Random(f"{self.lang}:{term}:{index}")
+        return [
+            {
+                "title": f"{rng.choice(MOCK_HEADLINES)} ({term} #{index}.{i})",
+                "media": rng.choice(MOCK_OUTLETS),
+                "date": f"há {rng.randint(1, 23)} horas",
+                "link": f"https://mock.agropulse.local/{self.lang}/{abs(hash(term)) % 997}/{index}/{i}",
+            }
+            for i in range(10)
+        ]
+
+    def get_page(self, page: int = 1) -> None:
+        self._results.extend(self.page_at(page))
+
+    def results(self) -> list[dict]:
+        return list(self._results)
+
+
+class _MockResponse:
+    def __init__(self, payload: bytes, headers: dict | None = None) -> None:
+        self._stream = io.BytesIO(payload)
+        self.headers = headers or {}
+
+    def read(self, size: int = -1) -> bytes:
+        return self._stream.read(size)
+
+    def __enter__(self) -> "_MockResponse":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+def _mock_feed(request: object, url: str) -> _MockResponse:
+    """Feed RSS sintético com ETag; If-None-Match igual responde 304."""
+    etag = f'"{abs(hash(url)) % 99991}"'
+    if request.get_header("If-none-match") == etag:  # type: ignore[attr-defined]
+        raise HTTPError(url, 304, "Not Modified", {}, None)
+    rng = random.Random(url)
+    items = "".join(
+        f"<item><title>{rng.choice(MOCK_HEADLINES)}</title>"
+        f"<link>{url.rstrip('/')}/item/{i}</link>"
+        f"<pubDate>{format_datetime(datetime.now(timezone.utc) - timedelta(hours=i))}</pubDate></item>"
+        for i in range(8)
+    )
+    payload = f'<?xml version="1.0"?><rss version="2.0"><channel>{items}</channel></rss>'
+    return _MockResponse(payload.encode("utf-8"), {"ETag": etag})
+
+
+def _mock_urlopen(request: object, timeout: float | None = None) -> _MockResponse:
+    """Responde às chamadas da GDELT Doc API com artigos sintéticos e aos feeds RSS."""
+    url = getattr(request, "full_url", str(request))
+    if "gdeltproject" not in url:
+        return _mock_feed(request, url)
+    rng = random.Random(url)
+    seen = datetime.utcnow() - timedelta(hours=rng.randint(1, 48))
+    articles = [
+        {
+            "title": rng.choice(MOCK_HEADLINES),
+            "url": f"https://gdelt.mock.local/{abs(hash(url)) % 9973}/{i}",
+            "sourceCommonName": rng.choice(MOCK_OUTLETS),
+            "seendate": seen.strftime("%Y%m%d%H%M%S"),
+        }
+        for i in range(5)
+    ]
+    return _MockResponse(json.dumps({"articles": articles}).encode("utf-8"))
+
+
+def install_offline_sources(data_dir: str) -> None:
+    """Redireciona o armazenamento para data_dir e simula as fontes externas."""
+    os.environ["AGROPULSE_DATA_DIR"] = data_dir
+    os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+    if SRC_DIR not in sys.path:
+        sys.path.insert(0, SRC_DIR)
+
+    fake_module = types.ModuleType("GoogleNews")
+    fake_module.GoogleNews = _MockGoogleNews  # type: ignore[attr-defined]
+    sys.modules["GoogleNews"] = fake_module
+
+    import media_engine
+
+    media_engine.DATA_DIR = data_dir
+    media_engine.NEWS_CACHE_FILE = os.path.join(data_dir, "news_cache.json")
+    media_engine.urlopen = _mock_urlopen
+
+
+# ============================================
+# SESSÕES SIMULADAS
+# ============================================
+def _timed_run(at: object, timeout: float) -> float:
+    start = time.perf_counter()
+    at.run(timeout=timeout)  # type: ignore[attr-defined]
+    elapsed = time.perf_counter() - start
+    if at.exception:  # type: ignore[attr-defined]
+        raise RuntimeError(f"Script falhou: {at.exception[0].value}")  # type: ignore[attr-defined]
+    return elapsed
+
+
+def _apply_action(at: object, action: str) -> None:
+    if action == "tab_switch":
+        control = at.segmented_control(key="news_tab")  # type: ignore[attr-defined]
+        control.set_value("outros" if control.value == "agro" else "agro")
+        return
+    at.button(key=action).click()  # type: ignore[attr-defined]
+
+
+_run_bytes = threading.local()
+
+
+def install_byte_meter() -> None:
+    """
+    Soma o tamanho serializado (protobuf) das mensagens de cada execução do
+    AppTest. O executor local guarda as mensagens da execução e o AppTest roda
+    o script na thread que chamou run(): o total fica em uma variável por thread.
+    """
+    from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+
+    original = LocalScriptRunner.run
+    if getattr(original, "byte_meter", False) or not hasattr(LocalScriptRunner, "forward_msgs"):
+        return  # já instalado, ou versão do Streamlit sem acesso às mensagens
+
+    def run(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        _run_bytes.value = None
+        tree = original(self, *args, **kwargs)
+        _run_bytes.value = sum(msg.ByteSize() for msg in self.forward_msgs())
+        return tree
+
+    run.byte_meter = True  # type: ignore[attr-defined]
+    LocalScriptRunner.run = run  # type: ignore[method-assign]
+
+
+def _rerun_bytes(at: object) -> int | None:
+    """Bytes enviados ao navegador na última execução desta thread."""
+    return getattr(_run_bytes, "value", None)
+
+
+def run_session(session_id: int, steps: int, timeout: float,
+                seed: int) -> tuple[list[float], list[int]]:
+    """
+    Executa uma sessão: primeira renderização + `steps` interações aleatórias.
+    Retorna as latências e os bytes enviados em cada execução.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(seed + session_id)
+    at = AppTest.from_file(APP_FILE, default_timeout=timeout)
+    latencies = [_timed_run(at, timeout)]
+    payloads = [_rerun_bytes(at)]
+    for _ in range(steps):
+        _apply_action(at, rng.choice(ACTIONS))
+        latencies.append(_timed_run(at, timeout))
+        payloads.append(_rerun_bytes(at))
+    return latencies, [size for size in payloads if size is not None]
+
+
+def measure_memory_per_session(sessions: int, timeout: float) -> float:
+    """Memória Python retida por sessão viva (bytes), medida com tracemalloc."""
+    from streamlit.testing.v1 import AppTest
+
+    # Aquece caches compartilhados para medir apenas o custo por sessão
+    AppTest.from_file(APP_FILE, default_timeout=timeout).run(timeout=timeout)
+
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+    alive = []
+    for _ in range(sessions):
+        at = AppTest.from_file(APP_FILE, default_timeout=timeout)
+        at.run(timeout=timeout)
+        alive.append(at)
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    retained = sum(stat.size_diff for stat in snapshot.compare_to(baseline, "filename"))
+    return max(retained, 0) / max(sessions, 1)
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def benchmark_similarity(docs: int, queries: int = 200, seed: int = 42) -> dict:
+    """Latência de find_similar (top-5) em um índice TF-IDF com `docs` títulos sintéticos."""
+    from similarity import TfidfIndex
+
+    rng = random.Random(seed)
+    words = [word for headline in MOCK_HEADLINES for word in headline.split()]
+    # Vocabulário de cauda longa: palavras reais frequentes + termos raros sintéticos
+    vocabulary = words + [f"termo{i}" for i in range(20000)]
+    weights = [50] * len(words) + [1] * 20000
+
+    index = TfidfIndex()
+    build_start = time.perf_counter()
+    for doc in range(docs):
+        index.add(f"doc{doc}", " ".join(rng.choices(vocabulary, weights, k=rng.randint(6, 14))))
+    build_seconds = time.perf_counter() - build_start
+
+    timings = []
+    for _ in range(queries):
+        item_id = f"doc{rng.randrange(docs)}"
+        start = time.perf_counter()
+        index.find_similar(item_id, k=5)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return {
+        "docs": docs,
+        "build_seconds": round(build_seconds, 2),
+        "p50_ms": round(_percentile(timings, 50) * 1000, 2),
+        "p95_ms": round(_percentile(timings, 95) * 1000, 2),
+        "max_ms": round(timings[-1] * 1000, 2),
+    }
+
+
+def run_load_test(sessions: int, steps: int, workers: int, timeout: float, seed: int,
+                  memory_sessions: int) -> dict:
+    """Dispara as sessões em paralelo e agrega as métricas."""
+    latencies: list[float] = []
+    payloads: list[int] = []
+    lock = threading.Lock()
+    errors: list[str] = []
+
+    def worker(session_id: int) -> None:
+        try:
+            result, sizes = run_session(session_id, steps, timeout, seed)
+        except Exception as exc:
+            with lock:
+                errors.append(f"sessão {session_id}: {exc}")
+            return
+        with lock:
+            latencies.extend(result)
+            payloads.extend(sizes)
+
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        list(pool.map(worker, range(sessions)))
+    wall = time.perf_counter() - wall_start
+
+    ordered = sorted(latencies)
+    report = {
+        "sessions": sessions,
+        "workers": workers,
+        "script_runs": len(ordered),
+        "errors": errors,
+        "wall_seconds": round(wall, 3),
+        "throughput_runs_per_s": round(len(ordered) / wall, 2) if wall else 0.0,
+        "latency_ms": {
+            "mean": round(statistics.fmean(ordered) * 1000, 1) if ordered else 0.0,
+            "p50": round(_percentile(ordered, 50) * 1000, 1),
+            "p95": round(_percentile(ordered, 95) * 1000, 1),
+            "p99": round(_percentile(ordered, 99) * 1000, 1),
+            "max": round(ordered[-1] * 1000, 1) if ordered else 0.0,
+        },
+        "bytes_per_rerun": {
+            "mean": round(statistics.fmean(payloads)) if payloads else 0,
+            "max": max(payloads, default=0),
+        },
+    }
+    import media_engine
+
+    report["upstream_cache"] = media_engine.UPSTREAM_CACHE.stats()
+    if memory_sessions > 0:
+        report["memory_per_session_kb"] = round(
+            measure_memory_per_session(memory_sessions, timeout) / 1024, 1
+        )
+    return report
+
+
+def print_report(report: dict) -> None:
+    lat = report["latency_ms"]
+    print("=== AgroPulse load test ===")
+    print(f"Sessões: {report['sessions']} (workers: {report['workers']})")
+    print(f"Execuções do script: {report['script_runs']} em {report['wall_seconds']}s")
+    print(f"Throughput: {report['throughput_runs_per_s']} execuções/s")
+    print(
+        f"Latência (ms): p50={lat['p50']} p95={lat['p95']} p99={lat['p99']} "
+        f"média={lat['mean']} máx={lat['max']}"
+    )
+    payload = report["bytes_per_rerun"]
+    print(f"Bytes por execução: média={payload['mean']} máx={payload['max']}")
+    if "memory_per_session_kb" in report:
+        print(f"Memória por sessão: {report['memory_per_session_kb']} KB")
+    cache = report["upstream_cache"]
+    print(
+        f"Cache de fontes: hits={cache['hits']} misses={cache['misses']} "
+        f"coalescidas={cache['coalesced']}"
+    )
+    if "similarity" in report:
+        sim = report["similarity"]
+        print(
+            f"find_similar ({sim['docs']} docs, índice em {sim['build_seconds']}s): "
+            f"p50={sim['p50_ms']}ms p95={sim['p95_ms']}ms máx={sim['max_ms']}ms"
+        )
+    for error in report["errors"]:
+        print(f"ERRO: {error}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Teste de carga do dashboard AgroPulse")
+    parser.add_argument("--sessions", type=int, default=10, help="sessões simultâneas")
+    parser.add_argument("--steps", type=int, default=5, help="interações por sessão")
+    parser.add_argument("--workers", type=int, default=None, help="threads (padrão: --sessions)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="timeout por execução (s)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--memory-sessions", type=int, default=5,
+                        help="sessões usadas na medição de memória (0 desativa)")
+    parser.add_argument("--data-dir", default=None,
+                        help="diretório de dados isolado (padrão: temporário)")
+    parser.add_argument("--similarity-docs", type=int, default=0,
+                        help="documentos no benchmark de find_similar (0 desativa)")
+    parser.add_argument("--json", action="store_true", help="imprime o relatório em JSON")
+    args = parser.parse_args()
+
+    data_dir = args.data_dir or tempfile.mkdtemp(prefix="agropulse-load-")
+    install_offline_sources(data_dir)
+    install_byte_meter()
+
+    report = run_load_test(
+        sessions=args.sessions,
+        steps=args.steps,
+        workers=args.workers or args.sessions,
+        timeout=args.timeout,
+        seed=args.seed,
+        memory_sessions=args.memory_sessions,
+    )
+    if args.similarity_docs > 0:
+        report["similarity"] = benchmark_similarity(args.similarity_docs, seed=args.seed)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+    if report["errors"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
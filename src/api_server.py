@@ -0,0 +1,287 @@
+"""
+AgroPulse Media Watch - API de Leitura
+Servidor HTTP (stdlib) somente leitura sobre o armazenamento de notícias e
+as transcrições de rádio, para que equipes consumidoras não precisem raspar
+a página do Streamlit (cada consulta custava uma execução completa do script).
+
+- Paginação por cursor: `next_cursor` opaco com a chave do último item
+  (estável mesmo com itens novos entrando no topo).
+- `ETag` fraco (`W/"..."`) derivado da versão dos dados + rota + parâmetros:
+  o mesmo JSON vale com ou sem gzip, e `If-None-Match` igual responde 304
+  sem ler o armazenamento.
+- Corpo em gzip quando o cliente envia `Accept-Encoding: gzip`.
+
+Rotas:
+    GET /news?categoria=&since=&until=&limit=&cursor=   (datas ISO, em _cached_at)
+    GET /radio?emissora=&sentimento=&limit=&cursor=
+    GET /sentiment?emissora=
+    GET /health
+
+Uso:
+    python src/api_server.py --port 8503
+"""
+
+import argparse
+import base64
+import gzip
+import hashlib
+import json
+import os
+import traceback
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import media_engine
+from request_cache import SingleFlightCache
+from schema import SENTIMENTS
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+GZIP_MIN_BYTES = 512
+
+# Conjuntos de dados prontos por versão (poucas versões vivas ao mesmo tempo)
+_datasets = SingleFlightCache(max_entries=4, ttl=3600)
+
+
+class BadRequest(ValueError):
+    """Parâmetro de consulta inválido (resposta 400)."""
+
+
+# ============================================
+# VERSÃO E CONJUNTOS DE DADOS
+# ============================================
+def _file_stamp(path):
+    try:
+        stat = os.stat(path)
+        return f'{stat.st_mtime_ns}:{stat.st_size}'
+    except FileNotFoundError:
+        return '-'
+
+
+def data_version():
+    """
+    Versão dos dados servidos: versão do coordenador (multi-réplica) e marca
+    dos arquivos do armazenamento, que são gravados por outro processo.
+    """
+    return '|'.join((
+        str(media_engine.get_data_version()),
+        _file_stamp(media_engine.NEWS_CACHE_FILE),
+        _file_stamp(media_engine.RADIO_TRANSCRIPTS_FILE),
+    ))
+
+
+def _load_dataset():
+    """Notícias e rádio ordenados do mais recente ao mais antigo, já serializáveis."""
+    news_df = media_engine.load_cached_news()
+    news = json.loads(news_df.to_json(orient='records', force_ascii=False)) if not news_df.empty else []
+    news.sort(key=_news_key, reverse=True)
+    radio = [
+        {**record.to_row(), 'Timestamp': record.timestamp.isoformat()}
+        for record in media_engine.load_radio_transcripts(limit=None)
+    ]
+    radio.sort(key=_radio_key, reverse=True)
+    return {'news': news, 'radio': radio}
+
+
+def get_dataset(version):
+    return _datasets.get_or_fetch(('dataset', version), _load_dataset)
+
+
+def _news_key(item):
+    return (item.get('_cached_at') or '', item.get('Link') or '')
+
+
+def _radio_key(item):
+    return (item['Timestamp'], item['Emissora'], item['Transcrição'])
+
+
+NEWS_KEY_SIZE = 2
+RADIO_KEY_SIZE = 3
+
+
+# ============================================
+# CONSULTAS
+# ============================================
+def encode_cursor(key):
+    return base64.urlsafe_b64encode(json.dumps(key, ensure_ascii=False).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor, size):
+    """Chave do cursor: lista de `size` strings (o formato de `encode_cursor` da rota)."""
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (ValueError, UnicodeError):
+        raise BadRequest('cursor inválido')
+    if not isinstance(key, list) or len(key) != size or not all(isinstance(part, str) for part in key):
+        raise BadRequest('cursor inválido')
+    return tuple(key)
+
+
+def _param(params, name):
+    values = params.get(name)
+    return values[0] if values else None
+
+
+def _page_size(params):
+    raw = _param(params, 'limit')
+    if raw is None:
+        return DEFAULT_PAGE_SIZE
+    try:
+        limit = int(raw)
+    except ValueError:
+        raise BadRequest('limit deve ser inteiro')
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def paginate(items, key, key_size, params):
+    """Página após o cursor (itens em ordem decrescente de `key`, tupla de `key_size` strings)."""
+    limit = _page_size(params)
+    cursor = _param(params, 'cursor')
+    if cursor:
+        after = decode_cursor(cursor, key_size)
+        items = (item for item in items if key(item) < after)
+    page = []
+    for item in items:
+        page.append(item)
+        if len(page) > limit:
+            break
+    has_more = len(page) > limit
+    page = page[:limit]
+    return {
+        'items': page,
+        'next_cursor': encode_cursor(list(key(page[-1]))) if has_more else None,
+    }
+
+
+def query_news(dataset, params):
+    categoria = _param(params, 'categoria')
+    since = _param(params, 'since')
+    until = _param(params, 'until')
+    items = (
+        item for item in dataset['news']
+        if (categoria is None or item.get('Categoria') == categoria)
+        and (since is None or (item.get('_cached_at') or '') >= since)
+        and (until is None or (item.get('_cached_at') or '') < until)
+    )
+    return paginate(items, _news_key, NEWS_KEY_SIZE, params)
+
+
+def query_radio(dataset, params):
+    emissora = _param(params, 'emissora')
+    sentimento = _param(params, 'sentimento')
+    if sentimento is not None and sentimento not in SENTIMENTS:
+        raise BadRequest(f"sentimento deve ser um de {', '.join(SENTIMENTS)}")
+    items = (
+        item for item in dataset['radio']
+        if (emissora is None or item['Emissora'] == emissora)
+        and (sentimento is None or item['Sentimento'] == sentimento)
+    )
+    return paginate(items, _radio_key, RADIO_KEY_SIZE, params)
+
+
+def query_sentiment(dataset, params):
+    emissora = _param(params, 'emissora')
+    counts = Counter(
+        item['Sentimento'] for item in dataset['radio']
+        if emissora is None or item['Emissora'] == emissora
+    )
+    by_station = {}
+    for item in dataset['radio']:
+        by_station.setdefault(item['Emissora'], Counter())[item['Sentimento']] += 1
+    return {
+        'summary': {sentiment: counts.get(sentiment, 0) for sentiment in SENTIMENTS},
+        'stations': {
+            station: {sentiment: station_counts.get(sentiment, 0) for sentiment in SENTIMENTS}
+            for station, station_counts in sorted(by_station.items())
+            if emissora is None or station == emissora
+        },
+    }
+
+
+ROUTES = {
+    '/news': query_news,
+    '/radio': query_radio,
+    '/sentiment': query_sentiment,
+}
+
+
+# ============================================
+# SERVIDOR HTTP
+# ============================================
+class ApiHandler(BaseHTTPRequestHandler):
+    """Rotas somente leitura com ETag/304 e gzip."""
+
+    def _send_json(self, status, payload, etag=None):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        gzipped = len(body) >= GZIP_MIN_BYTES and 'gzip' in self.headers.get('Accept-Encoding', '')
+        if gzipped:
+            body = gzip.compress(body, compresslevel=5)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Vary', 'Accept-Encoding')
+        if gzipped:
+            self.send_header('Content-Encoding', 'gzip')
+        if etag:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == '/health':
+            self._send_json(200, {'status': 'ok', 'version': data_version()})
+            return
+        query = ROUTES.get(url.path)
+        if query is None:
+            self._send_json(404, {'error': 'not found'})
+            return
+
+        version = data_version()
+        digest = hashlib.sha1(f'{version}\n{url.path}?{url.query}'.encode('utf-8')).hexdigest()
+        # Fraco: identidade e gzip trazem o mesmo JSON, mas não os mesmos bytes
+        etag = f'W/"{digest}"'
+        if etag in self.headers.get('If-None-Match', ''):
+            # Nada mudou: 304 sem carregar os dados
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        try:
+            payload = query(get_dataset(version), parse_qs(url.query))
+        except BadRequest as e:
+            self._send_json(400, {'error': str(e)})
+            return
+        except Exception as e:
+            # Detalhes só no log do servidor; o cliente recebe uma mensagem genérica
+            print(f"Erro ao responder {self.path}: {e!r}")
+            traceback.print_exc()
+            self._send_json(500, {'error': 'erro interno'})
+            return
+        self._send_json(200, {'version': version, **payload}, etag=etag)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(host='0.0.0.0', port=8503):
+    """Sobe a API de leitura (bloqueante)."""
+    # Leitora: acompanha a versão dos dados sem disputar o lease das réplicas
+    media_engine.use_read_only_replica()
+    server = ThreadingHTTPServer((host, port), ApiHandler)
+    print(f"API de leitura em http://{host}:{port} (/news, /radio, /sentiment, /health)")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='API de leitura do AgroPulse')
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=8503)
+    args = parser.parse_args()
+    serve(args.host, args.port)
@@ -0,0 +1,76 @@
+"""
+AgroPulse Media Watch - Linha de Comando
+Tarefas de operação sem subir o dashboard: exportação, verificação de feeds,
+carga histórica da GDELT, enriquecimento e spool de rádio.
+
+Fica fora de `media_engine` para que o motor seja importado uma única vez:
+executado como `__main__`, ele existiria em duas cópias (estado global,
+índices e locks duplicados) assim que outro módulo o importasse.
+
+Uso:
+    python src/cli.py export --from 2026-01-01 --to 2026-02-01 --format parquet
+    python src/cli.py feeds --url http://localhost:8000/feed.xml
+    python src/cli.py ingest-gdelt downloads/gdelt/ --workers 4
+    python src/cli.py enrich --limit 50
+    python src/cli.py radio-spool spool/ --workers 4
+"""
+
+import argparse
+
+import media_engine
+from exporter import add_export_arguments, run_export
+from gdelt_ingest import add_ingest_arguments, run_ingest
+from radio_ingest import add_spool_arguments, run_spool
+
+
+def add_feeds_arguments(parser):
+    """Registra os argumentos do subcomando `feeds`."""
+    parser.add_argument('--url', dest='urls', action='append', help='feed avulso (pode repetir)')
+
+
+def run_feeds(args):
+    """Lê cada feed duas vezes e mostra itens e respostas 304."""
+    for name, items, stats in media_engine.check_feeds(args.urls):
+        if items is None:
+            print(f"{name}: erro {stats}")
+        else:
+            print(f"{name}: {items} itens, {stats}")
+
+
+def add_enrich_arguments(parser):
+    """Registra os argumentos do subcomando `enrich`."""
+    parser.add_argument('--limit', type=int, default=None, help='máximo de artigos nesta execução')
+
+
+def run_enrich(args):
+    """Enriquece mesmo sem ser o líder: a execução manual é explícita."""
+    print(f"{media_engine.enrich_news_store(args.limit, force=True)} artigos enriquecidos")
+    print(media_engine.ARTICLE_ENRICHER.stats)
+
+
+COMMANDS = {
+    'export': ('exporta o arquivo de clipagem (CSV/Parquet)', add_export_arguments, run_export),
+    'feeds': ('verifica os feeds RSS/Atom (GET condicional)', add_feeds_arguments, run_feeds),
+    'ingest-gdelt': ('ingere arquivos de exportação GDELT (GKG/Events)', add_ingest_arguments, run_ingest),
+    'enrich': ('baixa o corpo dos artigos ainda não enriquecidos', add_enrich_arguments, run_enrich),
+    'radio-spool': ('transcreve os trechos de áudio do spool de rádio', add_spool_arguments, run_spool),
+}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='agropulse', description='AgroPulse Media Watch')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    for name, (help_text, add_arguments, _) in COMMANDS.items():
+        add_arguments(subparsers.add_parser(name, help=help_text))
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    # Ferramentas de linha de comando nunca disputam o lease das réplicas
+    media_engine.use_read_only_replica()
+    COMMANDS[args.command][2](args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+"""
+AgroPulse Media Watch - Agrupamento de Quase-Duplicatas
+A mesma pauta aparece em vários veículos (El País, Canal Rural, espelhos do
+GDELT) e nos dois idiomas. Cada título vira uma assinatura MinHash sobre
+shingles de caracteres do texto normalizado; um índice LSH por bandas
+encontra candidatos sem comparar com todos os itens, e o item entra no
+cluster do candidato mais parecido (ou abre um novo).
+"""
+
+import threading
+import zlib
+from collections import OrderedDict
+
+from text_utils import normalize_text, tokenize
+
+MINHASH_PERMUTATIONS = 64
+LSH_BANDS = 16
+SHINGLE_SIZE = 4
+SIMILARITY_THRESHOLD = 0.5
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def _permutations(num_perm, seed=1):
+    """Coeficientes (a, b) determinísticos para h(x) = (a*x + b) mod p."""
+    coefficients = []
+    state = seed
+    for _ in range(num_perm):
+        # LCG simples: mesmos coeficientes em todo processo/réplica
+        state = (state * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+        a = (state >> 3) % (_MERSENNE_PRIME - 1) + 1
+        state = (state * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+        b = (state >> 3) % _MERSENNE_PRIME
+        coefficients.append((a, b))
+    return coefficients
+
+
+_PERMUTATIONS = _permutations(MINHASH_PERMUTATIONS)
+
+
+def shingles(text, size=SHINGLE_SIZE):
+    """
+    Shingles de caracteres dos tokens normalizados (sem acentos/caixa).
+    Caracteres, e não palavras, para aproximar cognatos PT/ES
+    ("exportação"/"exportación", "rastreabilidade"/"trazabilidad").
+    """
+    joined = ' '.join(tokenize(normalize_text(text)))
+    if len(joined) <= size:
+        return {joined} if joined else set()
+    return {joined[i:i + size] for i in range(len(joined) - size + 1)}
+
+
+def minhash(features, permutations=_PERMUTATIONS):
+    """Assinatura MinHash (tupla de inteiros) de um conjunto de strings."""
+    if not features:
+        return None
+    hashes = [zlib.crc32(f.encode('utf-8')) & _MAX_HASH for f in features]
+    return tuple(
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes) & _MAX_HASH
+        for a, b in permutations
+    )
+
+
+def estimate_similarity(sig_a, sig_b):
+    """Jaccard estimado: fração de posições iguais nas assinaturas."""
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+
+class NearDuplicateIndex:
+    """
+    Índice LSH incremental item → cluster.
+    `add` consulta só os baldes das bandas da assinatura (custo independente
+    do tamanho do histórico). O id do cluster é o id do primeiro item.
+    Mantém no máximo `max_items` assinaturas (as mais antigas saem primeiro).
+    """
+
+    def __init__(self, bands=LSH_BANDS, threshold=SIMILARITY_THRESHOLD, max_items=20000):
+        if MINHASH_PERMUTATIONS % bands:
+            raise ValueError("número de permutações deve ser múltiplo do número de bandas")
+        self.bands = bands
+        self.rows = MINHASH_PERMUTATIONS // bands
+        self.threshold = threshold
+        self.max_items = max_items
+        self._signatures = OrderedDict()   # item → assinatura
+        self._clusters = {}                # item → cluster
+        self._buckets = {}                 # (banda, hash da banda) → {itens}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._signatures)
+
+    def _band_keys(self, signature):
+        for band in range(self.bands):
+            start = band * self.rows
+            yield band, hash(signature[start:start + self.rows])
+
+    def cluster_of(self, item_id):
+        return self._clusters.get(item_id)
+
+    def add(self, item_id, text, cluster_id=None):
+        """
+        Indexa o item e retorna o id do cluster. `cluster_id` força o cluster
+        (ex.: ao reconstruir o índice a partir do armazenamento). Texto sem
+        shingles (vazio) não é indexado nem ocupa memória: retorna o
+        `cluster_id` recebido (None sem ele).
+        """
+        with self._lock:
+            if item_id in self._clusters:
+                return self._clusters[item_id]
+            signature = minhash(shingles(text))
+            if signature is None:
+                return cluster_id
+
+            if cluster_id is None:
+                cluster_id = self._best_match(signature) or item_id
+
+            self._signatures[item_id] = signature
+            self._clusters[item_id] = cluster_id
+            for key in self._band_keys(signature):
+                self._buckets.setdefault(key, set()).add(item_id)
+            self._evict()
+            return cluster_id
+
+    def _best_match(self, signature):
+        candidates = set()
+        for key in self._band_keys(signature):
+            candidates.update(self._buckets.get(key, ()))
+        best, best_score = None, self.threshold
+        for candidate in candidates:
+            score = estimate_similarity(signature, self._signatures[candidate])
+            if score >= best_score:
+                best, best_score = candidate, score
+        return self._clusters[best] if best is not None else None
+
+    def _evict(self):
+        while len(self._signatures) > self.max_items:
+            item_id, signature = self._signatures.popitem(last=False)
+            self._clusters.pop(item_id, None)
+            for key in self._band_keys(signature):
+                bucket = self._buckets.get(key)
+                if bucket is not None:
+                    bucket.discard(item_id)
+                    if not bucket:
+                        del self._buckets[key]
+
+
+def collapse_clusters(df, cluster_column='Cluster', outlet_column='Veículo'):
+    """
+    Uma linha por cluster (a primeira, ou seja, a mais recente se o DataFrame
+    já estiver ordenado) e a coluna 'Veículos' com o número de veículos distintos.
+    """
+    if df.empty or cluster_column not in df.columns:
+        return df
+    clusters = df[cluster_column].fillna(df.get('Link', ''))
+    outlet_counts = df.groupby(clusters)[outlet_column].nunique()
+    first = ~clusters.duplicated()
+    collapsed = df[first.values]
+    collapsed['Veículos'] = clusters[first].map(outlet_counts).values
+    return collapsed
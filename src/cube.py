@@ -0,0 +1,126 @@
+"""
+AgroPulse Media Watch - Cubo de Agregados
+Cubo OLAP pré-agregado para KPIs e gráficos da clipagem: cada célula
+(dia, fonte, veículo, tópico, sentimento) guarda contagem e soma de alcance,
+atualizada de forma incremental na ingestão. Consultas com qualquer
+combinação de filtros percorrem as células (limitadas pela cardinalidade das
+dimensões), nunca os clippings brutos.
+"""
+
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+CLIP_DIMENSIONS = ('dia', 'fonte', 'veiculo', 'topico', 'sentimento')
+CLIP_MEASURES = ('alcance',)
+
+
+class Cube:
+    """Cubo de contagens e somas por combinação de dimensões."""
+
+    def __init__(self, dimensions=CLIP_DIMENSIONS, measures=CLIP_MEASURES, cache_size=64):
+        self.dimensions = tuple(dimensions)
+        self.measures = tuple(measures)
+        self.version = 0
+        self._cells = {}                 # chave → [contagem, *somas]
+        self._cache = OrderedDict()      # (versão, consulta) → resultado
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._cells)
+
+    def _add_cell(self, key, count, sums):
+        cell = self._cells.get(key)
+        if cell is None:
+            self._cells[key] = [count, *sums]
+        else:
+            cell[0] += count
+            for i, value in enumerate(sums, start=1):
+                cell[i] += value
+
+    def add(self, record):
+        """Ingestão de um registro (mapping com as dimensões e medidas)."""
+        key = tuple(record[d] for d in self.dimensions)
+        with self._lock:
+            self._add_cell(key, 1, [record[m] for m in self.measures])
+            self.version += 1
+
+    def add_frame(self, df):
+        """Ingestão em lote: pré-agrega o DataFrame e soma nas células."""
+        if df.empty:
+            return
+        grouped = df.groupby(list(self.dimensions), observed=True).agg(
+            _count=(self.measures[0] if self.measures else self.dimensions[0], 'size'),
+            **{m: (m, 'sum') for m in self.measures}
+        )
+        with self._lock:
+            for key, row in zip(grouped.index, grouped.itertuples(index=False)):
+                key = key if isinstance(key, tuple) else (key,)
+                self._add_cell(key, int(row[0]), [int(v) for v in row[1:]])
+            self.version += 1
+
+    def _matching_cells(self, filters):
+        positions = [
+            (self.dimensions.index(dim), set(allowed))
+            for dim, allowed in filters.items() if allowed is not None
+        ]
+        for key, cell in self._cells.items():
+            if all(key[pos] in allowed for pos, allowed in positions):
+                yield key, cell
+
+    def rollup(self, by=(), **filters):
+        """
+        Agrega as células que passam nos filtros (`dim=valores permitidos`;
+        None = sem filtro) pelas dimensões `by`. Retorna {chave: [contagem, *somas]}.
+        """
+        cache_key = (self.version, tuple(by), tuple(
+            sorted((dim, frozenset(allowed)) for dim, allowed in filters.items() if allowed is not None)
+        ))
+        with self._lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                return cached
+            positions = [self.dimensions.index(dim) for dim in by]
+            result = {}
+            for key, cell in self._matching_cells(filters):
+                group = tuple(key[pos] for pos in positions)
+                acc = result.get(group)
+                if acc is None:
+                    result[group] = list(cell)
+                else:
+                    for i, value in enumerate(cell):
+                        acc[i] += value
+            self._cache[cache_key] = result
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+            return result
+
+
+def summarize_clips(cube, fontes=None, topicos=None):
+    """
+    KPIs e séries dos gráficos da clipagem a partir do cubo: total, alcance,
+    positivos, veículos distintos, contagem por sentimento e linha do tempo
+    (dia × fonte).
+    """
+    filters = {'fonte': fontes, 'topico': topicos}
+    totals = cube.rollup((), **filters).get((), [0, 0])
+    by_sentiment = cube.rollup(('sentimento',), **filters)
+    by_veiculo = cube.rollup(('veiculo',), **filters)
+    timeline = cube.rollup(('dia', 'fonte'), **filters)
+    return {
+        'total': totals[0],
+        'alcance': totals[1],
+        'positivos': by_sentiment.get(('Positivo',), [0])[0],
+        'veiculos': sum(1 for cell in by_veiculo.values() if cell[0] > 0),
+        'sentimento': pd.DataFrame(
+            [(key[0], cell[0]) for key, cell in by_sentiment.items()],
+            columns=['sentimento', 'contagem']
+        ),
+        'timeline': pd.DataFrame(
+            [(key[0], key[1], cell[0]) for key, cell in sorted(timeline.items())],
+            columns=['data', 'fonte', 'mencoes']
+        ),
+    }
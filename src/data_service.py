@@ -0,0 +1,89 @@
+"""
+AgroPulse Media Watch - Serviço de Dados Compartilhado
+Quadros do dashboard (notícias, rádio, redes sociais) carregados uma vez por
+chave e versão e compartilhados entre todas as sessões, sem a cópia
+desserializada que o st.cache_data entrega a cada acerto.
+
+Os quadros publicados são tratados como imutáveis: texto já é Arrow (dtype
+'str' do pandas 3), e colunas de listas (tags, alertas) viram listas Arrow.
+Cada sessão recebe uma visão (`frame_view`) que compartilha os buffers; com
+o Copy-on-Write do pandas, qualquer alteração na visão copia só a coluna
+alterada, sem afetar o quadro compartilhado.
+"""
+
+import threading
+
+import pandas as pd
+import pyarrow as pa
+
+from request_cache import SingleFlightCache
+
+
+def freeze_frame(df):
+    """Converte colunas object de listas para listas Arrow (in-place e retorna)."""
+    for column in df.columns:
+        if df[column].dtype != object:
+            continue
+        try:
+            values = pa.array(df[column].tolist())
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            continue
+        if pa.types.is_list(values.type):
+            df[column] = pd.Series(pd.arrays.ArrowExtensionArray(values), index=df.index)
+    return df
+
+
+def frame_view(df):
+    """Visão sem cópia de um quadro compartilhado (atributos em cópia rasa)."""
+    view = pd.DataFrame(df, copy=False)
+    view.attrs = dict(df.attrs)
+    return view
+
+
+def _share(value):
+    if isinstance(value, pd.DataFrame):
+        return freeze_frame(value)
+    if isinstance(value, tuple):
+        return tuple(_share(item) for item in value)
+    return value
+
+
+def views(value):
+    """Visões de um valor publicado (quadros, tuplas de quadros, dicts)."""
+    if isinstance(value, pd.DataFrame):
+        return frame_view(value)
+    if isinstance(value, tuple):
+        return tuple(views(item) for item in value)
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+class DataService:
+    """
+    Registro compartilhado de dados publicados por chave (ex.: ('dashboard',
+    idioma, versão)). A carga de cada chave é single-flight e expira pelo TTL;
+    `version` conta as publicações.
+    """
+
+    def __init__(self, max_entries=8, ttl=600):
+        self._cache = SingleFlightCache(max_entries=max_entries, ttl=ttl)
+        self._lock = threading.Lock()
+        self.version = 0
+
+    def _publish(self, loader):
+        value = _share(loader())
+        with self._lock:
+            self.version += 1
+        return value
+
+    def get(self, key, loader, ttl=None):
+        """Visões dos dados de `key`, carregando com `loader()` se necessário."""
+        value = self._cache.get_or_fetch(key, lambda: self._publish(loader), ttl=ttl)
+        return views(value)
+
+    def invalidate(self, key=None):
+        self._cache.invalidate(key)
+
+    def stats(self):
+        return {**self._cache.stats(), 'version': self.version}
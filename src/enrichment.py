@@ -0,0 +1,228 @@
+"""
+AgroPulse Media Watch - Enriquecimento de Artigos
+Etapa opcional que baixa a página de cada link novo, extrai o texto
+principal com um extrator local (html.parser, sem dependências) e guarda o
+corpo no cache abaixo (o item do armazenamento leva só o digest), para que
+sentimento, tags e busca não dependam só do título.
+
+Os corpos ficam em um cache em disco endereçado por conteúdo
+(`objetos/ab/<sha256>.txt.gz`, o mesmo texto publicado por vários veículos
+ocupa um arquivo só) com um índice link → digest, para que nenhum artigo
+seja baixado duas vezes. Os downloads rodam em paralelo, com concorrência
+limitada por host para não sobrecarregar um veículo.
+
+Uso:
+    python src/cli.py enrich --limit 50
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
+from urllib.request import Request, urlopen
+
+ENRICH_USER_AGENT = 'Mozilla/5.0 (compatible; AgroPulse/1.0)'
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+MIN_PARAGRAPH_CHARS = 40
+
+# Blocos que nunca fazem parte do texto principal
+_SKIP_TAGS = {'script', 'style', 'noscript', 'nav', 'header', 'footer', 'aside', 'form', 'figcaption'}
+_VOID_TAGS = {'br', 'img', 'hr', 'meta', 'link', 'input', 'source', 'wbr'}
+
+
+class _MainTextParser(HTMLParser):
+    """Coleta parágrafos (<p>) fora de blocos de navegação, separando os de <article>."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.article_paragraphs = []
+        self.paragraphs = []
+        self._skip_depth = 0
+        self._article_depth = 0
+        self._current = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _VOID_TAGS:
+            return
+        if tag in _SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag == 'article':
+            self._article_depth += 1
+        elif tag == 'p' and not self._skip_depth:
+            self._close_paragraph()
+            self._current = []
+
+    def handle_endtag(self, tag):
+        if tag in _SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag == 'p':
+            self._close_paragraph()
+        elif tag == 'article':
+            self._close_paragraph()
+            self._article_depth = max(0, self._article_depth - 1)
+
+    def handle_data(self, data):
+        if self._current is not None and not self._skip_depth:
+            self._current.append(data)
+
+    def _close_paragraph(self):
+        if self._current is None:
+            return
+        text = ' '.join(''.join(self._current).split())
+        self._current = None
+        if len(text) >= MIN_PARAGRAPH_CHARS:
+            (self.article_paragraphs if self._article_depth else self.paragraphs).append(text)
+
+    def close(self):
+        super().close()
+        self._close_paragraph()
+
+
+def extract_main_text(html):
+    """
+    Texto principal de uma página: parágrafos de <article> quando existem,
+    senão todos os parágrafos longos fora de navegação/rodapé.
+    """
+    parser = _MainTextParser()
+    parser.feed(html)
+    parser.close()
+    return '\n\n'.join(parser.article_paragraphs or parser.paragraphs)
+
+
+class ArticleStore:
+    """
+    Cache de corpos endereçado por conteúdo: objetos gzip nomeados pelo
+    sha256 do texto e índice link → digest (JSONL só de acréscimo; digest
+    None registra falha definitiva, que também não é baixada de novo).
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._index_file = os.path.join(directory, 'index.jsonl')
+        self._lock = threading.Lock()
+        self._index = None
+
+    def _load_index(self):
+        if self._index is not None:
+            return self._index
+        self._index = {}
+        try:
+            with open(self._index_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # linha truncada por interrupção
+                    self._index[entry['url']] = entry.get('digest')
+        except FileNotFoundError:
+            pass
+        return self._index
+
+    def _object_path(self, digest):
+        return os.path.join(self.directory, 'objetos', digest[:2], f'{digest}.txt.gz')
+
+    def __contains__(self, url):
+        with self._lock:
+            return url in self._load_index()
+
+    def digest(self, url):
+        with self._lock:
+            return self._load_index().get(url)
+
+    def read(self, digest):
+        """Texto de um objeto (ou '' se não existir)."""
+        try:
+            with gzip.open(self._object_path(digest), 'rt', encoding='utf-8') as f:
+                return f.read()
+        except (FileNotFoundError, TypeError):
+            return ''
+
+    def put(self, url, text):
+        """Grava o texto (se ainda não existir o objeto) e indexa o link. Retorna o digest."""
+        digest = hashlib.sha256(text.encode('utf-8')).hexdigest() if text else None
+        if digest:
+            path = self._object_path(digest)
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+                with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                    f.write(text)
+                os.replace(tmp_path, path)
+        with self._lock:
+            self._load_index()[url] = digest
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self._index_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'url': url, 'digest': digest}, ensure_ascii=False) + '\n')
+        return digest
+
+
+def fetch_page(url, timeout=10, max_bytes=MAX_PAGE_BYTES):
+    """Baixa uma página HTML (no máximo `max_bytes`) e decodifica pelo charset da resposta."""
+    request = Request(url, headers={'User-Agent': ENRICH_USER_AGENT})
+    with urlopen(request, timeout=timeout) as response:
+        charset = response.headers.get_content_charset() or 'utf-8'
+        return response.read(max_bytes).decode(charset, errors='replace')
+
+
+class ArticleEnricher:
+    """
+    Baixa e extrai o texto de vários links em paralelo (`max_workers`), com
+    no máximo `per_host` downloads simultâneos por host. Links já presentes
+    no `store` não são baixados de novo.
+    """
+
+    def __init__(self, store, max_workers=8, per_host=2, timeout=10, fetch=fetch_page):
+        self.store = store
+        self.per_host = per_host
+        self.timeout = timeout
+        self._fetch = fetch
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='agropulse-enrich')
+        self._host_slots = {}
+        self._slots_lock = threading.Lock()
+        self.stats = {'downloads': 0, 'cache_hits': 0, 'errors': 0}
+
+    def _count(self, key):
+        with self._slots_lock:
+            self.stats[key] += 1
+
+    def _host_slot(self, url):
+        host = urlsplit(url).netloc.lower()
+        with self._slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self.per_host)
+            return slot
+
+    def _enrich_one(self, url):
+        with self._host_slot(url):
+            try:
+                html = self._fetch(url, timeout=self.timeout)
+            except HTTPError as e:
+                self._count('errors')
+                # 4xx é definitivo (página removida/bloqueada): registra para não insistir
+                return self.store.put(url, '') if 400 <= e.code < 500 else None
+            except Exception as e:
+                print(f"Erro ao baixar artigo {url}: {e}")
+                self._count('errors')
+                return None
+        self._count('downloads')
+        return self.store.put(url, extract_main_text(html))
+
+    def enrich(self, urls):
+        """Retorna {link: texto} dos links pedidos (do cache ou baixados agora)."""
+        pending = {}
+        digests = {}
+        for url in dict.fromkeys(urls):
+            if url in self.store:
+                self._count('cache_hits')
+                digests[url] = self.store.digest(url)
+            elif url.startswith(('http://', 'https://')):
+                pending[url] = self._executor.submit(self._enrich_one, url)
+        for url, future in pending.items():
+            digests[url] = future.result()
+        return {url: self.store.read(digest) for url, digest in digests.items() if digest}
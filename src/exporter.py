@@ -0,0 +1,290 @@
+"""
+AgroPulse Media Watch - Exportação em Lote
+Exporta o arquivo de clipagem (notícias, rádio, social) para CSV/Parquet sem
+subir o dashboard. Os registros são lidos do armazenamento em streaming e
+gravados em blocos de tamanho limitado, sem materializar o histórico inteiro.
+
+Uso:
+    python src/cli.py export --from 2026-01-01 --to 2026-02-01 \\
+        --format parquet --output exports/
+"""
+
+import csv
+import json
+import os
+from datetime import datetime
+
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+import media_engine
+from schema import SOCIAL_PLATFORMS
+
+EXPORT_CHUNK_SIZE = 1000
+EXPORT_KINDS = ('news', 'radio', 'social')
+
+# Esquema fixo por tipo: permite gravar CSV/Parquet em streaming com os tipos reais
+_TEXT_LIST = pa.list_(pa.string())
+_TIMESTAMP = pa.timestamp('us')
+EXPORT_SCHEMAS = {
+    'news': pa.schema([
+        ('Hora', pa.string()), ('Veículo', pa.string()), ('Título', pa.string()), ('Link', pa.string()),
+        ('Categoria', pa.string()), ('Tags', _TEXT_LIST), ('Termos', _TEXT_LIST),
+        ('Sentimento', pa.string()), ('_cached_at', _TIMESTAMP),
+    ]),
+    'radio': pa.schema([
+        ('Timestamp', _TIMESTAMP), ('Emissora', pa.string()), ('Transcrição', pa.string()),
+        ('Sentimento', pa.string()),
+    ]),
+    'social': pa.schema([
+        ('Hora', pa.string()), ('HoraCompleta', _TIMESTAMP),
+        *((platform, pa.int32()) for platform in SOCIAL_PLATFORMS), ('Total', pa.int32()),
+    ]),
+}
+
+
+# ============================================
+# LEITURA EM STREAMING
+# ============================================
+def iter_json_array(path, key='news', read_size=64 * 1024):
+    """
+    Percorre os objetos do array `key` de um arquivo JSON (ex.: news_cache.json)
+    um a um, lendo o arquivo em blocos de `read_size` caracteres.
+    """
+    if not os.path.exists(path):
+        return
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer = ''
+        # Avança até o início do array
+        marker = f'"{key}"'
+        while True:
+            chunk = f.read(read_size)
+            if not chunk:
+                return
+            buffer += chunk
+            idx = buffer.find(marker)
+            if idx >= 0:
+                start = buffer.find('[', idx + len(marker))
+                if start >= 0:
+                    buffer = buffer[start + 1:]
+                    break
+            else:
+                buffer = buffer[-len(marker):]
+
+        eof = False
+        while True:
+            buffer = buffer.lstrip(' \t\r\n,')
+            if buffer.startswith(']'):
+                return
+            try:
+                obj, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                if eof:
+                    return
+                chunk = f.read(read_size)
+                eof = not chunk
+                buffer += chunk
+                continue
+            yield obj
+            buffer = buffer[end:]
+
+
+def iter_arrow_records(path):
+    """Percorre as linhas de um arquivo Arrow IPC (snapshot) lote a lote."""
+    if not os.path.exists(path):
+        return
+    with pa.memory_map(path, 'r') as source:
+        reader = ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            yield from reader.get_batch(i).to_pylist()
+
+
+def _snapshot_created_at(lang):
+    manifest_path = os.path.join(media_engine.DATA_DIR, 'snapshot', lang, 'manifest.json')
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return datetime.fromisoformat(json.load(f)['created_at'])
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def iter_records(kind, langs=('pt-br', 'es-uy')):
+    """
+    Gera (registro, data_de_referência) para o tipo `kind`.
+    Notícias vêm do armazenamento JSON e rádio das transcrições reais
+    (`radio_transcripts.jsonl`), ambos lidos em streaming; social, que só
+    existe simulado, dos snapshots Arrow.
+    """
+    if kind == 'news':
+        for item in iter_json_array(media_engine.NEWS_CACHE_FILE, 'news'):
+            yield item, _as_datetime(item.get('_cached_at'))
+        return
+    if kind == 'radio':
+        for record in media_engine.iter_radio_transcripts():
+            yield record.to_row(), record.timestamp
+        return
+
+    for lang in langs:
+        created_at = _snapshot_created_at(lang)
+        path = os.path.join(media_engine.DATA_DIR, 'snapshot', lang, f'{kind}.arrow')
+        for record in iter_arrow_records(path):
+            yield record, record.get('HoraCompleta') or created_at
+
+
+def filter_records(records, date_from=None, date_to=None, categories=None, outlets=None, sentiments=None):
+    """
+    Aplica filtros de período, categoria, veículo/emissora e sentimento.
+    Um filtro informado exclui registros que não possuem o campo correspondente.
+    """
+    categories = {c.lower() for c in categories} if categories else None
+    outlets = {o.lower() for o in outlets} if outlets else None
+    sentiments = {s.lower() for s in sentiments} if sentiments else None
+
+    for record, ref in records:
+        if date_from and (ref is None or ref < date_from):
+            continue
+        if date_to and (ref is None or ref >= date_to):
+            continue
+        if categories and str(record.get('Categoria', '')).lower() not in categories:
+            continue
+        if outlets:
+            outlet = record.get('Veículo') or record.get('Emissora') or ''
+            if str(outlet).lower() not in outlets:
+                continue
+        if sentiments and str(record.get('Sentimento', '')).lower() not in sentiments:
+            continue
+        yield record
+
+
+def chunked(iterable, size=EXPORT_CHUNK_SIZE):
+    """Agrupa um iterável em listas de até `size` itens."""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# ============================================
+# GRAVAÇÃO
+# ============================================
+def _as_datetime(value):
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_missing(value):
+    return value is None or (isinstance(value, float) and value != value)
+
+
+def _arrow_value(value, arrow_type):
+    """Valor do registro convertido para o tipo da coluna (None se ausente)."""
+    if _is_missing(value):
+        return None
+    if pa.types.is_timestamp(arrow_type):
+        return _as_datetime(value)
+    if pa.types.is_list(arrow_type):
+        values = [value] if isinstance(value, str) else value
+        return [str(v) for v in values]
+    if pa.types.is_integer(arrow_type):
+        return int(value)
+    return str(value)
+
+
+def _csv_value(value):
+    """Datas em ISO e listas (Tags, Termos) em JSON, legíveis por qualquer leitor."""
+    if _is_missing(value):
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (list, tuple, dict)):
+        return json.dumps(list(value) if isinstance(value, tuple) else value, ensure_ascii=False)
+    return value
+
+
+def write_csv(chunks, path, schema):
+    """Grava blocos de registros em CSV. Retorna o número de linhas."""
+    total = 0
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=schema.names, extrasaction='ignore')
+        writer.writeheader()
+        for chunk in chunks:
+            writer.writerows(
+                {field: _csv_value(record.get(field)) for field in schema.names} for record in chunk
+            )
+            total += len(chunk)
+    return total
+
+
+def write_parquet(chunks, path, schema):
+    """Grava blocos de registros em Parquet (um row group por bloco), com os tipos de `schema`."""
+    total = 0
+    with pq.ParquetWriter(path, schema, compression='zstd') as writer:
+        for chunk in chunks:
+            rows = [
+                {field.name: _arrow_value(record.get(field.name), field.type) for field in schema}
+                for record in chunk
+            ]
+            writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+            total += len(rows)
+    return total
+
+
+def export(kinds=EXPORT_KINDS, output_dir='exports', fmt='csv', date_from=None, date_to=None,
+           categories=None, outlets=None, sentiments=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Exporta cada tipo para `output_dir/<tipo>.<formato>`.
+    Retorna {tipo: (caminho, linhas)}.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    writer = write_parquet if fmt == 'parquet' else write_csv
+    result = {}
+    for kind in kinds:
+        records = filter_records(
+            iter_records(kind), date_from, date_to, categories, outlets, sentiments
+        )
+        path = os.path.join(output_dir, f'{kind}.{fmt}')
+        result[kind] = (path, writer(chunked(records, chunk_size), path, EXPORT_SCHEMAS[kind]))
+    return result
+
+
+def add_export_arguments(parser):
+    """Registra os argumentos do subcomando `export`."""
+    parser.add_argument('--from', dest='date_from', type=datetime.fromisoformat,
+                        help='data inicial (ISO, inclusiva)')
+    parser.add_argument('--to', dest='date_to', type=datetime.fromisoformat,
+                        help='data final (ISO, exclusiva)')
+    parser.add_argument('--format', dest='fmt', choices=['csv', 'parquet'], default='csv')
+    parser.add_argument('--output', default='exports', help='diretório de saída')
+    parser.add_argument('--kind', dest='kinds', action='append', choices=EXPORT_KINDS,
+                        help='tipo(s) a exportar (padrão: todos)')
+    parser.add_argument('--category', dest='categories', action='append', help='filtra por Categoria')
+    parser.add_argument('--outlet', dest='outlets', action='append', help='filtra por Veículo/Emissora')
+    parser.add_argument('--sentiment', dest='sentiments', action='append', help='filtra por Sentimento')
+    parser.add_argument('--chunk-size', type=int, default=EXPORT_CHUNK_SIZE)
+
+
+def run_export(args):
+    """Executa o subcomando `export` a partir dos argumentos do argparse."""
+    result = export(
+        kinds=args.kinds or EXPORT_KINDS,
+        output_dir=args.output,
+        fmt=args.fmt,
+        date_from=args.date_from,
+        date_to=args.date_to,
+        categories=args.categories,
+        outlets=args.outlets,
+        sentiments=args.sentiments,
+        chunk_size=args.chunk_size,
+    )
+    for kind, (path, rows) in result.items():
+        print(f"{kind}: {rows} registros → {path}")
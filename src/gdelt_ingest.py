@@ -0,0 +1,271 @@
+"""
+AgroPulse Media Watch - Ingestão de Exportações GDELT
+Carga em lote (backfill) a partir dos arquivos de 15 minutos da GDELT 2.x
+já baixados (GKG `*.gkg.csv.zip` e Events `*.export.CSV.zip`), em vez de
+paginar a Doc API termo a termo.
+
+Cada arquivo é descompactado e lido linha a linha em streaming (zip, gzip ou
+CSV puro) em um pool de processos; só as linhas que citam os termos agro
+(busca + watchlist) nos idiomas de origem monitorados voltam ao processo
+principal. As correspondências vão para o armazenamento de notícias em
+lotes (a cada INGEST_BATCH_FILES arquivos concluídos ou INGEST_BATCH_SIZE
+artigos), então a memória fica limitada pelo lote, não pelo diretório. A
+deduplicação é feita pelo próprio armazenamento (carga histórica: data da
+GDELT em `_cached_at`, a mais antiga quando o link se repete, sem alertas
+nem tendências).
+
+Uso:
+    python src/cli.py ingest-gdelt downloads/gdelt/ --workers 4
+"""
+
+import gzip
+import io
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+from watchlist import Watchlist
+
+EXPORT_SUFFIXES = ('.zip', '.csv', '.gz')
+# Gravação no armazenamento a cada N arquivos concluídos ou N artigos pendentes
+INGEST_BATCH_FILES = 20
+INGEST_BATCH_SIZE = 500
+
+# GKG 2.1 (colunas separadas por tabulação)
+GKG_DATE = 1
+GKG_SOURCE_NAME = 3
+GKG_DOCUMENT_URL = 4
+GKG_TRANSLATION_INFO = 25
+GKG_EXTRAS_XML = 26
+
+# Events 2.0
+EVENTS_DATE_ADDED = 59
+EVENTS_SOURCE_URL = 60
+
+# Idioma de origem GDELT (srclc) → idioma do dashboard
+SOURCE_LANGS = {'por': 'pt-br', 'spa': 'es-uy'}
+# Events não traz idioma: inferido pelo domínio do país
+TLD_LANGS = {
+    'br': 'pt-br', 'pt': 'pt-br',
+    'uy': 'es-uy', 'ar': 'es-uy', 'py': 'es-uy', 'cl': 'es-uy', 'es': 'es-uy',
+}
+
+_matchers = {}
+
+
+def _matcher(groups):
+    """Autômato da watchlist, compilado uma vez por processo do pool."""
+    key = tuple((group, tuple(terms)) for group, terms in sorted(groups.items()))
+    matcher = _matchers.get(key)
+    if matcher is None:
+        matcher = _matchers[key] = Watchlist(groups)
+    return matcher
+
+
+def iter_export_lines(path):
+    """Linhas de um arquivo de exportação, descompactando em streaming."""
+    if path.endswith('.zip'):
+        with zipfile.ZipFile(path) as archive:
+            for member in archive.namelist():
+                with archive.open(member) as raw:
+                    yield from io.TextIOWrapper(raw, encoding='utf-8', errors='replace', newline='')
+    elif path.endswith('.gz'):
+        with gzip.open(path, 'rt', encoding='utf-8', errors='replace', newline='') as f:
+            yield from f
+    else:
+        with open(path, 'r', encoding='utf-8', errors='replace', newline='') as f:
+            yield from f
+
+
+def _page_title(extras_xml):
+    start = extras_xml.find('<PAGE_TITLE>')
+    if start < 0:
+        return ''
+    end = extras_xml.find('</PAGE_TITLE>', start)
+    return extras_xml[start + len('<PAGE_TITLE>'):end if end >= 0 else None].strip()
+
+
+def _url_slug(url):
+    """Último trecho útil da URL como texto ('soja-bate-recorde' → 'soja bate recorde')."""
+    path = url.split('?', 1)[0].rstrip('/')
+    slug = path.rsplit('/', 1)[-1].rsplit('.', 1)[0]
+    return slug.replace('-', ' ').replace('_', ' ')
+
+
+def _url_domain(url):
+    return url.split('://', 1)[-1].split('/', 1)[0].lower()
+
+
+def _gkg_lang(translation_info):
+    """GKG traduzido: 'srclc:por;eng:...'; vazio = fluxo em inglês."""
+    for part in translation_info.split(';'):
+        if part.startswith('srclc:'):
+            return SOURCE_LANGS.get(part[len('srclc:'):])
+    return None
+
+
+def _tld_lang(url):
+    return TLD_LANGS.get(_url_domain(url).rsplit('.', 1)[-1])
+
+
+def parse_gkg_line(line):
+    fields = line.rstrip('\r\n').split('\t')
+    if len(fields) <= GKG_TRANSLATION_INFO:
+        return None
+    url = fields[GKG_DOCUMENT_URL]
+    extras = fields[GKG_EXTRAS_XML] if len(fields) > GKG_EXTRAS_XML else ''
+    return {
+        'seendate': fields[GKG_DATE],
+        'source': fields[GKG_SOURCE_NAME] or _url_domain(url),
+        'url': url,
+        'title': _page_title(extras),
+        'lang': _gkg_lang(fields[GKG_TRANSLATION_INFO]),
+    }
+
+
+def parse_events_line(line):
+    fields = line.rstrip('\r\n').split('\t')
+    if len(fields) <= EVENTS_SOURCE_URL:
+        return None
+    url = fields[EVENTS_SOURCE_URL]
+    return {
+        'seendate': fields[EVENTS_DATE_ADDED],
+        'source': _url_domain(url),
+        'url': url,
+        'title': '',
+        'lang': _tld_lang(url),
+    }
+
+
+def ingest_file(path, groups, langs):
+    """
+    Processa um arquivo (executa no pool): retorna (linhas lidas, artigos
+    que citam algum termo em um dos idiomas `langs`). Artigos com 'terms'.
+    """
+    parse = parse_gkg_line if '.gkg.' in os.path.basename(path).lower() else parse_events_line
+    matcher = _matcher(groups)
+    rows = 0
+    matches = []
+    seen_urls = set()
+    for line in iter_export_lines(path):
+        rows += 1
+        article = parse(line)
+        if article is None or article['lang'] not in langs or article['url'] in seen_urls:
+            continue
+        found = matcher.match(f"{article['title']} {_url_slug(article['url'])}")
+        if not found:
+            continue
+        seen_urls.add(article['url'])
+        # Um termo pode estar em mais de um grupo (ex.: marca e concorrente)
+        article['terms'] = list(dict.fromkeys(m['term'] for m in found))
+        matches.append(article)
+    return rows, matches
+
+
+def gdelt_datetime(value):
+    """Data GDELT (AAAAMMDDHHMMSS) em datetime, ou None se inválida."""
+    try:
+        return datetime.strptime(value[:14], '%Y%m%d%H%M%S')
+    except (TypeError, ValueError):
+        return None
+
+
+def export_files(directory):
+    """Arquivos de exportação do diretório, em ordem cronológica (nome)."""
+    return sorted(
+        os.path.join(directory, name) for name in os.listdir(directory)
+        if name.lower().endswith(EXPORT_SUFFIXES)
+    )
+
+
+def _backfill_row(article, media_engine):
+    from schema import NewsRecord
+
+    row = NewsRecord(
+        hora=media_engine._format_gdelt_time(article['seendate'], article['lang']),
+        veiculo=media_engine._extract_veicle_from_url(article['url']),
+        titulo=article['title'] or _url_slug(article['url']).capitalize(),
+        link=article['url'],
+        termos=tuple(article['terms']),
+    ).to_row()
+    seen_at = gdelt_datetime(article['seendate'])
+    if seen_at is not None:
+        row['_cached_at'] = seen_at.isoformat()
+    return row
+
+
+def ingest_directory(directory, workers=None, langs=('pt-br', 'es-uy'),
+                     batch_files=INGEST_BATCH_FILES, batch_size=INGEST_BATCH_SIZE):
+    """
+    Ingere todos os arquivos de `directory` com um pool de processos e grava
+    as correspondências no armazenamento de notícias a cada `batch_files`
+    arquivos concluídos ou `batch_size` artigos. O armazenamento deduplica
+    por link (o mesmo artigo aparece em vários arquivos de 15 minutos).
+    Retorna o relatório {'files', 'rows', 'matches', 'stored', 'batches', 'errors'}.
+    """
+    import media_engine
+
+    groups = {'Busca': list(media_engine.SEARCH_TERMS), **media_engine.WATCHLIST.groups}
+    report = {'files': 0, 'rows': 0, 'matches': 0, 'stored': 0, 'batches': 0, 'errors': []}
+    pending = []
+    pending_files = 0
+
+    def flush():
+        if pending:
+            report['stored'] += media_engine.backfill_news(pending)
+            report['batches'] += 1
+            pending.clear()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(ingest_file, path, groups, tuple(langs)): path
+            for path in export_files(directory)
+        }
+        for future in as_completed(futures):
+            path = futures.pop(future)
+            try:
+                rows, matches = future.result()
+            except Exception as e:
+                report['errors'].append(f"{os.path.basename(path)}: {e}")
+                continue
+            report['files'] += 1
+            report['rows'] += rows
+            report['matches'] += len(matches)
+            pending.extend(_backfill_row(article, media_engine) for article in matches)
+            pending_files += 1
+            if pending_files >= batch_files or len(pending) >= batch_size:
+                flush()
+                pending_files = 0
+    flush()
+    return report
+
+
+def add_ingest_arguments(parser):
+    """Registra os argumentos do subcomando `ingest-gdelt`."""
+    parser.add_argument('directory', help='diretório com os arquivos de exportação da GDELT')
+    parser.add_argument('--workers', type=int, default=None, help='processos no pool (padrão: CPUs)')
+    parser.add_argument('--batch-files', type=int, default=INGEST_BATCH_FILES,
+                        help='arquivos concluídos por gravação no armazenamento')
+    parser.add_argument('--batch-size', type=int, default=INGEST_BATCH_SIZE,
+                        help='artigos por gravação no armazenamento')
+    parser.add_argument('--lang', dest='langs', action='append', choices=sorted(set(SOURCE_LANGS.values())),
+                        help='idioma(s) de origem (padrão: todos)')
+
+
+def run_ingest(args):
+    """Executa o subcomando `ingest-gdelt` a partir dos argumentos do argparse."""
+    report = ingest_directory(
+        args.directory,
+        workers=args.workers,
+        langs=tuple(args.langs or sorted(set(SOURCE_LANGS.values()))),
+        batch_files=args.batch_files,
+        batch_size=args.batch_size,
+    )
+    print(
+        f"{report['files']} arquivos, {report['rows']} linhas, "
+        f"{report['matches']} notícias, {report['stored']} novas no armazenamento "
+        f"em {report['batches']} lotes"
+    )
+    for error in report['errors']:
+        print(f"ERRO: {error}")
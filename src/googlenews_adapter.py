@@ -0,0 +1,66 @@
+"""
+AgroPulse Media Watch - Adaptador GoogleNews
+Único ponto de contato com a biblioteca GoogleNews (faixa de versões fixada
+em requirements.txt).
+
+Todas as páginas de um termo vêm da busca de notícias do google.com
+(`page_at`, tbm=nws). A biblioteca só aceita `page_at` depois de `search()`,
+que grava a consulta e ainda busca a primeira página em outro endpoint
+(news.google.com, com outra ordenação). O adaptador grava a consulta como
+`search()` faria; como isso depende de um detalhe interno da biblioteca, ele
+recusa versões fora de SUPPORTED_VERSIONS em vez de buscar com a consulta
+errada.
+"""
+
+from functools import lru_cache
+from importlib import metadata
+from urllib.parse import quote
+
+# Versões verificadas (mesma faixa de requirements.txt)
+SUPPORTED_VERSIONS = ('1.6.',)
+
+
+class UnsupportedGoogleNewsVersion(RuntimeError):
+    """Versão instalada da biblioteca fora da faixa verificada."""
+
+
+@lru_cache(maxsize=1)
+def installed_version():
+    """Versão do pacote GoogleNews instalado (None sem metadados, ex.: substituto offline)."""
+    try:
+        return metadata.version('GoogleNews')
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def check_version(version=None):
+    version = installed_version() if version is None else version
+    if version is not None and not version.startswith(SUPPORTED_VERSIONS):
+        raise UnsupportedGoogleNewsVersion(
+            f"GoogleNews {version} não verificado (suportadas: {', '.join(v + 'x' for v in SUPPORTED_VERSIONS)})"
+        )
+
+
+def _client(lang, period):
+    from GoogleNews import GoogleNews
+
+    if lang == 'es-uy':
+        client = GoogleNews(lang='es', region='UY')
+    else:
+        client = GoogleNews(lang='pt', region='BR')
+    client.set_period(period)
+    return client
+
+
+def fetch_page(term, lang='pt-br', period='1d', page=1):
+    """
+    Uma página de resultados com um cliente novo: a instância acumula
+    resultados e grava url/resposta, então nada é compartilhado entre
+    páginas buscadas em paralelo.
+    """
+    check_version()
+    client = _client(lang, period)
+    # Mesmo valor que GoogleNews.search() grava (1.6.x: atributo privado __key),
+    # sem a consulta extra ao news.google.com
+    client._GoogleNews__key = quote(term.encode('utf-8'))
+    return client.page_at(page)
@@ -0,0 +1,433 @@
+"""
+AgroPulse Media Watch - Templates HTML
+CSS dos temas gerado uma única vez por tema (na importação) e minificado, e
+fragmentos HTML (ticker, cards de KPI, cards de rádio, tabela de notícias)
+pré-compilados como templates com escape dos valores. Cada rerun só faz a
+substituição, e o que vai pelo websocket é o HTML compacto.
+"""
+
+import html
+import re
+from string import Template
+
+# ============================================
+# TEMAS VISUAIS
+# ============================================
+THEMES = {
+    'dark': {
+        'name': '🌙 Dark',
+        'bg_primary': '#0E1117',
+        'bg_secondary': '#1A1F2E',
+        'bg_card': '#151922',
+        'accent': '#00FF88',
+        'text_primary': '#FAFAFA',
+        'text_secondary': '#A0AEC0',
+        'text_muted': '#718096',
+        'border': '#2D3748',
+        'negative': '#FF4444',
+        'chart_bg': '#0E1117',
+    },
+    'grey': {
+        'name': '🌫️ Grey',
+        'bg_primary': '#2D3748',
+        'bg_secondary': '#4A5568',
+        'bg_card': '#3D4A5C',
+        'accent': '#48BB78',
+        'text_primary': '#F7FAFC',
+        'text_secondary': '#CBD5E0',
+        'text_muted': '#A0AEC0',
+        'border': '#5A6A7A',
+        'negative': '#FC8181',
+        'chart_bg': '#2D3748',
+    },
+    'white': {
+        'name': '☀️ White',
+        'bg_primary': '#FFFFFF',
+        'bg_secondary': '#F7FAFC',
+        'bg_card': '#EDF2F7',
+        'accent': '#38A169',
+        'text_primary': '#1A202C',
+        'text_secondary': '#4A5568',
+        'text_muted': '#718096',
+        'border': '#E2E8F0',
+        'negative': '#E53E3E',
+        'chart_bg': '#FFFFFF',
+    }
+}
+
+# ============================================
+# CSS DOS TEMAS
+# ============================================
+# Placeholders $chave vêm do dicionário do tema
+_THEME_CSS = Template("""
+    /* Remove padding superior e configura fundo */
+    .stApp {
+        background-color: $bg_primary;
+    }
+
+    .block-container {
+        padding-top: 3.5rem !important;
+        padding-bottom: 1rem !important;
+    }
+
+    /* Esconde sidebar completamente */
+    [data-testid="stSidebar"] {
+        display: none !important;
+    }
+
+    [data-testid="stSidebarCollapsedControl"] {
+        display: none !important;
+    }
+
+    button[kind="header"] {
+        display: none !important;
+    }
+
+    /* Header do Streamlit - ajusta altura para não sobrepor */
+    header[data-testid="stHeader"] {
+        background-color: $bg_primary;
+        height: 3rem;
+    }
+
+    /* Ticker de rolagem */
+    .ticker-wrapper {
+        background: linear-gradient(90deg, $bg_secondary 0%, $bg_primary 50%, $bg_secondary 100%);
+        border-bottom: 2px solid $accent;
+        padding: 10px 0;
+        margin-bottom: 20px;
+        margin-top: 10px;
+        overflow: hidden;
+    }
+
+    .ticker-content {
+        color: $accent;
+        font-size: 1.1rem;
+        font-weight: 600;
+        white-space: nowrap;
+        animation: scroll-left 20s linear infinite;
+    }
+
+    @keyframes scroll-left {
+        0% { transform: translateX(100%); }
+        100% { transform: translateX(-100%); }
+    }
+
+    /* Cards de KPI */
+    .kpi-card {
+        background: linear-gradient(135deg, $bg_secondary 0%, $bg_card 100%);
+        border: 1px solid $border;
+        border-radius: 12px;
+        padding: 20px;
+        text-align: center;
+        transition: border-color 0.3s;
+    }
+
+    .kpi-card:hover {
+        border-color: $accent;
+    }
+
+    .kpi-value {
+        color: $accent;
+        font-size: 2.5rem;
+        font-weight: 700;
+        margin: 0;
+    }
+
+    .kpi-label {
+        color: $text_secondary;
+        font-size: 0.9rem;
+        margin-top: 5px;
+    }
+
+    /* Timeline de Rádio */
+    .radio-card {
+        background: $bg_secondary;
+        border-left: 4px solid $accent;
+        border-radius: 0 8px 8px 0;
+        padding: 12px 15px;
+        margin-bottom: 10px;
+        transition: transform 0.2s;
+    }
+
+    .radio-card:hover {
+        transform: translateX(5px);
+    }
+
+    .radio-card.negativo, .radio-card.negative {
+        border-left-color: $negative;
+        background: linear-gradient(90deg, rgba(255,68,68,0.15) 0%, $bg_secondary 30%);
+    }
+
+    .radio-card.positivo, .radio-card.positive {
+        border-left-color: $accent;
+    }
+
+    .radio-card.neutro, .radio-card.neutral {
+        border-left-color: $text_secondary;
+    }
+
+    .radio-header {
+        display: flex;
+        justify-content: space-between;
+        align-items: center;
+        margin-bottom: 8px;
+    }
+
+    .radio-station {
+        color: $accent;
+        font-weight: 600;
+        font-size: 0.95rem;
+    }
+
+    .radio-time {
+        color: $text_muted;
+        font-size: 0.8rem;
+    }
+
+    .radio-text {
+        color: $text_primary;
+        font-size: 0.9rem;
+        line-height: 1.4;
+        font-style: italic;
+    }
+
+    /* Seções */
+    .section-title {
+        color: $text_primary;
+        font-size: 1.2rem;
+        font-weight: 600;
+        border-bottom: 2px solid $accent;
+        padding-bottom: 8px;
+        margin-bottom: 15px;
+    }
+
+    /* Tabela de notícias */
+    .news-table {
+        background: $bg_secondary;
+        border-radius: 8px;
+        padding: 10px;
+        width: 100%;
+        border-collapse: collapse;
+    }
+
+    .news-table th {
+        background: $bg_card;
+        color: $text_primary;
+        padding: 12px;
+        text-align: left;
+        border-bottom: 2px solid $accent;
+    }
+
+    .news-table td {
+        padding: 10px 12px;
+        border-bottom: 1px solid $border;
+        color: $text_primary;
+    }
+
+    .news-table tr:hover {
+        background: $bg_card;
+    }
+
+    /* Links clicáveis */
+    a {
+        color: $accent !important;
+        text-decoration: none !important;
+    }
+
+    a:hover {
+        text-decoration: underline !important;
+    }
+
+    /* Footer */
+    .footer-container {
+        text-align: center;
+        color: $text_muted;
+        font-size: 0.85rem;
+        border-top: 1px solid $border;
+        padding-top: 20px;
+        margin-top: 30px;
+    }
+
+    .footer-title {
+        color: $accent;
+        font-weight: 700;
+        font-size: 1rem;
+        margin-bottom: 5px;
+    }
+
+    .footer-contact {
+        margin: 15px 0;
+    }
+
+    .footer-contact a {
+        margin: 0 10px;
+        color: $accent !important;
+    }
+
+    .footer-copyright {
+        margin-top: 15px;
+        padding-top: 15px;
+        border-top: 1px solid $border;
+        color: $text_muted;
+    }
+
+    /* Barra de controles no topo */
+    .top-controls {
+        display: flex;
+        justify-content: flex-end;
+        align-items: center;
+        gap: 8px;
+        padding: 0 0 15px 0;
+        margin-top: -10px;
+    }
+    .control-btn {
+        background: $bg_secondary;
+        border: 1px solid $border;
+        border-radius: 20px;
+        padding: 6px 14px;
+        color: $text_primary;
+        font-size: 0.85rem;
+        font-weight: 500;
+        cursor: pointer;
+        transition: all 0.2s ease;
+        display: inline-flex;
+        align-items: center;
+        gap: 6px;
+    }
+    .control-btn:hover {
+        background: $accent;
+        color: $bg_primary;
+        transform: scale(1.05);
+    }
+    /* Esconde labels dos botões Streamlit */
+    .stButton > button {
+        background: $bg_secondary !important;
+        border: 1px solid $border !important;
+        border-radius: 20px !important;
+        color: $text_primary !important;
+        font-weight: 500 !important;
+        padding: 0.4rem 1rem !important;
+        transition: all 0.2s ease !important;
+    }
+    .stButton > button:hover {
+        background: $accent !important;
+        color: $bg_primary !important;
+        border-color: $accent !important;
+    }
+    .stButton > button:focus {
+        box-shadow: none !important;
+    }
+    div[data-testid="stHorizontalBlock"] > div:last-child {
+        display: flex;
+        justify-content: flex-end;
+    }
+    .alert-badge {
+        float: right;
+        background: $bg_secondary;
+        border: 1px solid $negative;
+        border-radius: 20px;
+        padding: 6px 14px;
+        color: $text_primary;
+        font-size: 0.85rem;
+        font-weight: 600;
+    }
+    .trend-chip {
+        display: inline-block;
+        background: $bg_secondary;
+        border: 1px solid $border;
+        border-radius: 16px;
+        padding: 4px 12px;
+        margin: 0 6px 6px 0;
+        color: $text_primary;
+        font-size: 0.85rem;
+    }
+    .trend-chip b {
+        color: $accent;
+    }
+""")
+
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_CSS_SPACE = re.compile(r'\s+')
+_CSS_PUNCT = re.compile(r'\s*([{};:,>])\s*')
+
+
+def minify_css(css):
+    """Remove comentários, quebras de linha e espaços em volta da pontuação."""
+    css = _CSS_COMMENT.sub('', css)
+    css = _CSS_SPACE.sub(' ', css)
+    css = _CSS_PUNCT.sub(r'\1', css)
+    return css.replace(';}', '}').strip()
+
+
+# Folha de estilo de cada tema, pronta para st.markdown (montada uma vez por processo)
+THEME_STYLESHEETS = {
+    name: f"<style>{minify_css(_THEME_CSS.substitute(theme))}</style>"
+    for name, theme in THEMES.items()
+}
+
+
+def theme_stylesheet(theme_name):
+    return THEME_STYLESHEETS[theme_name]
+
+
+# ============================================
+# FRAGMENTOS HTML
+# ============================================
+class Raw(str):
+    """Valor já em HTML: entra no template sem escape."""
+
+
+def render(template, **values):
+    """Substitui os placeholders escapando tudo que não for Raw."""
+    return template.substitute({
+        key: value if isinstance(value, Raw) else html.escape(str(value))
+        for key, value in values.items()
+    })
+
+
+TICKER = Template(
+    '<div class="ticker-wrapper"><div class="ticker-content">'
+    '$ticker &nbsp;&nbsp;&nbsp;•&nbsp;&nbsp;&nbsp; 📊 $coverage &nbsp;&nbsp;&nbsp;•&nbsp;&nbsp;&nbsp; $ticker'
+    '</div></div>'
+)
+
+KPI_CARD = Template(
+    '<div class="kpi-card"><p class="kpi-value">$value</p><p class="kpi-label">$label</p></div>'
+)
+
+RADIO_CARD = Template(
+    '<div class="radio-card $sentiment_class"><div class="radio-header">'
+    '<span class="radio-station">🎙️ $station</span>'
+    '<span class="radio-time">$time $icon</span></div>'
+    '<p class="radio-text">"$text"</p></div>'
+)
+
+NEWS_LINK = Template('<a href="$href" target="_blank">$title</a>')
+NEWS_ROW = Template('<tr><td>$hour</td><td>$vehicle</td><td>$title</td></tr>')
+NEWS_TABLE = Template(
+    '<table border="1" class="dataframe news-table"><thead><tr style="text-align: right;">'
+    '<th>$hour</th><th>$vehicle</th><th>$title</th></tr></thead><tbody>$rows</tbody></table>'
+)
+
+
+def news_link(title, link):
+    """Título como link clicável (ou só o título escapado, se o link não for válido)."""
+    # Links ausentes chegam do DataFrame como NaN/None: só str vira href
+    if isinstance(link, str) and link and link != '#' and not link.startswith('https://exemplo.com'):
+        return Raw(render(NEWS_LINK, href=link, title=title))
+    return Raw(html.escape(str(title)))
+
+
+def news_table(headers, rows):
+    """
+    Tabela de notícias no mesmo formato de DataFrame.to_html: `headers` são
+    os rótulos (hora, veículo, título) e `rows` tuplas (hora, veículo, título
+    já renderizado como link).
+    """
+    body = ''.join(
+        render(NEWS_ROW, hour=hour, vehicle=vehicle, title=Raw(title))
+        for hour, vehicle, title in rows
+    )
+    hour, vehicle, title = headers
+    return render(NEWS_TABLE, hour=hour, vehicle=vehicle, title=title, rows=Raw(body))
+
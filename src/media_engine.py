@@ -9,14 +9,222 @@ from faker import Faker
 import random
 import json
 import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, wait
+from email.utils import parsedate_to_datetime
+from urllib.error import HTTPError
 from urllib.parse import quote_plus
 from urllib.request import Request, urlopen
 
+try:
+    import fcntl
+except ImportError:  # Windows: exclusão só entre threads do processo
+    fcntl = None
+
+import googlenews_adapter
+from request_cache import SingleFlightCache
+from replica import ReplicaCoordinator
+from watchlist import load_watchlist, load_recent_alerts, record_alerts
+from tagging import TagIndex, TopicTagger
+from clustering import NearDuplicateIndex
+from trending import TrendingTerms
+from similarity import TfidfIndex
+from text_utils import classify_sentiment, normalize_text
+from enrichment import ArticleEnricher, ArticleStore
+from schema import (
+    NewsRecord,
+    RadioRecord,
+    SocialRecord,
+    apply_news_schema,
+    news_frame,
+    radio_frame,
+    social_frame,
+)
+
 # Inicializa Faker com locale português
 fake = Faker('pt_BR')
 
+# Diretório de dados (pode ser redirecionado via AGROPULSE_DATA_DIR, ex.: testes de carga)
+DATA_DIR = os.environ.get(
+    'AGROPULSE_DATA_DIR',
+    os.path.join(os.path.dirname(__file__), '..', 'data')
+)
+
 # Caminho para cache de notícias
-NEWS_CACHE_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'news_cache.json')
+NEWS_CACHE_FILE = os.path.join(DATA_DIR, 'news_cache.json')
+
+# Watchlist (termos monitorados) e log de alertas
+WATCHLIST_FILE = os.path.join(DATA_DIR, 'watchlist.json')
+ALERTS_FILE = os.path.join(DATA_DIR, 'alerts.jsonl')
+# Feeds RSS/Atom dos veículos ({"feeds": [{"name", "url", "lang"}]}); opcional
+FEEDS_FILE = os.path.join(DATA_DIR, 'feeds.json')
+WATCHLIST = load_watchlist(WATCHLIST_FILE)
+TOPIC_TAGGER = TopicTagger()
+# Clusters de quase-duplicatas (mesma pauta em vários veículos/idiomas)
+NEWS_CLUSTERS = NearDuplicateIndex()
+# Índice TF-IDF para cobertura relacionada (títulos e transcrições)
+SIMILARITY_INDEX = TfidfIndex()
+# Versão dos dados já refletida nos índices em memória (None = ainda não semeados)
+_indexes_version = None
+_indexes_lock = threading.Lock()
+# Bytes do arquivo de transcrições já refletidos nos índices
+_radio_offset = 0
+# Termos em alta nos títulos e transcrições (memória limitada, janela deslizante)
+TRENDING = TrendingTerms()
+RADIO_ALERT_WINDOW_SECONDS = 1800
+# Transcrições reais (ingestão do spool de rádio); sem elas, a Rádio Escuta é simulada
+RADIO_TRANSCRIPTS_FILE = os.path.join(DATA_DIR, 'radio_transcripts.jsonl')
+RADIO_FEED_LIMIT = 50
+_recent_radio_alerts = {}
+
+# Termos monitorados nas fontes externas
+SEARCH_TERMS = ['Agro en Punta', 'Agronegócio Uruguai', 'Expoagro', 'Agricultura Mercosul']
+
+# Cache compartilhado entre sessões (processo) para consultas às fontes externas.
+# Chave: (fonte, consulta, idioma, período). Requisições idênticas e simultâneas
+# são coalescidas em uma única chamada.
+UPSTREAM_CACHE = SingleFlightCache(max_entries=256, ttl=600)
+
+# GDELT: termos agrupados em consultas OR, limitadas pelo tamanho da URL
+GDELT_API_URL = 'https://api.gdeltproject.org/api/v2/doc/doc'
+GDELT_MAX_URL_LENGTH = 2000
+GDELT_MAX_BATCH_TERMS = 8
+GDELT_RECORDS_PER_TERM = 20
+GDELT_MAX_RECORDS = 250  # limite da API
+# Em 'Termos': artigo de um lote cujo termo não aparece no título nem na URL
+UNKNOWN_TERM = '?'
+
+# Prazo padrão (segundos) para a coleta usada pelo dashboard
+FETCH_DEADLINE_SECONDS = 3
+
+# Pool compartilhado para buscar fontes/termos em paralelo
+FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix='agropulse-fetch')
+
+# Paginação do GoogleNews: profundidade máxima por termo e páginas buscadas em
+# paralelo (pool próprio: as páginas são submetidas de dentro do FETCH_EXECUTOR)
+GOOGLENEWS_MAX_PAGES = int(os.environ.get('AGROPULSE_GOOGLENEWS_PAGES', '3'))
+GOOGLENEWS_PAGE_WORKERS = 2
+PAGE_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='agropulse-pages')
+# Maior janela de retenção do cache (Agro en Punta): itens mais antigos não são exibidos
+HARVEST_MAX_AGE = timedelta(days=90)
+# Links já armazenados (parada antecipada da paginação)
+_known_links = set()
+
+# Serializa leitura-mescla-escrita do cache em disco entre threads/sessões
+# (entre processos, via _news_store_lock)
+_NEWS_CACHE_LOCK = threading.Lock()
+
+# Enriquecimento opcional (AGROPULSE_ENRICH=1): corpo dos artigos novos baixado
+# em segundo plano, com cache em disco endereçado por conteúdo
+ENRICH_ARTICLES = os.environ.get('AGROPULSE_ENRICH', '0') == '1'
+ARTICLES_DIR = os.path.join(DATA_DIR, 'articles')
+ARTICLE_ENRICHER = ArticleEnricher(ArticleStore(ARTICLES_DIR))
+ENRICH_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='agropulse-enrich-store')
+# Campos do enriquecimento, preservados quando o link volta em uma nova coleta
+# (o corpo fica só no ArticleStore; o item guarda o digest em 'CorpoHash')
+BODY_FIELDS = ('CorpoHash', 'Sentimento')
+
+# Modo multi-réplica: apenas a réplica com o lease busca fontes e grava o cache;
+# as demais leem o armazenamento compartilhado em DATA_DIR.
+MULTI_REPLICA = os.environ.get('AGROPULSE_MULTI_REPLICA', '0') == '1'
+COORDINATION_DB = os.path.join(DATA_DIR, 'coordination.db')
+LEADER_REFRESH_SECONDS = 600  # Mesmo intervalo do cache do dashboard
+
+_coordinator = None
+_coordinator_lock = threading.Lock()
+# Fora do modo multi-réplica a versão fica em disco: processos auxiliares
+# (ingestão GDELT, spool de rádio, enriquecimento) também a incrementam
+DATA_VERSION_FILE = os.path.join(DATA_DIR, 'data_version')
+# Processos auxiliares (CLI, API de leitura) não disputam o lease
+_replica_read_only = os.environ.get('AGROPULSE_REPLICA_ROLE', '') == 'reader'
+
+
+def use_read_only_replica():
+    """
+    Marca o processo como não participante da eleição: lê a versão dos dados
+    compartilhados, mas nunca obtém o lease nem roda a atualização periódica.
+    Chamar antes de qualquer acesso ao coordenador.
+    """
+    global _replica_read_only, _coordinator
+    with _coordinator_lock:
+        _replica_read_only = True
+        if _coordinator is not None and _coordinator.participate:
+            _coordinator.release()
+            _coordinator = None
+
+
+def get_coordinator():
+    """
+    Retorna o coordenador de réplicas (singleton do processo) ou None fora do
+    modo multi-réplica. Na primeira chamada inicia o heartbeat do lease e a
+    rotina de atualização periódica executada pelo líder.
+    """
+    global _coordinator
+    if not MULTI_REPLICA:
+        return None
+    with _coordinator_lock:
+        if _coordinator is None and _replica_read_only:
+            _coordinator = ReplicaCoordinator(COORDINATION_DB, participate=False)
+        elif _coordinator is None:
+            _coordinator = ReplicaCoordinator(COORDINATION_DB)
+            _coordinator.start_heartbeat()
+            threading.Thread(
+                target=_leader_refresh_loop, name='agropulse-leader-refresh', daemon=True
+            ).start()
+    return _coordinator
+
+
+def _leader_refresh_loop():
+    """Enquanto líder, atualiza as notícias dos dois idiomas periodicamente."""
+    while True:
+        try:
+            if _coordinator is not None and _coordinator.is_leader():
+                for lang in ('pt-br', 'es-uy'):
+                    get_web_news(lang)
+        except Exception as e:
+            # Uma falha não pode encerrar a rotina: o líder seguiria sem atualizar
+            print(f"Erro na atualização periódica do líder: {e}")
+        time.sleep(LEADER_REFRESH_SECONDS)
+
+
+def is_fetch_leader():
+    """Indica se este processo deve buscar fontes externas e gravar o cache."""
+    coordinator = get_coordinator()
+    return coordinator is None or coordinator.is_leader()
+
+
+def get_data_version():
+    """
+    Versão dos dados de notícias e rádio. Muda a cada gravação do
+    armazenamento (em qualquer réplica ou processo) e serve como chave de
+    invalidação.
+    """
+    coordinator = get_coordinator()
+    if coordinator is not None:
+        return coordinator.data_version()
+    try:
+        with open(DATA_VERSION_FILE, 'r', encoding='utf-8') as f:
+            return int(f.read().strip() or 0)
+    except (FileNotFoundError, ValueError):
+        return 0
+
+
+def _bump_data_version():
+    """Incrementa a versão dos dados (chamar com _news_store_lock)."""
+    coordinator = get_coordinator()
+    if coordinator is not None:
+        return coordinator.bump_version()
+    version = get_data_version() + 1
+    _ensure_cache_dir()
+    tmp_file = f'{DATA_VERSION_FILE}.{os.getpid()}.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        f.write(str(version))
+    os.replace(tmp_file, DATA_VERSION_FILE)
+    return version
 
 def _ensure_cache_dir():
     """Garante que o diretório de cache existe."""
@@ -25,6 +233,26 @@ def _ensure_cache_dir():
         os.makedirs(cache_dir, exist_ok=True)
 
 
+@contextmanager
+def _news_store_lock():
+    """
+    Exclusão mútua sobre o armazenamento em DATA_DIR: entre threads pelo
+    _NEWS_CACHE_LOCK e entre processos (dashboard, ingestão GDELT,
+    enriquecimento, spool de rádio) por flock em `news_cache.json.lock`.
+    """
+    with _NEWS_CACHE_LOCK:
+        if fcntl is None:
+            yield
+            return
+        _ensure_cache_dir()
+        with open(f'{NEWS_CACHE_FILE}.lock', 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
 def save_news_to_cache(news_df):
     """
     Salva notícias em cache JSON para persistência.
@@ -33,8 +261,46 @@ def save_news_to_cache(news_df):
     if news_df.empty:
         return
     
+    if not is_fetch_leader():
+        # Réplicas seguidoras nunca gravam no armazenamento compartilhado
+        return
+    
     _ensure_cache_dir()
     
+    with _news_store_lock():
+        has_new_links = _merge_news_into_cache(news_df.to_dict('records'))
+        if has_new_links:
+            _bump_data_version()
+    if has_new_links and ENRICH_ARTICLES:
+        ENRICH_EXECUTOR.submit(enrich_news_store)
+
+
+def backfill_news(rows):
+    """
+    Grava notícias históricas (ingestão em lote explícita) no armazenamento,
+    em uma única leitura e gravação qualquer que seja o número de linhas.
+    Cada linha traz o próprio `_cached_at` (data da fonte); links já
+    armazenados mantêm o item e a data mais antiga. Não gera alertas nem
+    conta em tendências, e grava mesmo fora da liderança. Retorna o número
+    de links novos.
+    """
+    if not rows:
+        return 0
+    _ensure_cache_dir()
+    with _news_store_lock():
+        new_links = _merge_news_into_cache(rows, live=False)
+        if new_links:
+            _bump_data_version()
+    return new_links
+
+
+def _merge_news_into_cache(news_dict, live=True):
+    """
+    Mescla os registros (dicts) no cache em disco (chamar com
+    _news_store_lock). Retorna o número de links novos (nova versão de dados
+    quando > 0). Com `live=False` (carga histórica) os itens novos não
+    alimentam tendências nem alertas.
+    """
     # Carrega cache existente
     existing_cache = {}
     if os.path.exists(NEWS_CACHE_FILE):
@@ -44,32 +310,283 @@ def save_news_to_cache(news_df):
         except Exception:
             existing_cache = {}
     
-    # Converte DataFrame para dict
-    news_dict = news_df.to_dict('records')
+    # Índices de clusters e similaridade em dia com o armazenamento antes de
+    # classificar os itens novos
+    sync_indexes()
     
-    # Adiciona timestamp de armazenamento se não tiver
+    # Adiciona timestamp de armazenamento e classifica via watchlist
     now = datetime.now().isoformat()
+    annotate_news_records(news_dict)
     for item in news_dict:
         if '_cached_at' not in item:
             item['_cached_at'] = now
-        if 'Categoria' not in item:
-            # Detecta categoria automaticamente
-            titulo = str(item.get('Título', '')).lower()
-            item['Categoria'] = 'Agro en Punta' if 'agro en punta' in titulo else 'Outros'
     
     # Mescla com cache existente (evitando duplicatas por link)
     cached_links = {item.get('Link', ''): item for item in existing_cache.get('news', [])}
+    new_items = []
     for item in news_dict:
         link = item.get('Link', '')
         if link and link != '#':
+            previous = cached_links.get(link)
+            if previous is None:
+                new_items.append(item)
+            elif not live:
+                # Carga histórica: o item armazenado prevalece, com os termos
+                # somados e a data mais antiga em que o link foi visto
+                _merge_terms(item, previous)
+                previous['_cached_at'] = min(previous.get('_cached_at', item['_cached_at']), item['_cached_at'])
+                continue
+            else:
+                _merge_terms(previous, item)
+                if previous.get('CorpoHash'):
+                    _carry_body(previous, item)
             cached_links[link] = item
+    _known_links.update(cached_links)
+    
+    if live:
+        # Só itens novos alimentam o detector de tendências (re-buscas não recontam)
+        for item in new_items:
+            TRENDING.add_text(item.get('Título', ''))
+        
+        # Alertas apenas para itens que entraram agora no armazenamento
+        record_alerts(ALERTS_FILE, [
+            {'kind': 'news', 'source': item.get('Veículo', ''), 'text': item.get('Título', ''),
+             'link': item.get('Link', ''), 'terms': item['Alertas']}
+            for item in new_items if item.get('Alertas')
+        ])
     
-    # Salva cache atualizado
+    if _write_news_store(cached_links):
+        return len(new_items)
+    return 0
+
+
+def _merge_terms(previous, item):
+    """Une os termos de busca de uma coleta anterior do mesmo link."""
+    termos = list(dict.fromkeys(_search_terms(previous) + _search_terms(item)))
+    if termos:
+        item['Termos'] = termos
+
+
+def _carry_body(previous, item):
+    """Mantém o corpo (e as tags vindas dele) de um item já enriquecido."""
+    for field in BODY_FIELDS:
+        if field in previous:
+            item[field] = previous[field]
+    tags = item.get('Tags') or []
+    item['Tags'] = tags + [tag for tag in previous.get('Tags') or [] if tag not in tags]
+
+
+def _write_news_store(cached_links):
+    """
+    Grava o armazenamento {link: item} com o índice tag → links (chamar com
+    _news_store_lock). Retorna False se a gravação falhar.
+    """
+    # Índice invertido tag → links, mantido junto do armazenamento
+    tag_index = TagIndex()
+    for link, item in cached_links.items():
+        # Armazenamentos antigos guardavam o corpo também no item
+        item.pop('Corpo', None)
+        tag_index.add(link, item.get('Tags') or [])
+    
+    # Salva cache atualizado (arquivo temporário + rename atômico, para que
+    # leitores nunca vejam um JSON pela metade)
+    tmp_file = f'{NEWS_CACHE_FILE}.{os.getpid()}.tmp'
     try:
-        with open(NEWS_CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump({'news': list(cached_links.values())}, f, ensure_ascii=False, indent=2)
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(
+                {'news': list(cached_links.values()), 'tag_index': tag_index.to_dict()},
+                f, ensure_ascii=False, indent=2
+            )
+        os.replace(tmp_file, NEWS_CACHE_FILE)
+        return True
     except Exception as e:
         print(f"Erro ao salvar cache: {e}")
+        return False
+
+
+def enrich_news_store(limit=None, force=False):
+    """
+    Baixa o corpo dos itens do armazenamento ainda sem 'CorpoHash' (no máximo
+    `limit`), grava no item o digest do corpo (o texto fica no ArticleStore),
+    soma às 'Tags' os tópicos do texto, classifica o 'Sentimento' pelo texto
+    e reindexa o item na cobertura relacionada. `force` grava mesmo fora da liderança (execução
+    explícita pela linha de comando). Retorna o número de itens enriquecidos.
+    """
+    if not (force or is_fetch_leader()) or not os.path.exists(NEWS_CACHE_FILE):
+        return 0
+    with open(NEWS_CACHE_FILE, 'r', encoding='utf-8') as f:
+        pending = [
+            item['Link'] for item in json.load(f).get('news', [])
+            if item.get('Link', '#') != '#' and not item.get('CorpoHash')
+        ]
+    bodies = ARTICLE_ENRICHER.enrich(pending[:limit])
+    if not bodies:
+        return 0
+    
+    with _news_store_lock():
+        # Relê: o armazenamento pode ter mudado durante os downloads (inclusive
+        # gravado por outro processo)
+        with open(NEWS_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cached_links = {item.get('Link', ''): item for item in json.load(f).get('news', [])}
+        enriched = []
+        for link, body in bodies.items():
+            item = cached_links.get(link)
+            if item is None or not body:
+                continue
+            item['CorpoHash'] = ARTICLE_ENRICHER.store.digest(link)
+            tags = item.get('Tags') or []
+            item['Tags'] = tags + [tag for tag in TOPIC_TAGGER.tag(body) if tag not in tags]
+            item['Sentimento'] = classify_sentiment(f"{item.get('Título', '')}\n{body}")
+            enriched.append((item, body))
+        if enriched and _write_news_store(cached_links):
+            _bump_data_version()
+        else:
+            enriched = []
+    for item, body in enriched:
+        _index_for_similarity(item['Link'], item, replace=True, body=body)
+    return len(enriched)
+
+
+def _search_terms(item):
+    """Termos de busca atribuídos ao item ('Termos'), sem o marcador de desconhecido."""
+    termos = item.get('Termos')
+    if isinstance(termos, str) or not hasattr(termos, '__iter__'):
+        return []
+    return [term for term in termos if isinstance(term, str) and term and term != UNKNOWN_TERM]
+
+
+def annotate_news_records(records):
+    """
+    Casa cada título com a watchlist (uma passada no autômato) e grava em
+    'Alertas' os termos encontrados. Sem 'Categoria', classifica como
+    'Agro en Punta' quando há termo do grupo do evento. Atribui também as
+    tags de tópico em 'Tags' (a categoria do evento entra como tag) e o
+    cluster de quase-duplicatas em 'Cluster'. Os termos de busca atribuídos
+    ('Termos') contam como texto do item: a fonte casou o termo no artigo
+    mesmo quando ele não aparece no título.
+    """
+    for item in records:
+        titulo = item.get('Título', '')
+        termos = _search_terms(item)
+        matches = WATCHLIST.match(titulo)
+        for term in termos:
+            matches.extend(WATCHLIST.match(term))
+        item['Alertas'] = list(dict.fromkeys(m['term'] for m in matches))
+        categoria = item.get('Categoria')
+        if not isinstance(categoria, str) or not categoria:
+            is_event = any(m['group'] == 'Evento' for m in matches)
+            item['Categoria'] = 'Agro en Punta' if is_event else 'Outros'
+        found = set(TOPIC_TAGGER.tag(titulo))
+        for term in termos:
+            found.update(TOPIC_TAGGER.tag(term))
+        tags = [tag for tag in TOPIC_TAGGER.tag_names if tag in found]
+        if item['Categoria'] == 'Agro en Punta' and 'Agro en Punta' not in tags:
+            tags.insert(0, 'Agro en Punta')
+        item['Tags'] = tags
+        cluster = item.get('Cluster')
+        item_id = item.get('Link') or titulo
+        item['Cluster'] = NEWS_CLUSTERS.add(
+            item_id, titulo, cluster if isinstance(cluster, str) else None
+        )
+        _index_for_similarity(item_id, item)
+    return records
+
+
+def _item_body(item):
+    """Corpo de um item enriquecido, lido do ArticleStore pelo 'CorpoHash' ('' sem corpo)."""
+    digest = item.get('CorpoHash')
+    if not isinstance(digest, str) or not digest:
+        return ''
+    try:
+        return ARTICLE_ENRICHER.store.read(digest)
+    except (OSError, EOFError):
+        return ''  # objeto corrompido: indexa só o título
+
+
+def _similarity_text(item, body=None):
+    """Título e, nos itens enriquecidos, o corpo do artigo."""
+    titulo = item.get('Título', '')
+    body = _item_body(item) if body is None else body
+    return f"{titulo}\n{body}" if body else titulo
+
+
+def _index_for_similarity(item_id, item, replace=False, body=None):
+    if not replace and item_id in SIMILARITY_INDEX:
+        return  # já indexado: não relê o corpo do disco
+    SIMILARITY_INDEX.add(item_id, _similarity_text(item, body), {
+        'kind': 'news',
+        'title': item.get('Título', ''),
+        'source': item.get('Veículo', ''),
+        'link': item.get('Link', ''),
+    }, replace=replace)
+
+
+def _seed_indexes(items):
+    """Indexa itens do armazenamento nos clusters e na similaridade (ids já vistos são ignorados)."""
+    for item in items:
+        item_id = item.get('Link') or item.get('Título', '')
+        cluster = item.get('Cluster')
+        NEWS_CLUSTERS.add(item_id, item.get('Título', ''), cluster if isinstance(cluster, str) else None)
+        _index_for_similarity(item_id, item)
+
+
+def sync_indexes():
+    """
+    Alinha os índices em memória com o armazenamento quando a versão dos
+    dados muda. Cobre as réplicas seguidoras (nunca mesclam coletas), a
+    partida a frio pelo snapshot, em que nada passou pela mescla, e as
+    transcrições gravadas pela ingestão de rádio em outro processo.
+    """
+    global _indexes_version
+    version = get_data_version()
+    if version == _indexes_version:
+        return
+    with _indexes_lock:
+        if version == _indexes_version:
+            return
+        news_df = load_cached_news(include_all=True)
+        if not news_df.empty:
+            _seed_indexes(news_df.to_dict('records'))
+        _sync_radio_index()
+        _indexes_version = version
+
+
+def find_similar(item_id, k=5):
+    """
+    Cobertura relacionada: top-k itens (notícias e transcrições de rádio) mais
+    próximos de `item_id` (Link da notícia ou id da transcrição) por cosseno
+    TF-IDF. Retorna lista de dicts com 'id', 'score', 'kind', 'title',
+    'source' e 'link'. Na primeira consulta (e a cada nova versão dos dados)
+    semeia o índice a partir do armazenamento.
+    """
+    sync_indexes()
+    return [
+        {'id': neighbour, 'score': round(score, 3), **(payload or {})}
+        for neighbour, score, payload in SIMILARITY_INDEX.find_similar(item_id, k)
+    ]
+
+
+def load_tag_index():
+    """Índice tag → links gravado junto do armazenamento de notícias."""
+    if not os.path.exists(NEWS_CACHE_FILE):
+        return TagIndex()
+    try:
+        with open(NEWS_CACHE_FILE, 'r', encoding='utf-8') as f:
+            return TagIndex(json.load(f).get('tag_index', {}))
+    except Exception as e:
+        print(f"Erro ao carregar índice de tags: {e}")
+        return TagIndex()
+
+
+def get_recent_alerts(limit=50):
+    """Alertas mais recentes da watchlist (notícias e rádio), mais novo primeiro."""
+    return load_recent_alerts(ALERTS_FILE, limit)
+
+
+def get_trending_terms(k=10):
+    """Termos em alta agora (contagem na janela atual e crescimento sobre a base)."""
+    sync_indexes()
+    return TRENDING.trending(k)
 
 
 def load_cached_news(include_all=False):
@@ -93,88 +610,82 @@ def load_cached_news(include_all=False):
         if not news_list:
             return pd.DataFrame()
         
-        df = pd.DataFrame(news_list)
+        df = news_frame(news_list)
         
         if include_all:
             return df
+        # Armazenamentos antigos: o dashboard não exibe o corpo comprimido
+        df = df.drop(columns=['Corpo'], errors='ignore')
         
-        # Filtra por período baseado na categoria
+        # Filtra por período baseado na categoria (vetorizado sobre colunas tipadas)
         now = datetime.now()
-        filtered = []
-        
-        for _, row in df.iterrows():
-            categoria = row.get('Categoria', 'Outros')
-            cached_at = row.get('_cached_at')
-            
-            if cached_at:
-                try:
-                    cached_dt = datetime.fromisoformat(cached_at)
-                except ValueError:
-                    cached_dt = now
-            else:
-                cached_dt = now
-            
-            idade_dias = (now - cached_dt).days
-            
-            if categoria == 'Agro en Punta' and idade_dias <= 90:  # 3 meses
-                filtered.append(row)
-            elif categoria != 'Agro en Punta' and idade_dias <= 30:  # 1 mês
-                filtered.append(row)
-        
-        return pd.DataFrame(filtered) if filtered else pd.DataFrame()
+        if '_cached_at' in df.columns:
+            cached_dt = pd.to_datetime(df['_cached_at'], errors='coerce').fillna(now)
+        else:
+            cached_dt = pd.Series(now, index=df.index)
+        idade_dias = (now - cached_dt).dt.days
+        if 'Categoria' in df.columns:
+            is_agro = df['Categoria'] == 'Agro en Punta'
+        else:
+            is_agro = pd.Series(False, index=df.index)
+        keep = (is_agro & (idade_dias <= 90)) | (~is_agro & (idade_dias <= 30))  # 3 meses / 1 mês
+        return df[keep].reset_index(drop=True)
     
     except Exception as e:
         print(f"Erro ao carregar cache: {e}")
         return pd.DataFrame()
 
 
-def get_web_news(lang='pt-br'):
+def get_web_news(lang='pt-br', deadline=None):
     """
     Busca notícias reais usando GoogleNews para termos relacionados ao agronegócio.
     Retorna DataFrame com: Hora, Veículo, Título, Link
     
+    Cada par (fonte, termo) é buscado em paralelo. Com `deadline`, retorna apenas
+    o que terminou dentro do prazo; as fontes atrasadas ficam listadas em
+    `df.attrs['timed_out_sources']` e seus resultados são mesclados no cache
+    em segundo plano quando chegarem.
+    
     Args:
         lang: Idioma para fallback simulado ('pt-br' ou 'es-uy')
+        deadline: Orçamento total em segundos (None = aguarda todas as fontes)
     """
+    if not is_fetch_leader():
+        # Réplica seguidora: lê o armazenamento compartilhado gravado pelo líder
+        cached = load_cached_news(include_all=False)
+        return cached if not cached.empty else _simulate_web_news(lang)
+    
     try:
-        from GoogleNews import GoogleNews
+        from GoogleNews import GoogleNews  # noqa: F401 - falha cedo se indisponível
         
-        # Configura GoogleNews baseado no idioma
-        if lang == 'es-uy':
-            googlenews = GoogleNews(lang='es', region='UY')
-        else:
-            googlenews = GoogleNews(lang='pt', region='BR')
+        # Tarefa → nomes das fontes que ela cobre (um lote GDELT cobre vários termos)
+        tasks = {}
+        seen_links = frozenset(_known_links)
+        for term in SEARCH_TERMS:
+            tasks[FETCH_EXECUTOR.submit(_googlenews_term_news, term, lang, seen_links)] = [f'googlenews:{term}']
+        for batch in gdelt_batches(SEARCH_TERMS, lang):
+            tasks[FETCH_EXECUTOR.submit(_gdelt_batch_news, batch, lang)] = [f'gdelt:{term}' for term in batch]
+        for adapter in FEED_ADAPTERS:
+            if adapter.lang == lang:
+                tasks[FETCH_EXECUTOR.submit(adapter.fetch)] = [f'rss:{adapter.name}']
         
-        googlenews.set_period('1d')  # Últimas 24 horas
+        done, _ = wait(tasks, timeout=deadline)
         
         all_news = []
-        search_terms = ['Agro en Punta', 'Agronegócio Uruguai', 'Expoagro', 'Agricultura Mercosul']
-        
-        for term in search_terms:
-            googlenews.clear()
-            googlenews.search(term)
-            results = googlenews.results()
-            
-            for item in results[:5]:  # Limita a 5 por termo
-                # Processa o tempo de publicação (corrige "á" para "Há")
-                raw_date = item.get('date', '')
-                formatted_date = _format_news_date(raw_date, lang)
-                
-                # Processa o link - GoogleNews retorna links que precisam de tratamento
-                raw_link = item.get('link', '')
-                formatted_link = _format_news_link(raw_link)
-                
-                all_news.append({
-                    'Hora': formatted_date,
-                    'Veículo': item.get('media', 'Fonte desconhecida'),
-                    'Título': item.get('title', 'Sem título'),
-                    'Link': formatted_link
-                })
+        timed_out = []
+        failed = []
+        for future, sources in tasks.items():
+            if future not in done:
+                # Não descarta: mescla no cache quando a fonte responder
+                timed_out.extend(sources)
+                future.add_done_callback(_merge_late_news)
+            elif future.exception() is not None:
+                failed.extend(sources)
+            else:
+                all_news.extend(future.result())
         
-        gdelt_news = get_gdelt_news(lang)
-        df_gn = pd.DataFrame(all_news)
-        combined = pd.concat([df_gn, gdelt_news], ignore_index=True)
-        if combined.empty:
+        combined = news_frame(all_news)
+        if combined.empty and not timed_out:
             # Fallback com dados simulados se não houver resultados
             combined = _simulate_web_news(lang)
         
@@ -183,9 +694,15 @@ def get_web_news(lang='pt-br'):
         
         # Carrega cache completo (com histórico)
         cached = load_cached_news(include_all=False)
-        if not cached.empty:
-            return cached
-        return combined
+        result = cached if not cached.empty else combined
+        if result.empty:
+            result = _simulate_web_news(lang)
+        elif 'Tags' not in result.columns:
+            # Cache vazio: o resultado da coleta ainda não passou pela anotação
+            result = news_frame(annotate_news_records(result.to_dict('records')))
+        result.attrs['timed_out_sources'] = timed_out
+        result.attrs['failed_sources'] = failed
+        return result
     
     except Exception as e:
         print(f"Erro ao buscar notícias: {e}. Usando dados simulados.")
@@ -194,6 +711,115 @@ def get_web_news(lang='pt-br'):
         return result
 
 
+def get_combined_web_news(deadline=None):
+    """
+    Busca notícias nos dois idiomas em paralelo (mesmo prazo para ambos),
+    concatena e remove duplicatas. Propaga `timed_out_sources` em `df.attrs`.
+    """
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        web_news_pt, web_news_es = pool.map(
+            lambda news_lang: get_web_news(news_lang, deadline=deadline),
+            ['pt-br', 'es-uy']
+        )
+    timed_out = web_news_pt.attrs.get('timed_out_sources', []) + web_news_es.attrs.get('timed_out_sources', [])
+    web_news = pd.concat([web_news_pt, web_news_es], ignore_index=True)
+    if not web_news.empty:
+        dedupe_cols = [col for col in ['Título', 'Veículo', 'Link'] if col in web_news.columns]
+        if dedupe_cols:
+            web_news = web_news.drop_duplicates(subset=dedupe_cols)
+        # concat de categóricas com categorias diferentes vira object: recodifica
+        apply_news_schema(web_news)
+    web_news.attrs['timed_out_sources'] = timed_out
+    return web_news
+
+
+def _merge_late_news(future):
+    """Callback: mescla no cache os resultados de uma fonte que estourou o prazo."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    rows = future.result()
+    if rows:
+        save_news_to_cache(news_frame(rows))
+
+
+def _googlenews_term_news(term, lang='pt-br', seen_links=frozenset()):
+    """Busca um termo no GoogleNews e retorna linhas no formato do dashboard."""
+    rows = []
+    results = _search_googlenews(term, lang, period='1d', seen_links=seen_links)  # Últimas 24 horas
+    
+    for item in results:
+        # Processa o tempo de publicação (corrige "á" para "Há")
+        raw_date = item.get('date', '')
+        formatted_date = _format_news_date(raw_date, lang)
+        
+        # Processa o link - GoogleNews retorna links que precisam de tratamento
+        raw_link = item.get('link', '')
+        formatted_link = _format_news_link(raw_link)
+        
+        rows.append(NewsRecord(
+            hora=formatted_date,
+            veiculo=item.get('media', 'Fonte desconhecida'),
+            titulo=item.get('title', 'Sem título'),
+            link=formatted_link,
+            termos=(term,),
+        ))
+    return rows
+
+
+def _page_exhausted(items, known_links, cutoff):
+    """Página sem nada novo: só links já vistos ou itens anteriores a `cutoff`."""
+    for item in items:
+        published = item.get('datetime')
+        if isinstance(published, datetime) and published < cutoff:
+            continue
+        if _format_news_link(item.get('link', '')) not in known_links:
+            return False
+    return True
+
+
+def _search_googlenews(term, lang='pt-br', period='1d', seen_links=frozenset(),
+                       max_pages=GOOGLENEWS_MAX_PAGES):
+    """
+    Executa uma busca no GoogleNews via cache compartilhado (single-flight).
+    Retorna tupla (imutável) com os resultados brutos de até `max_pages` páginas.
+    
+    Todas as páginas vêm do mesmo endpoint (`page_at`, google.com tbm=nws):
+    a primeira sozinha e as seguintes em ondas de GOOGLENEWS_PAGE_WORKERS
+    páginas paralelas. A coleta para na primeira página que só traz links já
+    vistos (armazenados ou de páginas anteriores) ou itens fora da janela de
+    retenção.
+    """
+    def fetch():
+        results = list(googlenews_adapter.fetch_page(term, lang, period, 1))
+        
+        cutoff = datetime.now() - HARVEST_MAX_AGE
+        known = set(seen_links)
+        exhausted = _page_exhausted(results, known, cutoff)
+        known.update(_format_news_link(item.get('link', '')) for item in results)
+        page = 2
+        while not exhausted and page <= max_pages:
+            wave = range(page, min(page + GOOGLENEWS_PAGE_WORKERS, max_pages + 1))
+            futures = [PAGE_EXECUTOR.submit(googlenews_adapter.fetch_page, term, lang, period, p) for p in wave]
+            for future in futures:
+                if exhausted:
+                    future.cancel()
+                    continue
+                try:
+                    items = future.result()
+                except Exception as e:
+                    print(f"Erro na paginação do GoogleNews ({term}): {e}")
+                    items = []
+                if _page_exhausted(items, known, cutoff):
+                    exhausted = True
+                    continue
+                results.extend(items)
+                known.update(_format_news_link(item.get('link', '')) for item in items)
+            page += len(wave)
+        return tuple(results)
+    
+    return UPSTREAM_CACHE.get_or_fetch(('googlenews', term, lang, period, max_pages), fetch)
+
+
 def _format_gdelt_time(seendate_str, lang='pt-br'):
     """
     Converte data GDELT (YYYYMMDDHHmmss) para formato relativo (Há X dias).
@@ -203,30 +829,37 @@ def _format_gdelt_time(seendate_str, lang='pt-br'):
     
     try:
         seen_dt = datetime.strptime(seendate_str, '%Y%m%d%H%M%S')
-        now = datetime.now()
-        delta = now - seen_dt
-        
-        if delta.days > 0:
-            if lang == 'es-uy':
-                return f"Hace {delta.days} {'día' if delta.days == 1 else 'días'}"
-            else:
-                return f"Há {delta.days} {'dia' if delta.days == 1 else 'dias'}"
-        elif delta.seconds >= 3600:
-            hours = delta.seconds // 3600
-            if lang == 'es-uy':
-                return f"Hace {hours} {'hora' if hours == 1 else 'horas'}"
-            else:
-                return f"Há {hours} {'hora' if hours == 1 else 'horas'}"
-        elif delta.seconds >= 60:
-            mins = delta.seconds // 60
-            if lang == 'es-uy':
-                return f"Hace {mins} min"
-            else:
-                return f"Há {mins} min"
-        else:
-            return 'Agora' if lang == 'pt-br' else 'Ahora'
     except ValueError:
         return 'Agora' if lang == 'pt-br' else 'Ahora'
+    return _format_relative_time(seen_dt, lang)
+
+
+def _format_relative_time(seen_dt, lang='pt-br'):
+    """Datetime (local, sem fuso) em formato relativo: Há X dias/horas/min."""
+    delta = datetime.now() - seen_dt
+    
+    if delta.days < 0:
+        # Relógio da fonte adiantado: trata como recém-publicado
+        return 'Agora' if lang == 'pt-br' else 'Ahora'
+    elif delta.days > 0:
+        if lang == 'es-uy':
+            return f"Hace {delta.days} {'día' if delta.days == 1 else 'días'}"
+        else:
+            return f"Há {delta.days} {'dia' if delta.days == 1 else 'dias'}"
+    elif delta.seconds >= 3600:
+        hours = delta.seconds // 3600
+        if lang == 'es-uy':
+            return f"Hace {hours} {'hora' if hours == 1 else 'horas'}"
+        else:
+            return f"Há {hours} {'hora' if hours == 1 else 'horas'}"
+    elif delta.seconds >= 60:
+        mins = delta.seconds // 60
+        if lang == 'es-uy':
+            return f"Hace {mins} min"
+        else:
+            return f"Há {mins} min"
+    else:
+        return 'Agora' if lang == 'pt-br' else 'Ahora'
 
 
 def _extract_veicle_from_url(url_str):
@@ -254,45 +887,287 @@ def _extract_veicle_from_url(url_str):
 
 def get_gdelt_news(lang='pt-br'):
     """
-    Busca notícias via GDELT 2.1 Document API.
-    Retorna DataFrame com: Hora, Veículo, Título, Link
+    Busca notícias via GDELT 2.1 Document API (termos em consultas OR em lote).
+    Retorna DataFrame com: Hora, Veículo, Título, Link, Termos
     """
-    search_terms = ['Agro en Punta', 'Agronegócio Uruguai', 'Expoagro', 'Agricultura Mercosul']
-    source_lang = 'sourcelang:spa' if lang == 'es-uy' else 'sourcelang:por'
     all_news = []
 
-    for term in search_terms:
-        query = f'"{term}" {source_lang}'
-        url = (
-            'https://api.gdeltproject.org/api/v2/doc/doc?'
-            f'query={quote_plus(query)}&mode=ArtList&maxrecords=20&format=json'
-        )
-
+    for batch in gdelt_batches(SEARCH_TERMS, lang):
         try:
-            request = Request(url, headers={'User-Agent': 'AgroPulse/1.0'})
-            with urlopen(request, timeout=10) as response:
-                data = json.loads(response.read().decode('utf-8'))
-
-            for item in data.get('articles', []):
-                seendate = item.get('seendate', '')
-                hora = _format_gdelt_time(seendate, lang)
-                
-                # Tenta usar sourceCommonName, se não existir extrai da URL
-                article_url = item.get('url', '')
-                veicle = item.get('sourceCommonName', None)
-                if not veicle or veicle == 'Unknown':
-                    veicle = _extract_veicle_from_url(article_url)
-
-                all_news.append({
-                    'Hora': hora,
-                    'Veículo': veicle,
-                    'Título': item.get('title', 'Sem título'),
-                    'Link': article_url
-                })
+            all_news.extend(_gdelt_batch_news(batch, lang))
         except Exception:
             continue
 
-    return pd.DataFrame(all_news)
+    return news_frame(all_news)
+
+
+def _gdelt_source_lang(lang):
+    return 'sourcelang:spa' if lang == 'es-uy' else 'sourcelang:por'
+
+
+def _gdelt_query(terms, lang='pt-br'):
+    """Consulta booleana: ("a" OR "b") sourcelang:xxx (parênteses só com OR)."""
+    phrases = ' OR '.join(f'"{term}"' for term in terms)
+    if len(terms) > 1:
+        phrases = f'({phrases})'
+    return f'{phrases} {_gdelt_source_lang(lang)}'
+
+
+def _gdelt_url(terms, lang='pt-br'):
+    max_records = min(GDELT_MAX_RECORDS, GDELT_RECORDS_PER_TERM * len(terms))
+    return (
+        f'{GDELT_API_URL}?query={quote_plus(_gdelt_query(terms, lang))}'
+        f'&mode=ArtList&maxrecords={max_records}&format=json'
+    )
+
+
+def gdelt_batches(terms, lang='pt-br'):
+    """
+    Agrupa os termos em lotes para consultas OR: cada lote tem no máximo
+    GDELT_MAX_BATCH_TERMS termos e gera uma URL de até GDELT_MAX_URL_LENGTH
+    caracteres. Um termo que sozinho passe do limite vira um lote próprio.
+    """
+    batches = []
+    current = []
+    for term in terms:
+        candidate = current + [term]
+        if current and (
+            len(candidate) > GDELT_MAX_BATCH_TERMS
+            or len(_gdelt_url(candidate, lang)) > GDELT_MAX_URL_LENGTH
+        ):
+            batches.append(tuple(current))
+            candidate = [term]
+        current = candidate
+    if current:
+        batches.append(tuple(current))
+    return batches
+
+
+def _attribute_terms(article, terms):
+    """
+    Termos do lote que o artigo menciona no título ou no slug da URL
+    (sem acentos/caixa). Se nenhum aparece, a GDELT casou o texto completo
+    com algum termo que não dá para identificar: o artigo fica marcado como
+    de termo desconhecido (UNKNOWN_TERM), sem contar para nenhum termo.
+    """
+    title = normalize_text(article.get('title', ''))
+    slug = normalize_text(article.get('url', '')).replace('-', ' ').replace('_', ' ')
+    matched = tuple(
+        term for term in terms
+        if normalize_text(term) in title or normalize_text(term) in slug
+    )
+    return matched or (UNKNOWN_TERM,)
+
+
+def _gdelt_batch_news(terms, lang='pt-br'):
+    """
+    Busca um lote de termos na GDELT (uma requisição) e retorna linhas no
+    formato do dashboard, cada uma com os termos a que foi atribuída.
+    """
+    rows = []
+
+    for item in _search_gdelt(terms, lang):
+        seendate = item.get('seendate', '')
+        hora = _format_gdelt_time(seendate, lang)
+        
+        # Tenta usar sourceCommonName, se não existir extrai da URL
+        article_url = item.get('url', '')
+        veicle = item.get('sourceCommonName', None)
+        if not veicle or veicle == 'Unknown':
+            veicle = _extract_veicle_from_url(article_url)
+
+        rows.append(NewsRecord(
+            hora=hora,
+            veiculo=veicle,
+            titulo=item.get('title', 'Sem título'),
+            link=article_url,
+            termos=_attribute_terms(item, terms),
+        ))
+    return rows
+
+
+def _search_gdelt(terms, lang='pt-br'):
+    """
+    Consulta a GDELT Doc API para um lote de termos via cache compartilhado
+    (single-flight). Retorna tupla com os artigos brutos.
+    """
+    terms = tuple(terms)
+
+    def fetch():
+        request = Request(_gdelt_url(terms, lang), headers={'User-Agent': 'AgroPulse/1.0'})
+        with urlopen(request, timeout=10) as response:
+            data = json.loads(response.read().decode('utf-8'))
+        return tuple(data.get('articles', []))
+
+    return UPSTREAM_CACHE.get_or_fetch(('gdelt', terms, lang, 'artlist'), fetch)
+
+
+# ============================================
+# ADAPTADORES DE FONTE (RSS/Atom)
+# ============================================
+class SourceAdapter:
+    """
+    Interface de fonte de notícias: `name` identifica a fonte (em
+    timed_out_sources/failed_sources), `lang` o idioma do dashboard que ela
+    alimenta, e `fetch()` retorna uma lista de NewsRecord.
+    """
+
+    name = 'source'
+    lang = 'pt-br'
+
+    def fetch(self):
+        raise NotImplementedError
+
+
+_ATOM_NS = '{http://www.w3.org/2005/Atom}'
+_FEED_ITEM_TAGS = ('item', f'{_ATOM_NS}entry')
+
+
+def _feed_child_text(elem, *tags):
+    for tag in tags:
+        child = elem.find(tag)
+        if child is not None and child.text:
+            return child.text.strip()
+    return ''
+
+
+def _feed_item_link(elem):
+    link = _feed_child_text(elem, 'link')
+    if link:
+        return link
+    # Atom: <link rel="alternate" href="..."/>
+    for child in elem.findall(f'{_ATOM_NS}link'):
+        if child.get('rel', 'alternate') == 'alternate' and child.get('href'):
+            return child.get('href')
+    return ''
+
+
+def _parse_feed_date(value):
+    """pubDate (RFC 822) ou updated/published (ISO 8601) → datetime local sem fuso."""
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+class FeedAdapter(SourceAdapter):
+    """
+    Feed RSS 2.0 ou Atom de um veículo, com GET condicional: guarda ETag e
+    Last-Modified da última resposta e os envia em If-None-Match /
+    If-Modified-Since. Feed inalterado custa uma ida e volta com 304 e
+    devolve os itens da última leitura. O XML é lido em blocos por um parser
+    incremental (XMLPullParser), liberando cada item após convertê-lo.
+    """
+
+    def __init__(self, name, url, lang='pt-br', max_items=30, timeout=10, chunk_size=16384):
+        self.name = name
+        self.url = url
+        self.lang = lang
+        self.max_items = max_items
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+        self.etag = None
+        self.last_modified = None
+        self.stats = {'requests': 0, 'not_modified': 0, 'items': 0}
+        self._records = []
+        self._lock = threading.Lock()
+
+    def fetch(self):
+        return UPSTREAM_CACHE.get_or_fetch(('rss', self.url, self.lang), self._fetch_conditional)
+
+    def _fetch_conditional(self):
+        with self._lock:
+            headers = {'User-Agent': 'AgroPulse/1.0'}
+            if self.etag:
+                headers['If-None-Match'] = self.etag
+            if self.last_modified:
+                headers['If-Modified-Since'] = self.last_modified
+            self.stats['requests'] += 1
+            try:
+                with urlopen(Request(self.url, headers=headers), timeout=self.timeout) as response:
+                    records = self._parse(response)
+                    self.etag = response.headers.get('ETag')
+                    self.last_modified = response.headers.get('Last-Modified')
+            except HTTPError as e:
+                if e.code != 304:
+                    raise
+                self.stats['not_modified'] += 1
+                return list(self._records)
+            self._records = records
+            self.stats['items'] = len(records)
+            return list(records)
+
+    def _parse(self, stream):
+        parser = ET.XMLPullParser(events=('end',))
+        cutoff = datetime.now() - HARVEST_MAX_AGE
+        records = []
+        while len(records) < self.max_items:
+            chunk = stream.read(self.chunk_size)
+            if not chunk:
+                break
+            parser.feed(chunk)
+            for _, elem in parser.read_events():
+                if elem.tag not in _FEED_ITEM_TAGS:
+                    continue
+                record = self._to_record(elem, cutoff)
+                elem.clear()
+                if record is not None and len(records) < self.max_items:
+                    records.append(record)
+        return records
+
+    def _to_record(self, elem, cutoff):
+        title = _feed_child_text(elem, 'title', f'{_ATOM_NS}title')
+        link = _feed_item_link(elem)
+        if not title or not link:
+            return None
+        published = _parse_feed_date(_feed_child_text(
+            elem, 'pubDate', f'{_ATOM_NS}updated', f'{_ATOM_NS}published'
+        ))
+        if published is not None and published < cutoff:
+            return None
+        return NewsRecord(
+            hora=_format_relative_time(published, self.lang) if published else datetime.now().strftime('%H:%M'),
+            veiculo=self.name,
+            titulo=title,
+            link=link,
+        )
+
+
+# Veículos acompanhados (os mesmos de _simulate_web_news). URLs substituíveis
+# em data/feeds.json.
+DEFAULT_FEEDS = [
+    {'name': 'Canal Rural', 'url': 'https://www.canalrural.com.br/feed/', 'lang': 'pt-br'},
+    {'name': 'Agrolink', 'url': 'https://www.agrolink.com.br/rss/noticias.xml', 'lang': 'pt-br'},
+    {'name': 'Notícias Agrícolas', 'url': 'https://www.noticiasagricolas.com.br/rss/noticias.xml', 'lang': 'pt-br'},
+    {'name': 'El Observador', 'url': 'https://www.elobservador.com.uy/rss/pages/agro.xml', 'lang': 'es-uy'},
+    {'name': 'El País Uruguay', 'url': 'https://www.elpais.com.uy/rss/agro', 'lang': 'es-uy'},
+]
+
+
+def load_feed_adapters(path=None):
+    """Adaptadores dos feeds de `path` (JSON {"feeds": [...]}) ou dos padrões."""
+    feeds = DEFAULT_FEEDS
+    if path and os.path.exists(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                feeds = json.load(f).get('feeds', [])
+        except Exception as e:
+            print(f"Erro ao carregar feeds: {e}. Usando feeds padrão.")
+    return [
+        FeedAdapter(feed['name'], feed['url'], feed.get('lang', 'pt-br'))
+        for feed in feeds if feed.get('url')
+    ]
+
+
+FEED_ADAPTERS = load_feed_adapters(FEEDS_FILE)
 
 
 def _format_news_date(raw_date, lang='pt-br'):
@@ -668,13 +1543,13 @@ def _simulate_web_news(lang='pt-br'):
     # Adiciona notícias do Agro en Punta
     for i, news in enumerate(agro_news):
         time_offset = timedelta(minutes=random.randint(10, 360))
-        all_news.append({
-            'Hora': f'{time_ago} {int(time_offset.total_seconds() // 60)} {time_min}',
-            'Veículo': news['Veículo'],
-            'Título': news['Título'],
-            'Link': news['Link'],
-            'Categoria': news['Categoria']
-        })
+        all_news.append(NewsRecord(
+            hora=f'{time_ago} {int(time_offset.total_seconds() // 60)} {time_min}',
+            veiculo=news['Veículo'],
+            titulo=news['Título'],
+            link=news['Link'],
+            categoria=news['Categoria'],
+        ))
     
     # Adiciona outras notícias
     for i, news in enumerate(other_news):
@@ -685,15 +1560,16 @@ def _simulate_web_news(lang='pt-br'):
             time_str = f'{time_ago} {hours}h {mins}{time_min}'
         else:
             time_str = f'{time_ago} {mins} {time_min}'
-        all_news.append({
-            'Hora': time_str,
-            'Veículo': news['Veículo'],
-            'Título': news['Título'],
-            'Link': news['Link'],
-            'Categoria': news['Categoria']
-        })
+        all_news.append(NewsRecord(
+            hora=time_str,
+            veiculo=news['Veículo'],
+            titulo=news['Título'],
+            link=news['Link'],
+            categoria=news['Categoria'],
+        ))
     
-    return pd.DataFrame(all_news)
+    # Tags e categorias como nos itens reais (as abas e filtros dependem delas)
+    return news_frame(annotate_news_records([record.to_row() for record in all_news]))
 
 
 def simulate_radio_listening(lang='pt-br'):
@@ -804,18 +1680,162 @@ def simulate_radio_listening(lang='pt-br'):
             sentimento = 'Negativo'
             transcricao = random.choice(trans['negativas'])
         
-        registros.append({
-            'Timestamp': timestamp.strftime('%H:%M:%S'),
-            'Emissora': random.choice(emissoras),
-            'Transcrição': transcricao,
-            'Sentimento': sentimento
-        })
-    
-    # Ordena por timestamp (mais recente primeiro)
-    df = pd.DataFrame(registros)
-    df = df.sort_values('Timestamp', ascending=False).reset_index(drop=True)
+        registros.append(RadioRecord(
+            timestamp=timestamp,
+            emissora=random.choice(emissoras),
+            transcricao=transcricao,
+            sentimento=sentimento,
+        ))
     
-    return df
+    # Simulado não passa pela watchlist/tendências: só transcrições reais geram alertas
+    # Ordena por timestamp datetime (mais recente primeiro, correto na virada do dia)
+    return radio_frame(registros)
+
+
+def store_radio_records(records):
+    """
+    Destino da ingestão do spool de rádio (roda no processo da ingestão):
+    grava os alertas da watchlist e acrescenta as transcrições ao arquivo
+    JSONL. Tendências e cobertura relacionada são atualizadas no processo do
+    dashboard, que lê o arquivo quando a versão dos dados muda (sync_indexes).
+    """
+    if not records:
+        return
+    _ensure_cache_dir()
+    with _news_store_lock():
+        # Alertas sob o mesmo lock das notícias: anexo e rotação do log não
+        # disputam com o processo do dashboard
+        scan_radio_transcripts(records)
+        with open(RADIO_TRANSCRIPTS_FILE, 'a', encoding='utf-8') as f:
+            for record in records:
+                f.write(_radio_line(record))
+        _bump_data_version()
+
+
+def _radio_line(record):
+    row = record.to_row()
+    row['Timestamp'] = record.timestamp.isoformat()
+    return json.dumps(row, ensure_ascii=False) + '\n'
+
+
+def _parse_radio_line(line):
+    """RadioRecord de uma linha do arquivo de transcrições (None se inválida/truncada)."""
+    try:
+        row = json.loads(line)
+        return RadioRecord(
+            timestamp=datetime.fromisoformat(row['Timestamp']),
+            emissora=row['Emissora'],
+            transcricao=row['Transcrição'],
+            sentimento=row['Sentimento'],
+        )
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def iter_radio_transcripts():
+    """Todas as transcrições reais, na ordem de gravação, lidas linha a linha."""
+    try:
+        f = open(RADIO_TRANSCRIPTS_FILE, 'r', encoding='utf-8')
+    except FileNotFoundError:
+        return
+    with f:
+        for line in f:
+            record = _parse_radio_line(line)
+            if record is not None:
+                yield record
+
+
+def load_radio_transcripts(limit=RADIO_FEED_LIMIT):
+    """Últimas `limit` transcrições reais (RadioRecord; todas com None), sem carregar o arquivo inteiro."""
+    try:
+        with open(RADIO_TRANSCRIPTS_FILE, 'r', encoding='utf-8') as f:
+            lines = deque(f, maxlen=limit)
+    except FileNotFoundError:
+        return []
+    records = (_parse_radio_line(line) for line in lines)
+    return [record for record in records if record is not None]
+
+
+def _sync_radio_index():
+    """
+    Lê as transcrições acrescentadas desde a última leitura (offset em bytes)
+    e alimenta tendências e cobertura relacionada (chamar com _indexes_lock).
+    """
+    global _radio_offset
+    try:
+        with open(RADIO_TRANSCRIPTS_FILE, 'rb') as f:
+            if f.seek(0, os.SEEK_END) < _radio_offset:
+                _radio_offset = 0  # arquivo recriado
+            f.seek(_radio_offset)
+            data = f.read()
+    except FileNotFoundError:
+        return
+    # Só linhas completas: uma gravação em andamento fica para a próxima leitura
+    complete = data[:data.rfind(b'\n') + 1]
+    _radio_offset += len(complete)
+    records = (_parse_radio_line(line) for line in complete.decode('utf-8', errors='replace').splitlines())
+    _index_radio_records([record for record in records if record is not None])
+
+
+def _index_radio_records(records):
+    """Transcrições reais nos termos em alta (pelo horário do trecho) e na cobertura relacionada."""
+    now = time.time()
+    window = TRENDING.slots * TRENDING.slot_seconds
+    for record in records:
+        at = min(record.timestamp.timestamp(), now)
+        if now - at < window:
+            TRENDING.add_text(record.transcricao, at)
+        SIMILARITY_INDEX.add(radio_item_id(record), record.transcricao, {
+            'kind': 'radio',
+            'title': record.transcricao,
+            'source': record.emissora,
+            'link': '',
+        })
+
+
+def get_radio_listening(lang='pt-br'):
+    """
+    Rádio Escuta: transcrições reais do spool quando houver, senão o
+    monitoramento simulado. Mesmo esquema (Timestamp, Emissora, Transcrição,
+    Sentimento).
+    """
+    records = load_radio_transcripts()
+    if records:
+        return radio_frame(records)
+    return simulate_radio_listening(lang)
+
+
+def radio_item_id(record):
+    """Id estável de uma transcrição: emissora + texto (repetições não duplicam o índice)."""
+    return f"radio:{record.emissora}:{record.transcricao}"
+
+
+def scan_radio_transcripts(records):
+    """
+    Casa cada transcrição de rádio com a watchlist no momento da ingestão e
+    grava alertas para as correspondências (chamar com _news_store_lock).
+    """
+    alerts = []
+    now = time.time()
+    for record in records:
+        matches = WATCHLIST.match(record.transcricao)
+        if matches:
+            # Mesma frase na mesma emissora dentro da janela: não repete o alerta
+            key = (record.emissora, record.transcricao)
+            last = _recent_radio_alerts.get(key)
+            if last is not None and now - last < RADIO_ALERT_WINDOW_SECONDS:
+                continue
+            _recent_radio_alerts[key] = now
+            alerts.append({
+                'kind': 'radio',
+                'source': record.emissora,
+                'text': record.transcricao,
+                'terms': list(dict.fromkeys(m['term'] for m in matches)),
+            })
+    while len(_recent_radio_alerts) > 1000:
+        _recent_radio_alerts.pop(next(iter(_recent_radio_alerts)))
+    record_alerts(ALERTS_FILE, alerts)
+    return alerts
 
 
 def simulate_social_buzz():
@@ -859,21 +1879,16 @@ def simulate_social_buzz():
         linkedin = int(base_linkedin * fator)
         tiktok = int(base_tiktok * fator)
         
-        total = x + instagram + facebook + threads + linkedin + tiktok
-        
-        registros.append({
-            'Hora': hora.strftime('%H:00'),
-            'HoraCompleta': hora,
+        registros.append(SocialRecord(hora, {
             'X': x,
             'Instagram': instagram,
             'Facebook': facebook,
             'Threads': threads,
             'LinkedIn': linkedin,
             'TikTok': tiktok,
-            'Total': total
-        })
+        }))
     
-    return pd.DataFrame(registros)
+    return social_frame(registros)
 
 
 def get_sentiment_summary(radio_df):
@@ -891,7 +1906,39 @@ def get_sentiment_summary(radio_df):
     }
 
 
-# Teste das funções
+def load_dashboard_sources(lang='pt-br', web_news=None, deadline=None):
+    """
+    Quadros do dashboard em um idioma: (notícias, rádio, social, sentimento).
+    Carga única usada pelo app e pelo aquecimento; `web_news` reaproveita as
+    notícias (bilíngues) já buscadas para outro idioma.
+    """
+    if web_news is None:
+        web_news = get_combined_web_news(deadline=deadline)
+    radio_data = get_radio_listening(lang)
+    social_buzz = simulate_social_buzz()
+    return web_news, radio_data, social_buzz, get_sentiment_summary(radio_data)
+
+
+def check_feeds(urls=None, rounds=2):
+    """
+    Lê cada feed `rounds` vezes direto na origem (sem o cache de fontes).
+    Aceita URLs avulsas, ex.: um servidor local (`python -m http.server`
+    responde If-Modified-Since com 304). Retorna [(nome, itens, stats ou erro)].
+    """
+    adapters = [FeedAdapter(url, url) for url in urls] if urls else FEED_ADAPTERS
+    results = []
+    for adapter in adapters:
+        try:
+            for _ in range(rounds):
+                records = adapter._fetch_conditional()
+        except Exception as e:
+            results.append((adapter.name, None, e))
+        else:
+            results.append((adapter.name, len(records), dict(adapter.stats)))
+    return results
+
+
+# Teste rápido: `python src/media_engine.py` (subcomandos em src/cli.py)
 if __name__ == '__main__':
     print("=== Testando Media Engine ===\n")
     
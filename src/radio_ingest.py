@@ -0,0 +1,318 @@
+"""
+AgroPulse Media Watch - Ingestão de Rádio (Spool)
+Alimenta a Rádio Escuta com gravações reais: um observador varre o diretório
+de spool, onde o gravador de cada emissora deposita os trechos de áudio
+(`<spool>/<Emissora>/<AAAAMMDDHHMMSS>[_sufixo].<ext>`), e despacha cada
+trecho para um pool de processos que roda o transcritor plugável. As
+transcrições seguem o mesmo esquema do simulado (Timestamp, Emissora,
+Transcrição, Sentimento).
+
+- Contrapressão: no máximo `max_in_flight` trechos no pool; com o pool
+  saturado o observador espera concluir antes de despachar mais (o próprio
+  spool é a fila, nada se acumula em memória).
+- Pelo menos uma vez: o trecho só entra no checkpoint (`.checkpoint.jsonl`
+  no spool) depois que a transcrição foi entregue ao destino; uma queda entre
+  os dois reprocessa o trecho. Transcrição vazia (ex.: `.txt` ainda não
+  gravado) não é entrega: o trecho volta a ser tentado com espera crescente.
+- Trechos completos: só entram os arquivos cujo tamanho não mudou desde a
+  varredura anterior ou que já estão parados há `settle_seconds` (gravados
+  em outro nome e renomeados para o spool).
+- Métricas por emissora: trechos, erros, tempo de transcrição e vazão.
+
+O transcritor é uma função `módulo:função` que recebe o caminho do áudio e
+retorna o texto, resolvida dentro de cada processo do pool (ex.: um motor
+local de reconhecimento de fala). O padrão lê a transcrição pronta em
+`<trecho>.txt` ao lado do áudio (stub para testes e gravadores que já
+transcrevem).
+
+Uso:
+    python src/cli.py radio-spool spool/ --workers 4
+"""
+
+import importlib
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+
+from schema import RadioRecord
+from text_utils import classify_sentiment
+
+AUDIO_SUFFIXES = ('.wav', '.mp3', '.ogg', '.opus', '.flac', '.m4a', '.aac')
+DEFAULT_TRANSCRIBER = 'radio_ingest:sidecar_transcriber'
+SPOOL_POLL_SECONDS = 5
+MAX_CHUNK_ATTEMPTS = 3
+# Transcrição vazia: novas tentativas com espera dobrando a partir de poll_interval
+MAX_EMPTY_ATTEMPTS = 6
+
+
+def sidecar_transcriber(audio_path):
+    """Transcritor stub: texto de `<áudio>.txt` (vazio se não existir)."""
+    try:
+        with open(f'{audio_path}.txt', 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return ''
+
+
+_transcribers = {}
+
+
+def resolve_transcriber(spec):
+    """Função de transcrição a partir de 'módulo:função' (uma vez por processo)."""
+    func = _transcribers.get(spec)
+    if func is None:
+        module_name, _, attr = spec.partition(':')
+        func = _transcribers[spec] = getattr(importlib.import_module(module_name), attr)
+    return func
+
+
+def transcribe_chunk(spec, audio_path):
+    """Executa no pool: retorna (texto, segundos de transcrição)."""
+    started = time.perf_counter()
+    text = resolve_transcriber(spec)(audio_path)
+    return text, time.perf_counter() - started
+
+
+def chunk_timestamp(path):
+    """Início do trecho pelo nome (AAAAMMDDHHMMSS) ou, na falta, pela data do arquivo."""
+    stem = os.path.basename(path)[:14]
+    try:
+        return datetime.strptime(stem, '%Y%m%d%H%M%S')
+    except ValueError:
+        return datetime.fromtimestamp(os.path.getmtime(path))
+
+
+class RadioSpoolWatcher:
+    """
+    Observa `spool_dir` e entrega as transcrições a `sink(records)` (lista de
+    RadioRecord). `workers` processos, no máximo `max_in_flight` trechos
+    despachados de uma vez.
+    """
+
+    def __init__(self, spool_dir, sink, transcriber=DEFAULT_TRANSCRIBER, workers=None,
+                 max_in_flight=None, checkpoint_file=None, poll_interval=SPOOL_POLL_SECONDS,
+                 settle_seconds=None):
+        self.spool_dir = spool_dir
+        self.sink = sink
+        self.transcriber = transcriber
+        self.workers = workers or os.cpu_count() or 1
+        self.max_in_flight = max_in_flight or self.workers * 2
+        self.poll_interval = poll_interval
+        self.settle_seconds = poll_interval if settle_seconds is None else settle_seconds
+        self.waiting = 0              # trechos vistos, mas ainda não prontos/na espera
+        self._sizes = {}              # trecho → tamanho na varredura anterior
+        self._retry_at = {}           # trecho → instante da próxima tentativa
+        self._empty_attempts = {}
+        self.checkpoint_file = checkpoint_file or os.path.join(spool_dir, '.checkpoint.jsonl')
+        self.backpressure_waits = 0
+        self.metrics = {}
+        self._attempts = {}
+        self._started = time.monotonic()
+        self._done = self._load_checkpoint()
+
+    # ---------------- checkpoint ----------------
+    def _load_checkpoint(self):
+        """Trechos já entregues; compacta removendo os que saíram do spool."""
+        done = set()
+        try:
+            with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        done.add(json.loads(line)['chunk'])
+                    except (ValueError, KeyError):
+                        continue  # linha truncada por interrupção
+        except FileNotFoundError:
+            return done
+        done = {chunk for chunk in done if os.path.exists(os.path.join(self.spool_dir, chunk))}
+        tmp_file = f'{self.checkpoint_file}.{os.getpid()}.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            for chunk in sorted(done):
+                f.write(json.dumps({'chunk': chunk}, ensure_ascii=False) + '\n')
+        os.replace(tmp_file, self.checkpoint_file)
+        return done
+
+    def _checkpoint(self, chunks, status='ok'):
+        if not chunks:
+            return
+        with open(self.checkpoint_file, 'a', encoding='utf-8') as f:
+            for chunk in chunks:
+                f.write(json.dumps({'chunk': chunk, 'status': status}, ensure_ascii=False) + '\n')
+        self._done.update(chunks)
+
+    # ---------------- varredura ----------------
+    def _is_ready(self, chunk, now):
+        """Arquivo completo: tamanho estável entre varreduras ou parado há `settle_seconds`."""
+        try:
+            stat = os.stat(os.path.join(self.spool_dir, chunk))
+        except FileNotFoundError:
+            self._sizes.pop(chunk, None)
+            return False
+        previous = self._sizes.get(chunk)
+        self._sizes[chunk] = stat.st_size
+        if now - stat.st_mtime >= self.settle_seconds:
+            return True
+        return previous == stat.st_size and stat.st_size > 0
+
+    def pending_chunks(self, exclude=()):
+        """
+        Trechos (caminho relativo ao spool) prontos e ainda não entregues, em
+        ordem por emissora e horário. Os que ainda estão sendo gravados ou
+        aguardam nova tentativa ficam contados em `waiting`.
+        """
+        pending = []
+        waiting = 0
+        now = time.time()
+        for station in sorted(os.listdir(self.spool_dir)):
+            station_dir = os.path.join(self.spool_dir, station)
+            if station.startswith('.') or not os.path.isdir(station_dir):
+                continue
+            for name in sorted(os.listdir(station_dir)):
+                chunk = f'{station}/{name}'
+                if not name.lower().endswith(AUDIO_SUFFIXES) or chunk in self._done or chunk in exclude:
+                    continue
+                if self._retry_at.get(chunk, 0) > now or not self._is_ready(chunk, now):
+                    waiting += 1
+                    continue
+                pending.append(chunk)
+        self.waiting = waiting
+        return pending
+
+    def _defer_empty(self, chunk):
+        """Transcrição vazia: agenda nova tentativa; desiste após MAX_EMPTY_ATTEMPTS."""
+        attempts = self._empty_attempts.get(chunk, 0) + 1
+        self._empty_attempts[chunk] = attempts
+        if attempts >= MAX_EMPTY_ATTEMPTS:
+            return True
+        self._retry_at[chunk] = time.time() + self.poll_interval * 2 ** (attempts - 1)
+        return False
+
+    def _station_metrics(self, station):
+        metrics = self.metrics.get(station)
+        if metrics is None:
+            metrics = self.metrics[station] = {'chunks': 0, 'errors': 0, 'busy_seconds': 0.0}
+        return metrics
+
+    # ---------------- execução ----------------
+    def _collect(self, in_flight, timeout=None):
+        """Espera ao menos um trecho concluir, entrega as transcrições e grava o checkpoint."""
+        finished, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+        records, delivered, failed, empty = [], [], [], []
+        for future in finished:
+            chunk = in_flight.pop(future)
+            station = chunk.split('/', 1)[0]
+            metrics = self._station_metrics(station)
+            try:
+                text, seconds = future.result()
+            except Exception as e:
+                print(f"Erro ao transcrever {chunk}: {e}")
+                metrics['errors'] += 1
+                self._attempts[chunk] = self._attempts.get(chunk, 0) + 1
+                if self._attempts[chunk] >= MAX_CHUNK_ATTEMPTS:
+                    failed.append(chunk)
+                continue
+            metrics['busy_seconds'] += seconds
+            if not text:
+                # Transcrição ainda não disponível: não é entrega, tenta de novo depois
+                if self._defer_empty(chunk):
+                    empty.append(chunk)
+                continue
+            metrics['chunks'] += 1
+            delivered.append(chunk)
+            records.append(RadioRecord(
+                timestamp=chunk_timestamp(os.path.join(self.spool_dir, chunk)),
+                emissora=station,
+                transcricao=text,
+                sentimento=classify_sentiment(text),
+            ))
+        if records:
+            self.sink(records)
+        # Só depois da entrega: uma queda antes daqui reprocessa os trechos
+        self._checkpoint(delivered)
+        self._checkpoint(failed, status='failed')
+        self._checkpoint(empty, status='empty')
+        for chunk in delivered + failed + empty:
+            self._sizes.pop(chunk, None)
+            self._retry_at.pop(chunk, None)
+            self._empty_attempts.pop(chunk, None)
+
+    def run(self, once=False, should_stop=None):
+        """
+        Processa o spool; com `once`, termina quando não houver trechos
+        pendentes nem em espera (ainda gravando ou aguardando nova tentativa),
+        senão segue varrendo a cada `poll_interval` até `should_stop()`
+        retornar True.
+        """
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            in_flight = {}
+            while True:
+                for chunk in self.pending_chunks(exclude=set(in_flight.values())):
+                    while len(in_flight) >= self.max_in_flight:
+                        self.backpressure_waits += 1
+                        self._collect(in_flight)
+                    path = os.path.join(self.spool_dir, chunk)
+                    in_flight[pool.submit(transcribe_chunk, self.transcriber, path)] = chunk
+                if in_flight:
+                    self._collect(in_flight, timeout=self.poll_interval)
+                elif (once and not self.waiting) or (should_stop and should_stop()):
+                    break
+                else:
+                    time.sleep(self.poll_interval)
+        return self.stats()
+
+    def stats(self):
+        """Vazão por emissora (trechos/min desde o início) e estado da fila."""
+        minutes = max(time.monotonic() - self._started, 1e-9) / 60
+        return {
+            'stations': {
+                station: {
+                    **metrics,
+                    'busy_seconds': round(metrics['busy_seconds'], 3),
+                    'chunks_per_min': round(metrics['chunks'] / minutes, 2),
+                }
+                for station, metrics in sorted(self.metrics.items())
+            },
+            'checkpointed': len(self._done),
+            'waiting': self.waiting,
+            'backpressure_waits': self.backpressure_waits,
+        }
+
+
+def add_spool_arguments(parser):
+    """Registra os argumentos do subcomando `radio-spool`."""
+    parser.add_argument('spool_dir', help='diretório de spool (um subdiretório por emissora)')
+    parser.add_argument('--workers', type=int, default=None, help='processos no pool (padrão: CPUs)')
+    parser.add_argument('--max-in-flight', type=int, default=None,
+                        help='trechos despachados de uma vez (padrão: 2 × workers)')
+    parser.add_argument('--transcriber', default=DEFAULT_TRANSCRIBER, help="função 'módulo:função'")
+    parser.add_argument('--settle', dest='settle_seconds', type=float, default=None,
+                        help='segundos sem alteração para considerar um trecho completo (padrão: intervalo de varredura)')
+    parser.add_argument('--once', action='store_true', help='processa o que houver e termina')
+
+
+def run_spool(args):
+    """Executa o subcomando `radio-spool` a partir dos argumentos do argparse."""
+    import media_engine
+
+    watcher = RadioSpoolWatcher(
+        args.spool_dir,
+        media_engine.store_radio_records,
+        transcriber=args.transcriber,
+        workers=args.workers,
+        max_in_flight=args.max_in_flight,
+        settle_seconds=args.settle_seconds,
+    )
+    try:
+        stats = watcher.run(once=args.once)
+    except KeyboardInterrupt:
+        stats = watcher.stats()
+    for station, metrics in stats['stations'].items():
+        print(
+            f"{station}: {metrics['chunks']} trechos ({metrics['chunks_per_min']}/min), "
+            f"{metrics['errors']} erros, {metrics['busy_seconds']}s transcrevendo"
+        )
+    print(
+        f"Checkpoint: {stats['checkpointed']} trechos; em espera: {stats['waiting']}; "
+        f"esperas por contrapressão: {stats['backpressure_waits']}"
+    )
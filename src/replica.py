@@ -0,0 +1,177 @@
+"""
+AgroPulse Media Watch - Coordenação entre Réplicas
+Lease (liderança) com heartbeat e versão de dados compartilhados via SQLite,
+para que apenas uma réplica busque as fontes externas e grave o cache.
+"""
+
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+
+
+class ReplicaCoordinator:
+    """
+    Eleição de líder por lease em um banco SQLite no volume compartilhado.
+
+    - A réplica que detém o lease (não expirado) é a única que busca e grava dados.
+    - O líder renova o lease a cada `heartbeat` segundos; se parar, outra réplica
+      assume após `lease_ttl` segundos. `is_leader()` confere a validade do
+      lease no relógio local, então um heartbeat atrasado não deixa a réplica
+      gravando depois que outra pode ter assumido.
+    - `data_version()` é incrementada pelo líder a cada nova gravação; as demais
+      réplicas usam o número para invalidar seus caches locais. A leitura usa
+      uma conexão por thread (consultada a cada rerun do dashboard).
+    - Com `participate=False` o processo só lê (e incrementa) a versão e nunca
+      disputa o lease: ferramentas de linha de comando e a API de leitura não
+      podem virar líderes no lugar de uma réplica do dashboard.
+    """
+
+    def __init__(self, db_path, replica_id=None, lease_ttl=30, heartbeat=10, participate=True):
+        self.db_path = db_path
+        self.participate = participate
+        self.replica_id = replica_id or f'{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}'
+        self.lease_ttl = lease_ttl
+        self.heartbeat = heartbeat
+        self._is_leader = False
+        self._lease_deadline = 0.0       # time.monotonic() em que o lease local expira
+        self._local = threading.local()  # conexão de leitura da versão, por thread
+        self._stop = threading.Event()
+        self._thread = None
+        self._init_db()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+        # WAL depende de memória compartilhada (-shm), que não funciona entre
+        # máquinas em volume de rede: journal clássico com lock de arquivo
+        conn.execute('PRAGMA journal_mode=DELETE')
+        return conn
+
+    def _init_db(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS lease ('
+                ' name TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)'
+            )
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS data_version ('
+                ' name TEXT PRIMARY KEY, version INTEGER NOT NULL, updated_at REAL NOT NULL)'
+            )
+            conn.execute(
+                "INSERT OR IGNORE INTO data_version (name, version, updated_at) VALUES ('news', 0, ?)",
+                (time.time(),)
+            )
+        finally:
+            conn.close()
+
+    # ============================================
+    # LEASE
+    # ============================================
+    def try_acquire(self):
+        """Tenta obter (ou renovar) o lease. Retorna True se esta réplica é a líder."""
+        if not self.participate:
+            return False
+        # Prazo medido antes da transação: expira localmente antes que no banco
+        started = time.monotonic()
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute("SELECT owner, expires_at FROM lease WHERE name = 'fetcher'").fetchone()
+            if row is None or row[0] == self.replica_id or row[1] < now:
+                conn.execute(
+                    "INSERT OR REPLACE INTO lease (name, owner, expires_at) VALUES ('fetcher', ?, ?)",
+                    (self.replica_id, now + self.lease_ttl)
+                )
+                acquired = True
+            else:
+                acquired = False
+            conn.execute('COMMIT')
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            acquired = False
+        finally:
+            conn.close()
+        self._is_leader = acquired
+        self._lease_deadline = started + self.lease_ttl if acquired else 0.0
+        return acquired
+
+    def release(self):
+        """Libera o lease (ex.: no desligamento da réplica)."""
+        self._stop.set()
+        conn = self._connect()
+        try:
+            conn.execute(
+                "DELETE FROM lease WHERE name = 'fetcher' AND owner = ?", (self.replica_id,)
+            )
+        finally:
+            conn.close()
+        self._is_leader = False
+        self._lease_deadline = 0.0
+
+    def is_leader(self):
+        """Indica se esta réplica detém o lease obtido no último heartbeat e ainda não expirado."""
+        return self._is_leader and time.monotonic() < self._lease_deadline
+
+    def leader(self):
+        """Retorna o dono atual do lease (ou None se expirado)."""
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT owner, expires_at FROM lease WHERE name = 'fetcher'").fetchone()
+        finally:
+            conn.close()
+        if row is None or row[1] < time.time():
+            return None
+        return row[0]
+
+    def start_heartbeat(self):
+        """Inicia thread de heartbeat que disputa/renova o lease periodicamente."""
+        if self._thread is not None or not self.participate:
+            return
+        self.try_acquire()
+
+        def loop():
+            while not self._stop.wait(self.heartbeat):
+                self.try_acquire()
+
+        self._thread = threading.Thread(target=loop, name='agropulse-lease', daemon=True)
+        self._thread.start()
+
+    # ============================================
+    # VERSÃO DOS DADOS
+    # ============================================
+    def _reader(self):
+        """Conexão de leitura desta thread (refeita após fork ou erro)."""
+        pid, conn = getattr(self._local, 'reader', (None, None))
+        if conn is None or pid != os.getpid():
+            conn = self._connect()
+            self._local.reader = (os.getpid(), conn)
+        return conn
+
+    def data_version(self):
+        """Versão atual dos dados compartilhados."""
+        try:
+            row = self._reader().execute("SELECT version FROM data_version WHERE name = 'news'").fetchone()
+        except sqlite3.Error:
+            # Conexão inválida (ex.: banco recriado): a próxima leitura reconecta
+            self._local.reader = (None, None)
+            raise
+        return row[0] if row else 0
+
+    def bump_version(self):
+        """Incrementa a versão dos dados (somente o líder grava)."""
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE data_version SET version = version + 1, updated_at = ? WHERE name = 'news'",
+                (time.time(),)
+            )
+            row = conn.execute("SELECT version FROM data_version WHERE name = 'news'").fetchone()
+        finally:
+            conn.close()
+        return row[0]
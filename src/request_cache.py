@@ -0,0 +1,108 @@
+"""
+AgroPulse Media Watch - Request Cache
+Coalescência de requisições (single-flight) e cache LRU+TTL compartilhado
+entre sessões para consultas às fontes externas (GoogleNews, GDELT).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class _InFlight:
+    """Requisição em andamento: os chamadores concorrentes aguardam o mesmo resultado."""
+
+    __slots__ = ('event', 'value', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlightCache:
+    """
+    Cache LRU limitado por tamanho, com expiração (TTL), protegido por
+    uma camada single-flight: para uma mesma chave, apenas o primeiro
+    chamador executa a busca; os demais esperam o resultado em andamento.
+
+    Chaves recomendadas: (fonte, consulta, idioma, período).
+    """
+
+    def __init__(self, max_entries=256, ttl=600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()  # chave -> (expira_em, valor)
+        self._in_flight = {}
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'coalesced': 0, 'evictions': 0, 'errors': 0}
+
+    def get_or_fetch(self, key, fetch_fn, ttl=None):
+        """
+        Retorna o valor em cache para `key` ou executa `fetch_fn()` uma única vez,
+        compartilhando o resultado com os chamadores concorrentes.
+        Exceções de `fetch_fn` são propagadas a todos e não são cacheadas.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._stats['hits'] += 1
+                    return value
+                del self._entries[key]
+
+            flight = self._in_flight.get(key)
+            if flight is not None:
+                self._stats['coalesced'] += 1
+                leader = False
+            else:
+                flight = _InFlight()
+                self._in_flight[key] = flight
+                self._stats['misses'] += 1
+                leader = True
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = fetch_fn()
+        except BaseException as e:
+            flight.error = e
+            with self._lock:
+                self._stats['errors'] += 1
+            raise
+        else:
+            self._store(key, flight.value, self.ttl if ttl is None else ttl)
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            flight.event.set()
+
+        return flight.value
+
+    def _store(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def invalidate(self, key=None):
+        """Remove uma chave (ou todo o cache, se `key` for None)."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self):
+        """Contadores de hit/miss/coalescência/evicção e tamanho atual."""
+        with self._lock:
+            return {**self._stats, 'size': len(self._entries), 'in_flight': len(self._in_flight)}
@@ -0,0 +1,132 @@
+"""
+AgroPulse Media Watch - Esquema de Dados
+Registros tipados (classes com __slots__) na fronteira das fontes e dtypes
+compactos nos DataFrames: colunas de baixa cardinalidade (veículo, emissora,
+categoria, sentimento, plataforma) como category, horários como datetime64
+e contagens como inteiros de 32 bits. Filtros, agrupamentos e ordenações
+passam a operar sobre códigos em vez de strings repetidas.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import pandas as pd
+
+SENTIMENTS = ('Positivo', 'Neutro', 'Negativo')
+SENTIMENT_DTYPE = pd.CategoricalDtype(list(SENTIMENTS))
+SOCIAL_PLATFORMS = ('X', 'Instagram', 'Facebook', 'Threads', 'LinkedIn', 'TikTok')
+PLATFORM_DTYPE = pd.CategoricalDtype(list(SOCIAL_PLATFORMS))
+
+
+@dataclass(slots=True)
+class NewsRecord:
+    """Notícia como sai de uma fonte (GoogleNews, GDELT, simulado)."""
+    hora: str
+    veiculo: str
+    titulo: str
+    link: str
+    categoria: str = None
+    termos: tuple = ()   # termos de busca que trouxeram o item (consultas em lote)
+
+    def to_row(self):
+        row = {'Hora': self.hora, 'Veículo': self.veiculo, 'Título': self.titulo, 'Link': self.link}
+        if self.categoria is not None:
+            row['Categoria'] = self.categoria
+        if self.termos:
+            row['Termos'] = list(self.termos)
+        return row
+
+
+@dataclass(slots=True)
+class RadioRecord:
+    """Trecho transcrito de uma emissora."""
+    timestamp: datetime
+    emissora: str
+    transcricao: str
+    sentimento: str
+
+    def to_row(self):
+        return {
+            'Timestamp': self.timestamp,
+            'Emissora': self.emissora,
+            'Transcrição': self.transcricao,
+            'Sentimento': self.sentimento,
+        }
+
+
+@dataclass(slots=True)
+class SocialRecord:
+    """Menções por plataforma em uma hora."""
+    hora_completa: datetime
+    mentions: dict = field(default_factory=dict)
+
+    def to_row(self):
+        row = {'Hora': self.hora_completa.strftime('%H:00'), 'HoraCompleta': self.hora_completa}
+        row.update({platform: self.mentions.get(platform, 0) for platform in SOCIAL_PLATFORMS})
+        row['Total'] = sum(row[platform] for platform in SOCIAL_PLATFORMS)
+        return row
+
+
+# ============================================
+# DTYPES DOS DATAFRAMES
+# ============================================
+NEWS_CATEGORICAL = ('Veículo', 'Categoria')
+RADIO_CATEGORICAL = ('Emissora', 'Transcrição')
+
+
+def _as_category(df, column):
+    if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+        df[column] = df[column].astype('category')
+
+
+def apply_news_schema(df):
+    """Aplica os dtypes compactos a um DataFrame de notícias (in-place e retorna)."""
+    if df.empty:
+        return df
+    for column in NEWS_CATEGORICAL:
+        _as_category(df, column)
+    return df
+
+
+def apply_radio_schema(df):
+    """Timestamp datetime64, emissora/transcrição categóricas e sentimento com categorias fixas."""
+    if df.empty:
+        return df
+    if 'Timestamp' in df.columns:
+        df['Timestamp'] = pd.to_datetime(df['Timestamp'])
+    for column in RADIO_CATEGORICAL:
+        _as_category(df, column)
+    if 'Sentimento' in df.columns:
+        df['Sentimento'] = df['Sentimento'].astype(SENTIMENT_DTYPE)
+    return df
+
+
+def apply_social_schema(df):
+    """Contagens em int32, HoraCompleta datetime64 e Hora categórica."""
+    if df.empty:
+        return df
+    if 'HoraCompleta' in df.columns:
+        df['HoraCompleta'] = pd.to_datetime(df['HoraCompleta'])
+    for column in (*SOCIAL_PLATFORMS, 'Total'):
+        if column in df.columns:
+            df[column] = df[column].astype('int32')
+    _as_category(df, 'Hora')
+    return df
+
+
+def news_frame(records):
+    """DataFrame de notícias a partir de NewsRecord (ou dicts já no formato de linha)."""
+    rows = [r.to_row() if isinstance(r, NewsRecord) else r for r in records]
+    return apply_news_schema(pd.DataFrame(rows))
+
+
+def radio_frame(records):
+    """DataFrame de rádio, do mais recente ao mais antigo (ordenado por datetime, não por texto)."""
+    df = apply_radio_schema(pd.DataFrame([r.to_row() for r in records]))
+    if not df.empty:
+        df = df.sort_values('Timestamp', ascending=False).reset_index(drop=True)
+    return df
+
+
+def social_frame(records):
+    return apply_social_schema(pd.DataFrame([r.to_row() for r in records]))
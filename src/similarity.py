@@ -0,0 +1,178 @@
+"""
+AgroPulse Media Watch - Cobertura Relacionada
+Índice TF-IDF incremental sobre títulos e transcrições, armazenado como
+matriz esparsa em listas invertidas (termo → documentos, pesos) e como
+linhas por documento, para a busca de vizinhos por cosseno sem nenhum
+modelo externo. A tokenização ignora acentos/caixa (PT/ES).
+
+Um documento pode ser reindexado (ex.: corpo do artigo baixado depois do
+título): a linha antiga é aposentada e deixa de aparecer nas buscas.
+
+O IDF é congelado em "instantâneos": novos documentos usam o IDF vigente e,
+quando o acervo cresce `refresh_ratio` desde o último instantâneo, o IDF e
+as normas são recalculados de forma vetorizada.
+"""
+
+import math
+import threading
+from array import array
+
+import numpy as np
+
+from text_utils import content_tokens
+
+
+class TfidfIndex:
+    """Índice TF-IDF incremental com busca top-k por similaridade de cosseno."""
+
+    def __init__(self, refresh_ratio=0.1):
+        self.refresh_ratio = refresh_ratio
+        self._vocab = {}                 # termo → id
+        self._df = array('i')            # id do termo → nº de documentos
+        self._idf = array('d')           # id do termo → IDF do instantâneo atual
+        self._post_docs = []             # id do termo → array('i') de documentos
+        self._post_tf = []               # id do termo → array('f') de tf (1 + log)
+        # Linhas da matriz (CSR): termos e tfs de cada documento, concatenados
+        self._row_terms = array('i')
+        self._row_tf = array('f')
+        self._row_offsets = array('q', [0])
+        self._norms = array('d')
+        self._ids = []                   # posição → id do item
+        self._positions = {}             # id do item → posição
+        self._payloads = []
+        self._retired = bytearray()      # posição → 1 se substituída por outra linha
+        self._snapshot_docs = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __contains__(self, item_id):
+        return item_id in self._positions
+
+    def _term_id(self, term):
+        term_id = self._vocab.get(term)
+        if term_id is None:
+            term_id = len(self._df)
+            self._vocab[term] = term_id
+            self._df.append(0)
+            # Termo novo: IDF máximo do instantâneo atual (df = 0)
+            self._idf.append(math.log((1 + self._snapshot_docs) / 1) + 1)
+            self._post_docs.append(array('i'))
+            self._post_tf.append(array('f'))
+        return term_id
+
+    @staticmethod
+    def _term_frequencies(text):
+        counts = {}
+        for token in content_tokens(text):
+            counts[token] = counts.get(token, 0) + 1
+        return {term: 1 + math.log(count) for term, count in counts.items()}
+
+    def add(self, item_id, text, payload=None, replace=False):
+        """
+        Indexa um documento e retorna a posição. Ids repetidos são ignorados,
+        a menos que `replace`: aí o texto novo substitui o anterior.
+        """
+        with self._lock:
+            previous = self._positions.get(item_id)
+            if previous is not None:
+                if not replace:
+                    return previous
+                self._retire(previous)
+            position = len(self._ids)
+            self._ids.append(item_id)
+            self._positions[item_id] = position
+            self._payloads.append(payload)
+            self._retired.append(0)
+
+            squared = 0.0
+            for term, tf in self._term_frequencies(text).items():
+                term_id = self._term_id(term)
+                self._df[term_id] += 1
+                self._post_docs[term_id].append(position)
+                self._post_tf[term_id].append(tf)
+                self._row_terms.append(term_id)
+                self._row_tf.append(tf)
+                squared += (tf * self._idf[term_id]) ** 2
+            self._row_offsets.append(len(self._row_terms))
+            self._norms.append(math.sqrt(squared))
+
+            if len(self._positions) > self._snapshot_docs * (1 + self.refresh_ratio):
+                self._refresh_idf()
+            return position
+
+    def _retire(self, position):
+        """Tira a linha das buscas e da contagem de documentos por termo."""
+        start, end = self._row_offsets[position], self._row_offsets[position + 1]
+        for term_id in self._row_terms[start:end]:
+            self._df[term_id] -= 1
+        self._retired[position] = 1
+
+    def _refresh_idf(self):
+        """Novo instantâneo: recalcula IDF de todos os termos e as normas."""
+        live_docs = len(self._positions)
+        n_docs = len(self._ids)
+        df = np.frombuffer(self._df, dtype=np.int32)
+        idf = np.log((1 + live_docs) / (1 + df)) + 1
+        self._idf = array('d', idf.tobytes())
+        self._snapshot_docs = live_docs
+
+        terms = np.frombuffer(self._row_terms, dtype=np.int32)
+        tfs = np.frombuffer(self._row_tf, dtype=np.float32)
+        lengths = np.diff(np.frombuffer(self._row_offsets, dtype=np.int64))
+        rows = np.repeat(np.arange(n_docs), lengths)
+        squared = np.bincount(rows, weights=(tfs * idf[terms]) ** 2, minlength=n_docs)
+        self._norms = array('d', np.sqrt(squared).tobytes())
+
+    def _query_weights(self, term_tfs):
+        return [(term_id, tf * self._idf[term_id]) for term_id, tf in term_tfs]
+
+    def _top_k(self, query, k, exclude=None):
+        query_norm = math.sqrt(sum(w * w for _, w in query))
+        n_docs = len(self._ids)
+        if not query or not query_norm or not n_docs:
+            return []
+        # Produto matriz esparsa × vetor pelas listas invertidas dos termos da consulta
+        docs = np.concatenate([np.frombuffer(self._post_docs[t], dtype=np.int32) for t, _ in query])
+        weights = np.concatenate([
+            np.frombuffer(self._post_tf[t], dtype=np.float32) * (self._idf[t] * w) for t, w in query
+        ])
+        dots = np.bincount(docs, weights=weights, minlength=n_docs)
+        norms = np.frombuffer(self._norms, dtype=np.float64)[:n_docs]
+        candidates = np.unique(docs)
+        candidates = candidates[np.frombuffer(self._retired, dtype=np.uint8)[candidates] == 0]
+        if exclude is not None:
+            candidates = candidates[candidates != exclude]
+        if not len(candidates):
+            return []
+        scores = dots[candidates] / (np.where(norms[candidates] > 0, norms[candidates], 1) * query_norm)
+        if len(candidates) > k:
+            best = np.argpartition(-scores, k)[:k]
+        else:
+            best = np.arange(len(candidates))
+        best = best[np.argsort(-scores[best])]
+        return [
+            (self._ids[candidates[i]], float(scores[i]), self._payloads[candidates[i]])
+            for i in best if scores[i] > 0
+        ]
+
+    def find_similar(self, item_id, k=5):
+        """Top-k vizinhos do documento `item_id`: [(id, score, payload)]."""
+        with self._lock:
+            position = self._positions.get(item_id)
+            if position is None:
+                return []
+            start, end = self._row_offsets[position], self._row_offsets[position + 1]
+            query = self._query_weights(zip(self._row_terms[start:end], self._row_tf[start:end]))
+            return self._top_k(query, k, exclude=position)
+
+    def search(self, text, k=5):
+        """Top-k documentos mais próximos de um texto livre."""
+        with self._lock:
+            query = self._query_weights(
+                (self._vocab[term], tf)
+                for term, tf in self._term_frequencies(text).items()
+                if term in self._vocab
+            )
+            return self._top_k(query, k)
@@ -0,0 +1,110 @@
+"""
+AgroPulse Media Watch - Snapshot de Inicialização
+Persiste o último conjunto de dados materializado do dashboard (notícias,
+rádio, social e resumo de sentimento) em Arrow IPC compacto, para que a
+primeira renderização após um deploy ou despertar da réplica seja imediata.
+"""
+
+import json
+import os
+from datetime import datetime
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+import media_engine
+from schema import apply_news_schema, apply_radio_schema, apply_social_schema
+
+SNAPSHOT_FRAMES = ('news', 'radio', 'social', 'sentiment')
+
+
+def _snapshot_dir(lang):
+    return os.path.join(media_engine.DATA_DIR, 'snapshot', lang)
+
+
+def _plain_lists(df):
+    """
+    Listas Arrow (quadros já publicados pelo serviço de dados) voltam a object:
+    o dtype 'list<...>[pyarrow]' gravado nos metadados não é lido de volta.
+    """
+    arrow_lists = [
+        column for column, dtype in df.dtypes.items()
+        if isinstance(dtype, pd.ArrowDtype) and pa.types.is_list(dtype.pyarrow_dtype)
+    ]
+    if not arrow_lists:
+        return df
+    return df.astype({column: object for column in arrow_lists})
+
+
+def save_snapshot(lang, web_news, radio_data, social_buzz, sentiment):
+    """
+    Grava o snapshot do idioma `lang` (Arrow IPC/Feather v2 com zstd).
+    Cada arquivo é gravado via temporário + rename; o manifesto é gravado por
+    último e só então o snapshot passa a ser considerado válido.
+    """
+    snapshot_dir = _snapshot_dir(lang)
+    os.makedirs(snapshot_dir, exist_ok=True)
+
+    frames = {
+        'news': web_news,
+        'radio': radio_data,
+        'social': social_buzz,
+        'sentiment': pd.DataFrame([sentiment]),
+    }
+    try:
+        for name, df in frames.items():
+            path = os.path.join(snapshot_dir, f'{name}.arrow')
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            feather.write_feather(_plain_lists(df.reset_index(drop=True)), tmp_path, compression='zstd')
+            os.replace(tmp_path, path)
+
+        manifest = {
+            'lang': lang,
+            'created_at': datetime.now().isoformat(),
+            'data_version': media_engine.get_data_version(),
+            'rows': {name: len(df) for name, df in frames.items()},
+        }
+        manifest_path = os.path.join(snapshot_dir, 'manifest.json')
+        tmp_manifest = f'{manifest_path}.{os.getpid()}.tmp'
+        with open(tmp_manifest, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        os.replace(tmp_manifest, manifest_path)
+    except Exception as e:
+        print(f"Erro ao salvar snapshot: {e}")
+
+
+def load_snapshot(lang):
+    """
+    Carrega o snapshot do idioma `lang`.
+    Retorna (web_news, radio_data, social_buzz, sentiment, manifest) ou None.
+    """
+    snapshot_dir = _snapshot_dir(lang)
+    manifest_path = os.path.join(snapshot_dir, 'manifest.json')
+    if not os.path.exists(manifest_path):
+        return None
+
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        frames = {
+            name: feather.read_feather(os.path.join(snapshot_dir, f'{name}.arrow'))
+            for name in SNAPSHOT_FRAMES
+        }
+    except Exception as e:
+        print(f"Erro ao carregar snapshot: {e}")
+        return None
+
+    sentiment_df = frames['sentiment']
+    sentiment = {
+        key: int(sentiment_df[key].iloc[0]) if key in sentiment_df.columns and not sentiment_df.empty else 0
+        for key in ('Positivo', 'Neutro', 'Negativo')
+    }
+    # Reaplica o esquema: snapshots antigos (colunas texto) ganham os dtypes compactos
+    return (
+        apply_news_schema(frames['news']),
+        apply_radio_schema(frames['radio']),
+        apply_social_schema(frames['social']),
+        sentiment,
+        manifest,
+    )
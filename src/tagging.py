@@ -0,0 +1,99 @@
+"""
+AgroPulse Media Watch - Tagging de Tópicos
+Atribui várias tags de tópico a cada item no momento da ingestão (mesmo
+autômato Aho-Corasick da watchlist) e mantém um índice invertido
+tag → itens, para que abas e filtros sejam consultas ao índice em vez de
+varreduras de texto a cada rerun.
+"""
+
+from text_utils import normalize_text
+from watchlist import AhoCorasick
+
+# Tag → palavras-chave (PT/ES). A comparação ignora acentos e caixa.
+TOPIC_TAGS = {
+    'Agro en Punta': ['Agro en Punta', 'Punta del Este', 'evento em Punta', 'evento en Punta'],
+    'soja': ['soja', 'sojicultor', 'complexo soja'],
+    'pecuária': ['pecuária', 'pecuaria', 'ganadería', 'ganaderia', 'boi', 'boi gordo', 'gado',
+                 'ganado', 'bovina', 'bovino', 'carne bovina', 'leilões', 'leilão', 'remates'],
+    'crédito rural': ['crédito rural', 'credito rural', 'financiamento rural', 'financiamiento',
+                      'plano safra', 'juros'],
+    'exportação': ['exportação', 'exportações', 'exportación', 'exportaciones', 'importação',
+                   'importación', 'novos mercados', 'nuevos mercados', 'acordo comercial',
+                   'acuerdo comercial'],
+    'clima': ['clima', 'seca', 'sequía', 'chuva', 'chuvas', 'lluvia', 'lluvias',
+              'previsão do tempo', 'pronóstico', 'el niño', 'la niña'],
+    'tecnologia': ['tecnologia', 'tecnología', 'agtech', 'inovação', 'inovações', 'innovación',
+                   'innovaciones', 'precisão', 'precisión', 'startups', 'digital'],
+    'grãos': ['grãos', 'granos', 'trigo', 'milho', 'maíz', 'arroz', 'safra', 'cosecha'],
+    'sustentabilidade': ['sustentabilidade', 'sostenibilidad', 'sustentabilidad',
+                         'regenerativa', 'carbono', 'rastreabilidade', 'trazabilidad'],
+}
+
+
+class TopicTagger:
+    """Classificador multi-rótulo por palavras-chave compiladas em um autômato."""
+
+    def __init__(self, tags=None):
+        tags = tags or TOPIC_TAGS
+        self.tag_names = list(tags)
+        self._automaton = AhoCorasick(
+            (normalize_text(keyword), tag)
+            for tag, keywords in tags.items()
+            for keyword in keywords
+        )
+
+    def tag(self, text):
+        """Retorna as tags do texto, na ordem de TOPIC_TAGS."""
+        found = {tag for _, _, tag in self._automaton.iter_matches(normalize_text(text))}
+        return [tag for tag in self.tag_names if tag in found]
+
+
+class TagIndex:
+    """
+    Índice invertido tag → posições (ou ids) de itens.
+    Construído uma vez por versão de dados; consultas não varrem o texto.
+    """
+
+    def __init__(self, postings=None):
+        self.postings = {tag: list(items) for tag, items in (postings or {}).items()}
+
+    def add(self, item, tags):
+        for tag in tags:
+            self.postings.setdefault(tag, []).append(item)
+
+    def tags(self):
+        return list(self.postings)
+
+    def lookup(self, tag):
+        """Itens com a tag (lista vazia se não existir)."""
+        return self.postings.get(tag, [])
+
+    def lookup_any(self, tags):
+        """União dos itens das tags, preservando a ordem de inserção."""
+        seen = set()
+        result = []
+        for tag in tags:
+            for item in self.postings.get(tag, []):
+                if item not in seen:
+                    seen.add(item)
+                    result.append(item)
+        return result
+
+    def search_tags(self, query):
+        """Tags cujo nome contém `query` (sem acentos/caixa) — poucas tags, não itens."""
+        q = normalize_text(query).strip()
+        return [tag for tag in self.postings if q and q in normalize_text(tag)]
+
+    def to_dict(self):
+        return {tag: list(items) for tag, items in self.postings.items()}
+
+
+def build_tag_index(df, column='Tags'):
+    """Índice tag → posições de linha (para `df.iloc`) a partir da coluna de tags."""
+    index = TagIndex()
+    if df.empty or column not in df.columns:
+        return index
+    for position, tags in enumerate(df[column]):
+        if isinstance(tags, (list, tuple)) or hasattr(tags, 'tolist'):
+            index.add(position, list(tags))
+    return index
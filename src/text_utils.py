@@ -0,0 +1,63 @@
+"""
+AgroPulse Media Watch - Utilitários de Texto
+Normalização de textos PT/ES (minúsculas, sem acentos) usada na
+correspondência de termos e na indexação, e o sentimento por léxico
+compartilhado por rádio e notícias.
+"""
+
+import re
+import unicodedata
+
+_WORD_RE = re.compile(r'[a-z0-9]+')
+
+# Palavras funcionais PT/ES (já sem acento), ignoradas em tendências e similaridade
+STOPWORDS = frozenset("""
+a o as os um uma uns umas de da do das dos em na no nas nos por para pra com sem sobre
+e ou que se ao aos pela pelo pelas pelos mais menos muito ja nao sim ha foi ser sao esta
+este esse essa isso isto entre ate apos como quando onde seu sua seus suas ele ela eles
+el la los las un una unos unas del al y en con sin por para que se es son mas muy ya no
+hay fue ser esta este ese esa eso entre hasta tras como cuando donde su sus le les lo
+""".split())
+
+# Léxico PT/ES (radicais, sem acento) para o sentimento de transcrições e notícias
+POSITIVE_STEMS = (
+    'record', 'excelent', 'benefic', 'anima', 'comemor', 'celebr', 'cresc', 'aplaus',
+    'avanc', 'parceri', 'alianz', 'acordo', 'acuerdo', 'inova', 'destaq', 'sucess', 'exito',
+)
+NEGATIVE_STEMS = (
+    'reclam', 'atras', 'preocup', 'pression', 'presion', 'seca', 'sequia', 'perda', 'perdid',
+    'protest', 'tensa', 'tension', 'critic', 'queda', 'caida', 'cris', 'prejuiz', 'burocra',
+)
+
+
+def normalize_text(text):
+    """Minúsculas e sem acentos: 'Pecuária' → 'pecuaria', 'Año' → 'ano'."""
+    if not text:
+        return ''
+    decomposed = unicodedata.normalize('NFKD', str(text).lower())
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def tokenize(text):
+    """Tokens alfanuméricos do texto normalizado."""
+    return _WORD_RE.findall(normalize_text(text))
+
+
+def content_tokens(text, min_length=3):
+    """Tokens sem stopwords e com pelo menos `min_length` caracteres."""
+    return [tok for tok in tokenize(text) if len(tok) >= min_length and tok not in STOPWORDS]
+
+
+def classify_sentiment(text):
+    """Positivo/Neutro/Negativo pelo saldo de radicais do léxico no texto."""
+    score = 0
+    for token in tokenize(text):
+        if token.startswith(POSITIVE_STEMS):
+            score += 1
+        elif token.startswith(NEGATIVE_STEMS):
+            score -= 1
+    if score > 0:
+        return 'Positivo'
+    if score < 0:
+        return 'Negativo'
+    return 'Neutro'
@@ -0,0 +1,175 @@
+"""
+AgroPulse Media Watch - Termos em Alta
+Detector de termos em ascensão sobre o fluxo de títulos e transcrições,
+em memória limitada independente do vocabulário: contagens aproximadas em
+count-min sketches por fatia de tempo (janela deslizante) e um conjunto
+limitado de candidatos de onde sai o top-k.
+"""
+
+import heapq
+import threading
+import time
+import zlib
+from array import array
+
+from text_utils import STOPWORDS, normalize_text, tokenize
+
+
+def extract_terms(text, bigrams=True):
+    """Termos de um texto: unigramas sem stopwords (3+ letras) e bigramas adjacentes."""
+    tokens = tokenize(normalize_text(text))
+    keep = [len(tok) >= 3 and tok not in STOPWORDS for tok in tokens]
+    terms = [tok for tok, ok in zip(tokens, keep) if ok]
+    if bigrams:
+        terms.extend(
+            f"{tokens[i]} {tokens[i + 1]}"
+            for i in range(len(tokens) - 1) if keep[i] and keep[i + 1]
+        )
+    return terms
+
+
+class CountMinSketch:
+    """Contagem aproximada (nunca subestima) em `depth` linhas de `width` contadores."""
+
+    def __init__(self, width=2048, depth=4):
+        self.width = width
+        self.depth = depth
+        self._rows = [array('l', bytes(8 * width)) for _ in range(depth)]
+
+    def _indexes(self, key):
+        data = key.encode('utf-8')
+        for seed in range(self.depth):
+            yield seed, zlib.crc32(data, seed * 0x9E3779B1 & 0xFFFFFFFF) % self.width
+
+    def add(self, key, count=1):
+        for row, idx in self._indexes(key):
+            self._rows[row][idx] += count
+
+    def estimate(self, key):
+        return min(self._rows[row][idx] for row, idx in self._indexes(key))
+
+    def clear(self):
+        for row in self._rows:
+            for i in range(self.width):
+                row[i] = 0
+
+
+class TrendingTerms:
+    """
+    Janela deslizante de `slots` fatias de `slot_seconds`, cada uma com seu
+    sketch. As `recent_slots` fatias mais novas formam a janela atual; as
+    demais, a linha de base. O crescimento compara as taxas das duas janelas.
+    Os candidatos ao top-k ficam limitados a `capacity` termos; o mais fraco
+    sai de um heap de mínimo com remoção preguiçosa (entradas desatualizadas
+    são descartadas ao chegar ao topo), em O(log k) por substituição.
+    """
+
+    def __init__(self, slot_seconds=300, slots=12, recent_slots=3, capacity=256,
+                 width=2048, depth=4, clock=time.time):
+        self.slot_seconds = slot_seconds
+        self.slots = slots
+        self.recent_slots = recent_slots
+        self.capacity = capacity
+        self._clock = clock
+        self._sketches = [CountMinSketch(width, depth) for _ in range(slots)]
+        self._slot_ids = [None] * slots
+        self._first_slot_id = None   # primeira fatia observada (início do histórico)
+        self._candidates = {}   # termo → contagem estimada na janela atual (no momento da inserção)
+        self._heap = []         # (contagem, termo); vale só se igual a _candidates[termo]
+        self._lock = threading.Lock()
+
+    def _slot(self, now):
+        slot_id = int(now // self.slot_seconds)
+        pos = slot_id % self.slots
+        if self._first_slot_id is None or slot_id < self._first_slot_id:
+            self._first_slot_id = slot_id
+        if self._slot_ids[pos] != slot_id:
+            # Fatia reaproveitada: descarta contagens de uma volta atrás
+            self._sketches[pos].clear()
+            self._slot_ids[pos] = slot_id
+        return slot_id, pos
+
+    def _window_count(self, term, current_slot_id):
+        recent = baseline = 0
+        for pos, slot_id in enumerate(self._slot_ids):
+            if slot_id is None:
+                continue
+            age = current_slot_id - slot_id
+            if age < 0 or age >= self.slots:
+                continue
+            count = self._sketches[pos].estimate(term)
+            if age < self.recent_slots:
+                recent += count
+            else:
+                baseline += count
+        return recent, baseline
+
+    def _set_candidate(self, term, count):
+        self._candidates[term] = count
+        heapq.heappush(self._heap, (count, term))
+        if len(self._heap) > 2 * self.capacity + 16:
+            # Muitas entradas desatualizadas: refaz o heap a partir do dicionário
+            self._rebuild_heap()
+
+    def _rebuild_heap(self):
+        self._heap = [(count, term) for term, count in self._candidates.items()]
+        heapq.heapify(self._heap)
+
+    def _weakest(self):
+        """Candidato de menor contagem (descarta entradas desatualizadas do topo)."""
+        while self._heap:
+            count, term = self._heap[0]
+            if self._candidates.get(term) == count:
+                return term
+            heapq.heappop(self._heap)
+        return None
+
+    def add_text(self, text, now=None):
+        """Conta os termos de um título/transcrição."""
+        self.add_terms(extract_terms(text), now)
+
+    def add_terms(self, terms, now=None):
+        if not terms:
+            return
+        now = self._clock() if now is None else now
+        with self._lock:
+            slot_id, pos = self._slot(now)
+            sketch = self._sketches[pos]
+            for term in terms:
+                sketch.add(term)
+                recent, _ = self._window_count(term, slot_id)
+                if term in self._candidates or len(self._candidates) < self.capacity:
+                    if self._candidates.get(term) != recent:
+                        self._set_candidate(term, recent)
+                else:
+                    weakest = self._weakest()
+                    if recent > self._candidates[weakest]:
+                        heapq.heappop(self._heap)
+                        del self._candidates[weakest]
+                        self._set_candidate(term, recent)
+
+    def trending(self, k=10, min_count=2, now=None):
+        """
+        Top-k termos da janela atual: lista de dicts com 'term', 'count'
+        (janela atual), 'baseline' e 'growth' (taxa atual / taxa de base,
+        com suavização +1 para termos novos). As taxas usam só as fatias já
+        observadas: logo após a partida a linha de base ainda é curta e não
+        pode ser diluída pela janela inteira.
+        """
+        now = self._clock() if now is None else now
+        with self._lock:
+            slot_id, _ = self._slot(now)
+            observed = min(slot_id - self._first_slot_id + 1, self.slots)
+            recent_span = min(self.recent_slots, observed)
+            baseline_span = max(observed - self.recent_slots, 1)
+            rows = []
+            for term in list(self._candidates):
+                recent, baseline = self._window_count(term, slot_id)
+                self._candidates[term] = recent
+                if recent < min_count:
+                    continue
+                growth = (recent / recent_span) / ((baseline + 1) / baseline_span)
+                rows.append({'term': term, 'count': recent, 'baseline': baseline,
+                             'growth': round(growth, 2)})
+            self._rebuild_heap()
+        return heapq.nlargest(k, rows, key=lambda r: (r['growth'] * r['count'], r['count']))
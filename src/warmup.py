@@ -0,0 +1,148 @@
+"""
+AgroPulse Media Watch - Aquecimento de Cache
+Pré-computa notícias, rádio e social para os dois idiomas fora do app
+(gravando o armazenamento de notícias e os snapshots de inicialização) e
+expõe um endpoint HTTP leve de saúde/aquecimento. Os caches em memória do
+próprio app são aquecidos por `?warmup=1` (ver keep_alive.py).
+
+Uso:
+    python src/warmup.py run                  # aquece uma vez e imprime o relatório
+    python src/warmup.py serve --port 8502    # GET /health e GET|POST /warmup
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import media_engine
+from media_engine import get_data_version, load_dashboard_sources
+from snapshot import save_snapshot
+
+WARMUP_LANGS = ('pt-br', 'es-uy')
+
+# Evita aquecimentos simultâneos disparados por vários keep-alives
+_warmup_lock = threading.Lock()
+
+
+def _file_age_seconds(path):
+    if not os.path.exists(path):
+        return None
+    return round(time.time() - os.path.getmtime(path), 1)
+
+
+def cache_state():
+    """Estado atual dos caches: armazenamento de notícias, snapshots e cache de fontes."""
+    snapshots = {}
+    for lang in WARMUP_LANGS:
+        manifest_path = os.path.join(media_engine.DATA_DIR, 'snapshot', lang, 'manifest.json')
+        snapshots[lang] = {
+            'present': os.path.exists(manifest_path),
+            'age_seconds': _file_age_seconds(manifest_path),
+        }
+
+    news_file = media_engine.NEWS_CACHE_FILE
+    return {
+        'news_cache': {
+            'present': os.path.exists(news_file),
+            'bytes': os.path.getsize(news_file) if os.path.exists(news_file) else 0,
+            'age_seconds': _file_age_seconds(news_file),
+        },
+        'snapshots': snapshots,
+        'data_version': get_data_version(),
+        'upstream_cache': media_engine.UPSTREAM_CACHE.stats(),
+    }
+
+
+def warm_caches(langs=WARMUP_LANGS):
+    """
+    Pré-computa os dados do dashboard para cada idioma e grava os snapshots.
+    Retorna relatório com latência por etapa e tamanho dos dados.
+    """
+    with _warmup_lock:
+        started = time.perf_counter()
+        report = {'started_at': datetime.now().isoformat(), 'langs': {}}
+
+        web_news = None
+        for lang in langs:
+            lang_started = time.perf_counter()
+            # Mesma carga do dashboard; as notícias (bilíngues) são buscadas uma vez
+            web_news, radio_data, social_buzz, sentiment = load_dashboard_sources(lang, web_news)
+            save_snapshot(lang, web_news, radio_data, social_buzz, sentiment)
+            report['langs'][lang] = {
+                'seconds': round(time.perf_counter() - lang_started, 3),
+                'radio_rows': len(radio_data),
+                'social_rows': len(social_buzz),
+            }
+        report['news_rows'] = 0 if web_news is None else len(web_news)
+
+        report['total_seconds'] = round(time.perf_counter() - started, 3)
+        report['cache_state'] = cache_state()
+        return report
+
+
+# ============================================
+# ENDPOINT HTTP DE SAÚDE / AQUECIMENTO
+# ============================================
+class WarmupHandler(BaseHTTPRequestHandler):
+    """GET /health → estado dos caches; GET|POST /warmup → aquece e reporta."""
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0]
+        if path == '/health':
+            self._send_json(200, {'status': 'ok', 'cache_state': cache_state()})
+        elif path == '/warmup':
+            self._warmup()
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    def do_POST(self):
+        if self.path.split('?', 1)[0] == '/warmup':
+            self._warmup()
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    def _warmup(self):
+        try:
+            self._send_json(200, {'status': 'ok', **warm_caches()})
+        except Exception as e:
+            self._send_json(500, {'status': 'error', 'error': str(e)})
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(host='0.0.0.0', port=8502):
+    """Sobe o servidor de saúde/aquecimento (bloqueante)."""
+    server = ThreadingHTTPServer((host, port), WarmupHandler)
+    print(f"Warm-up server em http://{host}:{port} (/health, /warmup)")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Aquecimento de cache do AgroPulse')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('run', help='aquece os caches uma vez')
+    serve_parser = subparsers.add_parser('serve', help='servidor HTTP /health e /warmup')
+    serve_parser.add_argument('--host', default='0.0.0.0')
+    serve_parser.add_argument('--port', type=int, default=8502)
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        print(json.dumps(warm_caches(), ensure_ascii=False, indent=2))
+    else:
+        serve(args.host, args.port)
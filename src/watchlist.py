@@ -0,0 +1,221 @@
+"""
+AgroPulse Media Watch - Watchlist
+Listas de termos monitorados (marcas, ministros, commodities, concorrentes)
+compiladas em um único autômato Aho-Corasick: cada título/transcrição é
+percorrido uma vez, em tempo linear, independentemente do número de termos.
+Siglas em maiúsculas (ex.: 'MAPA') casam só com a grafia em maiúsculas,
+para que a palavra comum ('mapa') não gere alertas.
+Correspondências geram alertas gravados em um log JSONL rotacionado.
+"""
+
+import json
+import os
+import re
+import threading
+from collections import deque
+from datetime import datetime
+
+from text_utils import normalize_text
+
+# Termos padrão por grupo (sobrescritos por data/watchlist.json, se existir)
+DEFAULT_WATCHLIST = {
+    'Evento': ['Agro en Punta', 'Punta del Este', 'evento em Punta', 'evento en Punta'],
+    'Marcas': ['Canal Rural', 'Agrolink', 'Expointer', 'Expo Prado', 'Expoagro'],
+    'Ministros': ['Ministro da Agricultura', 'Ministro de Agricultura', 'Ministra da Agricultura',
+                  'Ministra de Agricultura', 'MGAP', 'MAPA'],
+    'Commodities': ['soja', 'trigo', 'milho', 'maíz', 'arroz', 'boi gordo', 'carne bovina',
+                    'ganado', 'grãos', 'granos'],
+    'Concorrentes': ['Expointer', 'Expo Prado', 'Agrishow', 'Expoagro'],
+}
+
+# Grupo cujas correspondências classificam a notícia como "Agro en Punta"
+EVENT_GROUP = 'Evento'
+
+
+class AhoCorasick:
+    """
+    Autômato Aho-Corasick sobre texto normalizado. Os padrões só casam em
+    fronteiras de palavra (não casa 'mapa' dentro de 'mapas').
+    """
+
+    def __init__(self, patterns):
+        # patterns: iterável de (padrão_normalizado, payload)
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        self._payloads = []
+        for pattern, payload in patterns:
+            if pattern:
+                self._add(pattern, payload)
+        self._build_failure_links()
+
+    def _add(self, pattern, payload):
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(len(self._payloads))
+        self._payloads.append((len(pattern), payload))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                candidate = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = candidate if candidate != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter_matches(self, text):
+        """Gera (início, fim, payload) para cada ocorrência em `text` (já normalizado)."""
+        state = 0
+        goto, fail, out = self._goto, self._fail, self._out
+        length = len(text)
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for idx in out[state]:
+                size, payload = self._payloads[idx]
+                start = i - size + 1
+                if start > 0 and text[start - 1].isalnum():
+                    continue
+                if i + 1 < length and text[i + 1].isalnum():
+                    continue
+                yield start, i + 1, payload
+
+
+def is_acronym(term):
+    """Sigla (2+ letras, todas maiúsculas): casa respeitando maiúsculas."""
+    return len(term) >= 2 and term.isupper()
+
+
+class Watchlist:
+    """
+    Termos monitorados por grupo, compilados em um único autômato (siglas
+    em uma expressão regular sensível a maiúsculas sobre o texto original).
+    """
+
+    def __init__(self, groups):
+        self.groups = {group: list(terms) for group, terms in groups.items()}
+        patterns = []
+        self._acronyms = {}
+        for group, terms in self.groups.items():
+            for term in terms:
+                if is_acronym(term):
+                    self._acronyms.setdefault(term, []).append(group)
+                else:
+                    patterns.append((normalize_text(term), (term, group)))
+        self._automaton = AhoCorasick(patterns)
+        self._acronym_re = re.compile(
+            r'(?<!\w)(' + '|'.join(map(re.escape, sorted(self._acronyms, key=len, reverse=True))) + r')(?!\w)'
+        ) if self._acronyms else None
+
+    def _iter_terms(self, text):
+        for _, _, payload in self._automaton.iter_matches(normalize_text(text)):
+            yield payload
+        if self._acronym_re is not None and text:
+            for found in self._acronym_re.finditer(str(text)):
+                for group in self._acronyms[found.group(1)]:
+                    yield found.group(1), group
+
+    def match(self, text):
+        """Retorna as correspondências únicas como lista de {'term', 'group'}."""
+        seen = set()
+        matches = []
+        for term, group in self._iter_terms(text):
+            if (term, group) not in seen:
+                seen.add((term, group))
+                matches.append({'term': term, 'group': group})
+        return matches
+
+    def is_event(self, text):
+        """Indica se o texto cita o evento (grupo 'Evento')."""
+        return any(m['group'] == EVENT_GROUP for m in self.match(text))
+
+
+def load_watchlist(path=None):
+    """Carrega a watchlist de `path` (JSON {grupo: [termos]}) ou usa a padrão."""
+    if path and os.path.exists(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return Watchlist(json.load(f))
+        except Exception as e:
+            print(f"Erro ao carregar watchlist: {e}. Usando termos padrão.")
+    return Watchlist(DEFAULT_WATCHLIST)
+
+
+# ============================================
+# LOG DE ALERTAS
+# ============================================
+# Ao passar deste tamanho o log vira `<arquivo>.1` (uma geração anterior mantida)
+ALERTS_MAX_BYTES = 5 * 1024 * 1024
+_TAIL_BLOCK_BYTES = 64 * 1024
+_alerts_lock = threading.Lock()
+
+
+def record_alerts(alerts_file, alerts, max_bytes=ALERTS_MAX_BYTES):
+    """
+    Acrescenta alertas ao log JSONL (um alerta por linha), rotacionando por
+    tamanho. O lock do módulo só exclui threads; entre processos o chamador
+    segura o lock do armazenamento (media_engine._news_store_lock).
+    """
+    if not alerts:
+        return
+    os.makedirs(os.path.dirname(os.path.abspath(alerts_file)), exist_ok=True)
+    now = datetime.now().isoformat()
+    with _alerts_lock:
+        try:
+            if os.path.getsize(alerts_file) >= max_bytes:
+                os.replace(alerts_file, f'{alerts_file}.1')
+        except FileNotFoundError:
+            pass
+        with open(alerts_file, 'a', encoding='utf-8') as f:
+            for alert in alerts:
+                alert.setdefault('at', now)
+                f.write(json.dumps(alert, ensure_ascii=False) + '\n')
+
+
+def _tail_lines(path, limit):
+    """Últimas `limit` linhas completas do arquivo, lendo blocos a partir do fim."""
+    try:
+        f = open(path, 'rb')
+    except FileNotFoundError:
+        return []
+    with f:
+        end = f.seek(0, os.SEEK_END)
+        data = b''
+        pos = end
+        while pos > 0 and data.count(b'\n') <= limit:
+            step = min(_TAIL_BLOCK_BYTES, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    lines = data.split(b'\n')
+    if pos > 0:
+        lines = lines[1:]  # primeira linha do bloco pode estar cortada
+    return [line.decode('utf-8', errors='replace') for line in lines if line.strip()][-limit:]
+
+
+def load_recent_alerts(alerts_file, limit=50):
+    """Retorna os `limit` alertas mais recentes (mais novo primeiro), sem ler o log inteiro."""
+    lines = _tail_lines(alerts_file, limit)
+    if len(lines) < limit:
+        lines = _tail_lines(f'{alerts_file}.1', limit - len(lines)) + lines
+    alerts = []
+    for line in reversed(lines):
+        try:
+            alerts.append(json.loads(line))
+        except ValueError:
+            continue
+    return alerts
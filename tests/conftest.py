@@ -0,0 +1,72 @@
+"""Configuração comum dos testes: módulos de src/ (e scripts da raiz) importáveis como no app."""
+
+import os
+import sys
+import tempfile
+import threading
+import types
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(ROOT_DIR, 'src')
+for path in (SRC_DIR, ROOT_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+# Nunca grava em data/ do repositório (definido antes de importar media_engine)
+os.environ.setdefault('AGROPULSE_DATA_DIR', tempfile.mkdtemp(prefix='agropulse-tests-'))
+
+
+@pytest.fixture
+def local_http_server():
+    """Fábrica de servidores HTTP locais: `local_http_server(handler)` → URL base; encerrados no fim do teste."""
+    servers = []
+
+    def start(handler):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f'http://127.0.0.1:{server.server_address[1]}'
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Armazenamento do media_engine isolado em um diretório temporário."""
+    import media_engine
+
+    monkeypatch.setattr(media_engine, 'DATA_DIR', str(tmp_path))
+    monkeypatch.setattr(media_engine, 'NEWS_CACHE_FILE', str(tmp_path / 'news_cache.json'))
+    monkeypatch.setattr(media_engine, 'ALERTS_FILE', str(tmp_path / 'alerts.jsonl'))
+    monkeypatch.setattr(media_engine, 'RADIO_TRANSCRIPTS_FILE', str(tmp_path / 'radio_transcripts.jsonl'))
+    monkeypatch.setattr(media_engine, 'DATA_VERSION_FILE', str(tmp_path / 'data_version'))
+    monkeypatch.setattr(media_engine, '_known_links', set())
+    monkeypatch.setattr(media_engine, '_radio_offset', 0)
+    return tmp_path
+
+
+@pytest.fixture
+def offline_app(data_dir, monkeypatch):
+    """Dashboard com fontes externas simuladas (as do load_test) e caches de processo zerados."""
+    import streamlit as st
+
+    import load_test
+    import media_engine
+    from request_cache import SingleFlightCache
+
+    fake_module = types.ModuleType('GoogleNews')
+    fake_module.GoogleNews = load_test._MockGoogleNews
+    monkeypatch.setitem(sys.modules, 'GoogleNews', fake_module)
+    monkeypatch.setattr(media_engine, 'urlopen', load_test._mock_urlopen)
+    monkeypatch.setattr(media_engine, 'UPSTREAM_CACHE', SingleFlightCache(max_entries=256, ttl=600))
+    st.cache_resource.clear()
+    st.cache_data.clear()
+    yield data_dir
+    st.cache_resource.clear()
+    st.cache_data.clear()
@@ -0,0 +1,133 @@
+import gzip
+import json
+from datetime import datetime, timedelta
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+
+import api_server
+import media_engine
+from request_cache import SingleFlightCache
+from schema import RadioRecord
+
+
+@pytest.fixture
+def api(data_dir, monkeypatch, local_http_server):
+    monkeypatch.setattr(api_server, '_datasets', SingleFlightCache(max_entries=4, ttl=3600))
+    now = datetime.now().replace(microsecond=0)
+    news = [
+        {'Hora': '10:00', 'Veículo': 'Canal Rural', 'Título': f'Notícia {i}', 'Link': f'https://a/{i}',
+         'Categoria': 'Mercado' if i % 2 else 'Clima', '_cached_at': (now - timedelta(hours=i)).isoformat()}
+        for i in range(5)
+    ]
+    (data_dir / 'news_cache.json').write_text(json.dumps({'news': news}), encoding='utf-8')
+    media_engine.store_radio_records([
+        RadioRecord(now - timedelta(minutes=30), 'Rural AM', 'Seca preocupa produtores', 'Negativo'),
+        RadioRecord(now - timedelta(minutes=20), 'Carve 850 AM', 'Safra recorde', 'Positivo'),
+        RadioRecord(now - timedelta(minutes=10), 'Rural AM', 'Remate de gado em Tacuarembó', 'Neutro'),
+    ])
+    return local_http_server(api_server.ApiHandler)
+
+
+def _get(url, headers=None):
+    try:
+        with urlopen(Request(url, headers=headers or {}), timeout=10) as response:
+            return response.status, response.headers, response.read()
+    except HTTPError as e:
+        return e.code, e.headers, e.read()
+
+
+def test_news_pagination_follows_cursor(api):
+    status, _, body = _get(f'{api}/news?limit=2')
+    assert status == 200
+    page = json.loads(body)
+    assert [item['Título'] for item in page['items']] == ['Notícia 0', 'Notícia 1']
+    titles = [item['Título'] for item in page['items']]
+    while page['next_cursor']:
+        page = json.loads(_get(f"{api}/news?limit=2&cursor={page['next_cursor']}")[2])
+        titles += [item['Título'] for item in page['items']]
+    assert titles == [f'Notícia {i}' for i in range(5)]
+
+    mercado = json.loads(_get(f'{api}/news?categoria=Mercado')[2])
+    assert [item['Título'] for item in mercado['items']] == ['Notícia 1', 'Notícia 3']
+
+
+def test_etag_answers_304_until_data_changes(api):
+    status, headers, _ = _get(f'{api}/radio')
+    etag = headers['ETag']
+    assert status == 200 and etag
+    assert _get(f'{api}/radio', {'If-None-Match': etag})[0] == 304
+    # Outro filtro, outra ETag
+    assert _get(f'{api}/radio?emissora=Rural%20AM', {'If-None-Match': etag})[0] == 200
+
+    media_engine.store_radio_records([
+        RadioRecord(datetime.now(), 'Rural AM', 'Chuva volta ao norte', 'Positivo'),
+    ])
+    status, headers, body = _get(f'{api}/radio', {'If-None-Match': etag})
+    assert status == 200 and headers['ETag'] != etag
+    assert json.loads(body)['items'][0]['Transcrição'] == 'Chuva volta ao norte'
+
+
+def test_gzip_only_when_accepted(api):
+    status, headers, body = _get(f'{api}/news', {'Accept-Encoding': 'gzip'})
+    assert status == 200 and headers['Content-Encoding'] == 'gzip'
+    assert len(json.loads(gzip.decompress(body))['items']) == 5
+    _, headers, body = _get(f'{api}/news')
+    assert headers['Content-Encoding'] is None
+    assert len(json.loads(body)['items']) == 5
+
+
+def test_radio_filters_and_sentiment_summary(api):
+    radio = json.loads(_get(f'{api}/radio?emissora=Rural%20AM&sentimento=Neutro')[2])
+    assert [item['Transcrição'] for item in radio['items']] == ['Remate de gado em Tacuarembó']
+
+    sentiment = json.loads(_get(f'{api}/sentiment')[2])
+    assert sentiment['summary'] == {'Positivo': 1, 'Neutro': 1, 'Negativo': 1}
+    assert sentiment['stations']['Rural AM'] == {'Positivo': 0, 'Neutro': 1, 'Negativo': 1}
+    only = json.loads(_get(f'{api}/sentiment?emissora=Carve%20850%20AM')[2])
+    assert list(only['stations']) == ['Carve 850 AM'] and only['summary']['Positivo'] == 1
+
+
+@pytest.mark.parametrize('query', ['/news?limit=dez', '/news?cursor=%%%', '/radio?sentimento=Otimista'])
+def test_bad_parameters_answer_400(api, query):
+    status, _, body = _get(f'{api}{query}')
+    assert status == 400 and json.loads(body)['error']
+
+
+@pytest.mark.parametrize('route, key', [
+    ('/news', [1, 2]),
+    ('/news', {'a': 1, 'b': 2}),
+    ('/news', ['2026-03-01T10:00:00']),
+    ('/radio', ['2026-03-01T10:00:00', 'Rural AM']),
+    ('/radio', ['2026-03-01T10:00:00', 'Rural AM', None]),
+])
+def test_cursor_of_the_wrong_shape_answers_400(api, route, key):
+    status, _, body = _get(f'{api}{route}?cursor={api_server.encode_cursor(key)}')
+    assert status == 400 and json.loads(body)['error'] == 'cursor inválido'
+
+
+def test_unexpected_error_answers_generic_500(api, monkeypatch, capsys):
+    def broken(dataset, params):
+        raise RuntimeError('/srv/agropulse/data/news_cache.json corrompido')
+
+    monkeypatch.setitem(api_server.ROUTES, '/news', broken)
+    status, _, body = _get(f'{api}/news')
+    assert status == 500
+    assert json.loads(body) == {'error': 'erro interno'}
+    # O detalhe fica só no log do servidor
+    assert 'news_cache.json corrompido' in capsys.readouterr().out
+
+
+def test_etag_is_weak_and_shared_by_gzip_and_identity(api):
+    _, gzipped, _ = _get(f'{api}/news', {'Accept-Encoding': 'gzip'})
+    _, identity, _ = _get(f'{api}/news')
+    assert gzipped['ETag'].startswith('W/"')
+    assert gzipped['ETag'] == identity['ETag']
+    assert _get(f'{api}/news', {'If-None-Match': gzipped['ETag'], 'Accept-Encoding': 'gzip'})[0] == 304
+
+
+def test_health_and_unknown_route(api):
+    status, _, body = _get(f'{api}/health')
+    assert status == 200 and json.loads(body)['version'] == api_server.data_version()
+    assert _get(f'{api}/nada')[0] == 404
@@ -0,0 +1,56 @@
+from streamlit.testing.v1 import AppTest
+
+import load_test
+
+APP_FILE = load_test.ROOT_DIR + '/app.py'
+
+
+def test_topic_search_uses_the_store_tag_index(offline_app, monkeypatch):
+    import tagging
+
+    at = AppTest.from_file(APP_FILE, default_timeout=30).run()
+    assert not at.exception
+    built = []
+    original = tagging.build_tag_index
+    monkeypatch.setattr(tagging, 'build_tag_index', lambda *a, **k: built.append(a) or original(*a, **k))
+
+    at.text_input[0].input('soja').run()
+    assert not at.exception
+    at.multiselect[0].set_value(['Rádio']).run()
+    assert not at.exception
+    # Índice montado na ingestão, não a cada interação
+    assert built == []
+
+
+def _load_clip_app():
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location('clip_app', APP_FILE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_topic_search_lists_the_clips_counted_by_the_kpis(offline_app):
+    import pandas as pd
+
+    from cube import Cube, summarize_clips
+
+    clip_app = _load_clip_app()
+    clips = clip_app.generate_mock_clips(clip_app.init_faker(), n=4)
+    # Título marcado com 'soja' em um tópico que não casa com a busca
+    clips['titulo'] = ['Colheita de soja avança', 'Boi gordo sobe', 'Chuva no sul', 'Soja em alta']
+    clips['topico'] = pd.Categorical(
+        ['Preço do Boi', 'Preço do Boi', 'Clima e Agricultura', 'Safra de Soja'],
+        categories=clips['topico'].cat.categories,
+    )
+    clips['tags'] = [['Preço do Boi', 'soja', 'pecuária'], ['Preço do Boi', 'pecuária'],
+                     ['Clima e Agricultura', 'clima'], ['Safra de Soja', 'soja', 'grãos']]
+    store = {'clips': pd.DataFrame(), 'cube': Cube(), 'tag_index': None, 'topic_index': None}
+    clip_app.ingest_clips(store, clips)
+
+    for fontes in (None, list(clips['fonte'].unique()[:1])):
+        listed, topicos = clip_app.filter_clips(store, 'soja', fontes)
+        assert topicos == {'Safra de Soja'}
+        assert set(listed['topico']) <= topicos
+        assert len(listed) == summarize_clips(store['cube'], fontes=fontes, topicos=topicos)['total']
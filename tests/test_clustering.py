@@ -0,0 +1,58 @@
+import pandas as pd
+
+from clustering import NearDuplicateIndex, collapse_clusters, estimate_similarity, minhash, shingles
+
+
+def test_minhash_estimates_similarity():
+    a = minhash(shingles('Soja bate recorde de exportação em março'))
+    b = minhash(shingles('Soja bate recorde de exportações em março'))
+    c = minhash(shingles('Leilão de gado movimenta remates em Tacuarembó'))
+    assert estimate_similarity(a, a) == 1.0
+    assert estimate_similarity(a, b) > 0.5 > estimate_similarity(a, c)
+    # Acentos e caixa não mudam a assinatura
+    assert minhash(shingles('EXPORTACAO de soja')) == minhash(shingles('exportação de soja'))
+    assert minhash(shingles('')) is None
+
+
+def test_near_duplicates_share_cluster():
+    index = NearDuplicateIndex()
+    assert index.add('a', 'Soja bate recorde de exportação em março') == 'a'
+    assert index.add('b', 'Soja bate recorde de exportação em março, diz governo') == 'a'
+    assert index.add('c', 'Leilão de gado movimenta remates em Tacuarembó') == 'c'
+    # Item já indexado mantém o cluster; cluster forçado na reconstrução
+    assert index.add('b', 'outro texto qualquer') == 'a'
+    assert index.add('d', 'Crédito rural fica mais caro', cluster_id='c') == 'c'
+    assert index.cluster_of('b') == 'a' and index.cluster_of('x') is None
+
+
+def test_eviction_keeps_max_items():
+    index = NearDuplicateIndex(max_items=2)
+    index.add('a', 'Soja bate recorde de exportação em março')
+    index.add('b', 'Leilão de gado movimenta remates em Tacuarembó')
+    index.add('c', 'Crédito rural fica mais caro no plano safra')
+    assert len(index) == 2 and index.cluster_of('a') is None
+    # Sem a assinatura antiga, a mesma pauta abre um cluster novo
+    assert index.add('e', 'Soja bate recorde de exportação em março') == 'e'
+
+
+def test_empty_text_is_not_indexed():
+    index = NearDuplicateIndex(max_items=2)
+    for i in range(10):
+        assert index.add(f'vazio{i}', '') is None
+    assert index.add('forcado', '   ', cluster_id='c') == 'c'
+    assert len(index) == 0 and index._clusters == {}
+    assert index.cluster_of('vazio0') is None
+
+
+def test_collapse_clusters_counts_outlets():
+    df = pd.DataFrame({
+        'Título': ['Soja recorde', 'Soja recorde!', 'Soja recorde', 'Gado em alta', 'Sem cluster'],
+        'Veículo': ['Canal Rural', 'Agrolink', 'Canal Rural', 'El País', 'Agrolink'],
+        'Link': ['https://a/1', 'https://a/2', 'https://a/3', 'https://a/4', 'https://a/5'],
+        'Cluster': ['a', 'a', 'a', 'd', None],
+    })
+    collapsed = collapse_clusters(df)
+    assert collapsed['Link'].tolist() == ['https://a/1', 'https://a/4', 'https://a/5']
+    assert collapsed['Veículos'].tolist() == [2, 1, 1]
+    without_clusters = df.drop(columns=['Cluster'])
+    assert collapse_clusters(without_clusters) is without_clusters
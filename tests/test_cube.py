@@ -0,0 +1,61 @@
+import pandas as pd
+
+from cube import Cube, summarize_clips
+
+
+def _clips():
+    return pd.DataFrame([
+        {'dia': '2026-03-01', 'fonte': 'Web', 'veiculo': 'Canal Rural', 'topico': 'Soja', 'sentimento': 'Positivo', 'alcance': 100},
+        {'dia': '2026-03-01', 'fonte': 'Web', 'veiculo': 'Agrolink', 'topico': 'Soja', 'sentimento': 'Neutro', 'alcance': 50},
+        {'dia': '2026-03-01', 'fonte': 'Rádio', 'veiculo': 'Rural AM', 'topico': 'Gado', 'sentimento': 'Negativo', 'alcance': 30},
+        {'dia': '2026-03-02', 'fonte': 'Web', 'veiculo': 'Canal Rural', 'topico': 'Soja', 'sentimento': 'Positivo', 'alcance': 20},
+    ])
+
+
+def test_add_frame_matches_add():
+    by_frame = Cube()
+    by_frame.add_frame(_clips())
+    by_record = Cube()
+    for record in _clips().to_dict('records'):
+        by_record.add(record)
+    assert by_frame.rollup(('dia', 'veiculo')) == by_record.rollup(('dia', 'veiculo'))
+    # Células iguais são somadas: 4 clippings, 4 combinações distintas
+    assert len(by_frame) == 4
+
+
+def test_rollup_with_filters():
+    cube = Cube()
+    cube.add_frame(_clips())
+    assert cube.rollup() == {(): [4, 200]}
+    assert cube.rollup(('topico',), fonte=['Web']) == {('Soja',): [3, 170]}
+    assert cube.rollup(('veiculo',), topico=['Soja'], dia=['2026-03-01']) == {
+        ('Canal Rural',): [1, 100], ('Agrolink',): [1, 50],
+    }
+    # None não filtra
+    assert cube.rollup((), fonte=None) == {(): [4, 200]}
+    assert cube.rollup((), fonte=['TV']) == {}
+
+
+def test_rollup_cache_follows_version():
+    cube = Cube()
+    cube.add_frame(_clips())
+    first = cube.rollup(('fonte',))
+    assert cube.rollup(('fonte',)) is first
+    cube.add({'dia': '2026-03-02', 'fonte': 'Rádio', 'veiculo': 'Rural AM', 'topico': 'Gado',
+              'sentimento': 'Neutro', 'alcance': 10})
+    assert cube.rollup(('fonte',))[('Rádio',)] == [2, 40]
+
+
+def test_summarize_clips():
+    cube = Cube()
+    cube.add_frame(_clips())
+    summary = summarize_clips(cube, fontes=['Web'])
+    assert (summary['total'], summary['alcance'], summary['positivos'], summary['veiculos']) == (3, 170, 2, 2)
+    assert dict(zip(summary['sentimento']['sentimento'], summary['sentimento']['contagem'])) == {
+        'Positivo': 2, 'Neutro': 1,
+    }
+    assert summary['timeline'].values.tolist() == [['2026-03-01', 'Web', 2], ['2026-03-02', 'Web', 1]]
+
+    empty = summarize_clips(Cube())
+    assert (empty['total'], empty['alcance'], empty['positivos'], empty['veiculos']) == (0, 0, 0, 0)
+    assert empty['timeline'].empty
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from data_service import DataService, freeze_frame, frame_view
+
+
+def test_freeze_frame_turns_list_columns_into_arrow_lists():
+    df = freeze_frame(pd.DataFrame({'Link': ['https://a/1', 'https://a/2'], 'Tags': [['soja'], []]}))
+    assert isinstance(df['Tags'].dtype, pd.ArrowDtype)
+    assert list(df['Tags'].iloc[0]) == ['soja']
+    assert not isinstance(df['Link'].dtype, pd.ArrowDtype)
+
+
+def test_view_shares_buffers_and_writes_do_not_leak():
+    shared = pd.DataFrame({'Total': np.arange(5, dtype='int32')})
+    shared.attrs['data_key'] = 'v1'
+    view = frame_view(shared)
+    assert np.shares_memory(view['Total'].to_numpy(), shared['Total'].to_numpy())
+    assert view.attrs['data_key'] == 'v1'
+
+    view.loc[0, 'Total'] = 99
+    view.attrs['data_key'] = 'v2'
+    assert shared.loc[0, 'Total'] == 0
+    assert shared.attrs['data_key'] == 'v1'
+
+
+def test_service_loads_each_key_once_until_invalidated():
+    service = DataService()
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return pd.DataFrame({'x': [1, 2]}), {'total': 2}
+
+    first, summary = service.get(('dashboard', 'pt-br', 0), loader)
+    second, _ = service.get(('dashboard', 'pt-br', 0), loader)
+    assert len(loads) == 1 and service.version == 1
+    assert first is not second
+    summary['total'] = 0
+    assert service.get(('dashboard', 'pt-br', 0), loader)[1] == {'total': 2}
+
+    service.invalidate()
+    service.get(('dashboard', 'pt-br', 0), loader)
+    assert len(loads) == 2 and service.stats()['version'] == 2
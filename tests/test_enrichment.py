@@ -0,0 +1,86 @@
+import json
+from functools import partial
+from http.server import SimpleHTTPRequestHandler
+
+import pytest
+
+import media_engine
+from enrichment import ArticleEnricher, ArticleStore, extract_main_text
+
+ARTICLE_HTML = """<html><head><title>x</title><script>var a = 1;</script></head><body>
+<nav><p>Menu principal com muitos links de navegação do portal agro</p></nav>
+<article>
+<p>A colheita de soja no Uruguai bate recorde histórico e anima os produtores da região.</p>
+<p>Os exportadores celebram a parceria com novos mercados asiáticos para o complexo soja.</p>
+</article>
+<footer><p>Todos os direitos reservados ao portal de notícias do agronegócio</p></footer>
+</body></html>"""
+
+
+@pytest.fixture
+def page_server(tmp_path, local_http_server):
+    """Servidor HTTP local com páginas salvas (stand-in dos veículos)."""
+    site = tmp_path / 'site'
+    site.mkdir()
+    (site / 'soja.html').write_text(ARTICLE_HTML, encoding='utf-8')
+    return local_http_server(partial(SimpleHTTPRequestHandler, directory=str(site)))
+
+
+def test_extract_main_text_prefers_article_paragraphs():
+    text = extract_main_text(ARTICLE_HTML)
+    assert text.startswith('A colheita de soja')
+    assert 'Menu principal' not in text
+    assert 'direitos reservados' not in text
+
+
+def test_enricher_downloads_each_article_once(page_server, tmp_path):
+    enricher = ArticleEnricher(ArticleStore(str(tmp_path / 'articles')))
+    urls = [f'{page_server}/soja.html', f'{page_server}/removida.html']
+    bodies = enricher.enrich(urls)
+    assert list(bodies) == [f'{page_server}/soja.html']
+    assert enricher.stats == {'downloads': 1, 'cache_hits': 0, 'errors': 1}
+    # 200 vem do cache; 404 ficou registrado como falha definitiva
+    assert enricher.enrich(urls) == bodies
+    assert enricher.stats['downloads'] == 1
+    assert enricher.stats['cache_hits'] == 2
+
+
+def test_enricher_uses_injected_fetch(tmp_path):
+    calls = []
+
+    def fetch(url, timeout):
+        calls.append(url)
+        return ARTICLE_HTML
+
+    enricher = ArticleEnricher(ArticleStore(str(tmp_path / 'articles')), fetch=fetch)
+    bodies = enricher.enrich(['https://a.com/1', 'https://b.com/2', 'https://a.com/1'])
+    assert calls.count('https://a.com/1') == 1
+    # Mesmo texto em dois veículos: um único objeto no cache por conteúdo
+    assert bodies['https://a.com/1'] == bodies['https://b.com/2']
+    assert len(list((tmp_path / 'articles' / 'objetos').rglob('*.txt.gz'))) == 1
+
+
+def test_enrich_news_store_indexes_body_and_sentiment(data_dir, page_server, monkeypatch):
+    monkeypatch.setattr(media_engine, 'ARTICLE_ENRICHER', ArticleEnricher(ArticleStore(str(data_dir / 'articles'))))
+    link = f'{page_server}/soja.html'
+    media_engine.backfill_news([
+        {'Hora': 'Agora', 'Veículo': 'Portal', 'Título': 'Mercado em movimento', 'Link': link},
+    ])
+
+    assert media_engine.enrich_news_store(force=True) == 1
+
+    with open(media_engine.NEWS_CACHE_FILE, encoding='utf-8') as f:
+        [item] = json.load(f)['news']
+    assert 'soja' in item['Tags']
+    assert item['Sentimento'] == 'Positivo'
+    # Corpo só no ArticleStore: o item guarda o digest
+    assert 'Corpo' not in item
+    assert 'colheita de soja' in media_engine.ARTICLE_ENRICHER.store.read(item['CorpoHash'])
+    # O corpo entrou no índice: a busca por palavras só do corpo encontra o item
+    assert link in [item_id for item_id, _, _ in media_engine.SIMILARITY_INDEX.search('exportadores asiáticos')]
+    # Outro processo indexa a partir do armazenamento, lendo o corpo pelo digest
+    from similarity import TfidfIndex
+
+    monkeypatch.setattr(media_engine, 'SIMILARITY_INDEX', TfidfIndex())
+    media_engine._seed_indexes([item])
+    assert link in [item_id for item_id, _, _ in media_engine.SIMILARITY_INDEX.search('exportadores asiáticos')]
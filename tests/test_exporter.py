@@ -0,0 +1,120 @@
+import csv
+import json
+from datetime import datetime
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import cli
+import exporter
+import media_engine
+from schema import RadioRecord
+
+
+def _store(data_dir):
+    news = [
+        {'Hora': '10:00', 'Veículo': 'Canal Rural', 'Título': 'Soja bate recorde', 'Link': 'https://a/1',
+         'Categoria': 'Mercado', 'Tags': ['soja', 'preços'], 'Termos': ['soja'],
+         'Sentimento': 'Positivo', '_cached_at': '2026-03-01T10:00:00'},
+        {'Hora': '11:00', 'Veículo': 'Agrolink', 'Título': 'Chuva no Sul', 'Link': 'https://a/2',
+         'Categoria': 'Clima', '_cached_at': '2026-04-01T11:00:00'},
+    ]
+    (data_dir / 'news_cache.json').write_text(json.dumps({'news': news}), encoding='utf-8')
+    media_engine.store_radio_records([
+        RadioRecord(datetime(2026, 3, 1, 9, 30), 'Rural AM', 'Seca preocupa produtores', 'Negativo'),
+        RadioRecord(datetime(2026, 3, 2, 9, 30), 'Carve 850 AM', 'Safra recorde', 'Positivo'),
+    ])
+
+
+def test_parquet_keeps_types(data_dir, tmp_path):
+    _store(data_dir)
+    result = exporter.export(kinds=('news', 'radio'), output_dir=str(tmp_path / 'out'), fmt='parquet')
+    news = pq.read_table(result['news'][0])
+    assert news.schema.field('Tags').type == pa.list_(pa.string())
+    assert pa.types.is_timestamp(news.schema.field('_cached_at').type)
+    rows = news.to_pylist()
+    assert rows[0]['Tags'] == ['soja', 'preços'] and rows[0]['Termos'] == ['soja']
+    assert rows[0]['_cached_at'] == datetime(2026, 3, 1, 10)
+    assert rows[1]['Tags'] is None
+    # Rádio vem das transcrições reais, não do snapshot
+    radio = pq.read_table(result['radio'][0]).to_pylist()
+    assert [r['Emissora'] for r in radio] == ['Rural AM', 'Carve 850 AM']
+    assert radio[0]['Timestamp'] == datetime(2026, 3, 1, 9, 30)
+
+
+def test_csv_writes_lists_as_json_and_filters(data_dir, tmp_path):
+    _store(data_dir)
+    result = exporter.export(
+        kinds=('news', 'radio'), output_dir=str(tmp_path / 'out'),
+        date_from=datetime(2026, 3, 1), date_to=datetime(2026, 3, 2),
+    )
+    assert result['news'][1] == 1 and result['radio'][1] == 1
+    with open(result['news'][0], encoding='utf-8') as f:
+        row = next(csv.DictReader(f))
+    assert json.loads(row['Tags']) == ['soja', 'preços']
+    assert row['_cached_at'] == '2026-03-01T10:00:00'
+
+
+def test_empty_export_writes_schema(data_dir, tmp_path):
+    result = exporter.export(kinds=('radio',), output_dir=str(tmp_path / 'out'), fmt='parquet')
+    table = pq.read_table(result['radio'][0])
+    assert table.num_rows == 0 and table.schema.names == exporter.EXPORT_SCHEMAS['radio'].names
+
+
+def test_cli_runs_as_read_only_replica(data_dir, tmp_path, monkeypatch, capsys):
+    _store(data_dir)
+    calls = []
+    monkeypatch.setattr(media_engine, 'use_read_only_replica', lambda: calls.append(True))
+    cli.main(['export', '--kind', 'radio', '--sentiment', 'Negativo', '--output', str(tmp_path / 'out')])
+    assert calls == [True]
+    assert 'radio: 1 registros' in capsys.readouterr().out
+
+
+def test_cli_enrich_forces_outside_leadership(monkeypatch, capsys):
+    calls = []
+    monkeypatch.setattr(media_engine, 'use_read_only_replica', lambda: None)
+    monkeypatch.setattr(media_engine, 'enrich_news_store', lambda limit, force: calls.append((limit, force)) or 0)
+    cli.main(['enrich', '--limit', '5'])
+    assert calls == [(5, True)]
+
+
+def _write_news(data_dir, count=5):
+    news = [
+        {'Hora': f'{10 + i}:00', 'Veículo': 'Canal Rural' if i % 2 else 'Agrolink',
+         'Título': f'Soja [{i}], "recorde"', 'Link': f'https://a/{i}',
+         'Categoria': 'Mercado' if i % 2 else 'Clima', '_cached_at': f'2026-03-0{i + 1}T10:00:00'}
+        for i in range(count)
+    ]
+    (data_dir / 'news_cache.json').write_text(
+        json.dumps({'last_update': '2026-03-05', 'news': news}, ensure_ascii=False, indent=2), encoding='utf-8'
+    )
+    return news
+
+
+def test_iter_json_array_reads_across_block_boundaries(data_dir):
+    news = _write_news(data_dir)
+    # Blocos menores que um item: colchetes e vírgulas dentro de strings não confundem o leitor
+    assert list(exporter.iter_json_array(str(data_dir / 'news_cache.json'), read_size=7)) == news
+    assert list(exporter.iter_json_array(str(data_dir / 'ausente.json'))) == []
+
+
+def test_csv_export_applies_filters(data_dir, tmp_path):
+    _write_news(data_dir)
+    result = exporter.export(
+        kinds=('news',), output_dir=str(tmp_path / 'out'),
+        date_from=datetime(2026, 3, 2), date_to=datetime(2026, 3, 4), categories=['mercado'],
+    )
+    path, rows = result['news']
+    assert rows == 1
+    with open(path, encoding='utf-8') as f:
+        [row] = list(csv.DictReader(f))
+    assert row['Link'] == 'https://a/1' and row['Título'] == 'Soja [1], "recorde"'
+
+
+def test_parquet_writes_one_row_group_per_chunk(data_dir, tmp_path):
+    _write_news(data_dir)
+    result = exporter.export(kinds=('news',), output_dir=str(tmp_path / 'out'), fmt='parquet', chunk_size=2)
+    parquet = pq.ParquetFile(result['news'][0])
+    assert result['news'][1] == 5
+    assert parquet.metadata.num_row_groups == 3
+    assert parquet.read().column('Link').to_pylist() == [f'https://a/{i}' for i in range(5)]
@@ -0,0 +1,71 @@
+import functools
+import os
+from datetime import timedelta
+from http.server import SimpleHTTPRequestHandler
+
+import pytest
+
+import media_engine
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures', 'feeds')
+
+
+class _FixtureHandler(SimpleHTTPRequestHandler):
+    """Serve os fixtures com Last-Modified/If-Modified-Since e registra os status."""
+
+    statuses = []
+
+    def send_response(self, code, message=None):
+        self.statuses.append(code)
+        super().send_response(code, message)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def feed_server(monkeypatch, local_http_server):
+    # Fixtures com datas fixas: amplia a janela de retenção para não expirarem
+    monkeypatch.setattr(media_engine, 'HARVEST_MAX_AGE', timedelta(days=365 * 100))
+    _FixtureHandler.statuses = []
+    return local_http_server(functools.partial(_FixtureHandler, directory=FIXTURES))
+
+
+def test_rss_feed_conditional_get(feed_server):
+    adapter = media_engine.FeedAdapter('Canal Rural', f'{feed_server}/rss.xml')
+    first = adapter._fetch_conditional()
+    assert [r.titulo for r in first] == [
+        'Soja bate recorde de exportação em março',
+        'Chuvas voltam ao Rio Grande do Sul',
+    ]
+    assert first[0].link == 'https://www.canalrural.com.br/noticias/soja-recorde'
+    assert {r.veiculo for r in first} == {'Canal Rural'}
+    assert adapter.last_modified
+
+    second = adapter._fetch_conditional()
+    assert _FixtureHandler.statuses == [200, 304]
+    assert second == first
+    assert adapter.stats == {'requests': 2, 'not_modified': 1, 'items': 2}
+
+
+def test_atom_feed_conditional_get(feed_server):
+    adapter = media_engine.FeedAdapter('El Observador', f'{feed_server}/atom.xml', lang='es-uy')
+    records = adapter._fetch_conditional()
+    assert [(r.titulo, r.link) for r in records] == [
+        ('Agro en Punta reúne productores en Punta del Este',
+         'https://www.elobservador.com.uy/agro/agro-en-punta'),
+        ('Exportación de carne crece 12%', 'https://www.elobservador.com.uy/agro/carne'),
+    ]
+    assert adapter._fetch_conditional() == records
+    assert _FixtureHandler.statuses == [200, 304]
+
+
+def test_max_items_stops_parsing(feed_server):
+    adapter = media_engine.FeedAdapter('Canal Rural', f'{feed_server}/rss.xml', max_items=1, chunk_size=64)
+    assert len(adapter._fetch_conditional()) == 1
+
+
+def test_check_feeds_reports_errors(feed_server):
+    results = media_engine.check_feeds([f'{feed_server}/rss.xml', f'{feed_server}/missing.xml'])
+    assert results[0][1] == 2 and results[0][2]['not_modified'] == 1
+    assert results[1][1] is None
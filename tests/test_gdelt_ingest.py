@@ -0,0 +1,106 @@
+import json
+import zipfile
+
+import gdelt_ingest
+import media_engine
+
+
+def _gkg_line(date, url, title, lang='por'):
+    fields = [''] * 27
+    fields[gdelt_ingest.GKG_DATE] = date
+    fields[gdelt_ingest.GKG_SOURCE_NAME] = url.split('/')[2]
+    fields[gdelt_ingest.GKG_DOCUMENT_URL] = url
+    fields[gdelt_ingest.GKG_TRANSLATION_INFO] = f'srclc:{lang};eng:GT-{lang.upper()} 1.0'
+    fields[gdelt_ingest.GKG_EXTRAS_XML] = f'<PAGE_TITLE>{title}</PAGE_TITLE>'
+    return '\t'.join(fields) + '\n'
+
+
+def _write_zip(path, lines):
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr(path.name.replace('.zip', ''), ''.join(lines))
+
+
+def test_ingest_directory_backfills_with_gdelt_dates(data_dir, tmp_path, monkeypatch):
+    # Fora da liderança (ex.: CLI como leitor): a ingestão explícita grava mesmo assim
+    monkeypatch.setattr(media_engine, 'is_fetch_leader', lambda: False)
+    exports = tmp_path / 'exports'
+    exports.mkdir()
+    _write_zip(exports / '20260101000000.gkg.csv.zip', [
+        _gkg_line('20260101000000', 'https://agro.com.br/expoagro-abre', 'Expoagro abre inscrições'),
+        _gkg_line('20260101000000', 'https://news.com/economy', 'Markets close higher', lang='eng'),
+    ])
+    _write_zip(exports / '20260101001500.gkg.csv.zip', [
+        _gkg_line('20260101001500', 'https://agro.com.br/expoagro-abre', 'Expoagro abre inscrições'),
+        _gkg_line('20260101001500', 'https://campo.com.uy/soja', 'Cosecha de soja récord', lang='spa'),
+    ])
+
+    report = gdelt_ingest.ingest_directory(str(exports), workers=1)
+
+    assert report['files'] == 2
+    assert report['stored'] == 2
+    with open(media_engine.NEWS_CACHE_FILE, encoding='utf-8') as f:
+        stored = {item['Link']: item for item in json.load(f)['news']}
+    expoagro = stored['https://agro.com.br/expoagro-abre']
+    assert expoagro['_cached_at'] == '2026-01-01T00:00:00'
+    assert expoagro['Termos'] == ['Expoagro']
+    assert stored['https://campo.com.uy/soja']['_cached_at'] == '2026-01-01T00:15:00'
+    # Carga histórica não gera alertas
+    assert not (data_dir / 'alerts.jsonl').exists()
+
+
+def test_gdelt_datetime():
+    assert gdelt_ingest.gdelt_datetime('20260102030405').isoformat() == '2026-01-02T03:04:05'
+    assert gdelt_ingest.gdelt_datetime('') is None
+
+
+def test_parse_gkg_line_reads_title_and_language():
+    article = gdelt_ingest.parse_gkg_line(
+        _gkg_line('20260101000000', 'https://agro.com.br/expoagro-abre', 'Expoagro abre inscrições')
+    )
+    assert article['url'] == 'https://agro.com.br/expoagro-abre'
+    assert article['title'] == 'Expoagro abre inscrições'
+    assert article['lang'] == 'pt-br'
+    assert gdelt_ingest.parse_gkg_line('curta\tdemais\n') is None
+
+
+def test_batches_are_written_as_files_complete_and_dedupe_in_the_store(data_dir, tmp_path, monkeypatch):
+    exports = tmp_path / 'exports'
+    exports.mkdir()
+    # O mesmo artigo em três arquivos de 15 minutos
+    for stamp in ('20260101000000', '20260101001500', '20260101003000'):
+        _write_zip(exports / f'{stamp}.gkg.csv.zip', [
+            _gkg_line(stamp, 'https://agro.com.br/expoagro-abre', 'Expoagro abre inscrições'),
+            _gkg_line(stamp, f'https://campo.com.uy/soja-{stamp}', 'Cosecha de soja récord', lang='spa'),
+        ])
+    # Já armazenado por uma coleta ao vivo posterior: a data da GDELT, mais antiga, prevalece
+    media_engine.backfill_news([{
+        'Hora': 'Agora', 'Veículo': 'agro.com.br', 'Título': 'Expoagro abre inscrições',
+        'Link': 'https://agro.com.br/expoagro-abre', 'Termos': ['Expoagro'], '_cached_at': '2026-01-02T00:00:00',
+    }])
+    backfills = []
+    original = media_engine.backfill_news
+    monkeypatch.setattr(media_engine, 'backfill_news', lambda rows: backfills.append(len(rows)) or original(rows))
+
+    report = gdelt_ingest.ingest_directory(str(exports), workers=1, batch_files=1)
+
+    # Uma gravação por arquivo concluído, não uma ao final do diretório
+    assert backfills == [2, 2, 2]
+    assert report['batches'] == 3 and report['matches'] == 6
+    assert report['stored'] == 3
+    with open(media_engine.NEWS_CACHE_FILE, encoding='utf-8') as f:
+        stored = {item['Link']: item for item in json.load(f)['news']}
+    assert len(stored) == 4
+    expoagro = stored['https://agro.com.br/expoagro-abre']
+    assert expoagro['_cached_at'] == '2026-01-01T00:00:00'
+    assert expoagro['Termos'] == ['Expoagro']
+
+
+def test_batch_size_flushes_before_the_file_count(data_dir, tmp_path, monkeypatch):
+    exports = tmp_path / 'exports'
+    exports.mkdir()
+    for stamp in ('20260101000000', '20260101001500'):
+        _write_zip(exports / f'{stamp}.gkg.csv.zip', [
+            _gkg_line(stamp, f'https://campo.com.uy/soja-{stamp}', 'Cosecha de soja récord', lang='spa'),
+        ])
+    report = gdelt_ingest.ingest_directory(str(exports), workers=1, batch_files=100, batch_size=1)
+    assert report['batches'] == 2 and report['stored'] == 2
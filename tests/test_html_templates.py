@@ -0,0 +1,33 @@
+from html_templates import KPI_CARD, THEME_STYLESHEETS, Raw, minify_css, news_link, news_table, render
+
+
+def test_minify_css_drops_comments_and_spaces():
+    css = '/* tema */\n.kpi-card {\n    color: #fff;\n    margin: 0 auto;\n}\n'
+    assert minify_css(css) == '.kpi-card{color:#fff;margin:0 auto}'
+
+
+def test_theme_stylesheets_are_built_once_per_theme():
+    assert set(THEME_STYLESHEETS) == {'dark', 'grey', 'white'}
+    for stylesheet in THEME_STYLESHEETS.values():
+        assert stylesheet.startswith('<style>') and '\n' not in stylesheet
+
+
+def test_render_escapes_values_unless_raw():
+    card = render(KPI_CARD, value='<b>3</b>', label=Raw('<i>clips</i>'))
+    assert '&lt;b&gt;3&lt;/b&gt;' in card
+    assert '<i>clips</i>' in card
+
+
+def test_news_link_only_for_valid_links():
+    assert news_link('Soja & milho', 'https://a/1') == '<a href="https://a/1" target="_blank">Soja &amp; milho</a>'
+    assert news_link('Soja', '#') == 'Soja'
+    assert news_link('<Soja>', 'https://exemplo.com/1') == '&lt;Soja&gt;'
+    assert news_link('Soja', float('nan')) == 'Soja'
+    assert news_link('Soja', None) == 'Soja'
+
+
+def test_news_table_keeps_dataframe_layout():
+    table = news_table(('Hora', 'Veículo', 'Título'), [('10:00', 'El <País>', news_link('Soja', 'https://a/1'))])
+    assert table.startswith('<table border="1" class="dataframe news-table">')
+    assert '<td>El &lt;País&gt;</td>' in table
+    assert '<td><a href="https://a/1" target="_blank">Soja</a></td>' in table
@@ -0,0 +1,52 @@
+import threading
+
+from streamlit.testing.v1 import AppTest
+
+import load_test
+
+
+def test_byte_meter_measures_each_run_per_thread(offline_app):
+    load_test.install_byte_meter()
+    load_test.install_byte_meter()  # idempotente
+    at = AppTest.from_file(load_test.APP_FILE, default_timeout=30)
+    at.run()
+    first = load_test._rerun_bytes(at)
+    assert first and first > 1000
+    # Troca de tema: mede só a nova execução (não acumula)
+    load_test._apply_action(at, 'theme_toggle')
+    at.run()
+    assert 0 < load_test._rerun_bytes(at) < first * 2
+
+    seen = []
+    thread = threading.Thread(target=lambda: seen.append(load_test._rerun_bytes(at)))
+    thread.start()
+    thread.join()
+    assert seen == [None]
+
+
+def test_percentile_picks_nearest_rank():
+    values = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
+    assert load_test._percentile(values, 50) == 0.5
+    assert load_test._percentile(values, 95) == 1.0
+    assert load_test._percentile(values, 0) == 0.1
+    assert load_test._percentile([], 99) == 0.0
+
+
+def test_mock_sources_are_deterministic():
+    first, second = load_test._MockGoogleNews(lang='pt'), load_test._MockGoogleNews(lang='pt')
+    first.search('Expoagro')
+    second.search('Expoagro')
+    assert first.results() == second.results()
+    assert len(first.results()) == 10
+    first.clear()
+    assert first.results() == []
+
+
+def test_run_load_test_reports_every_script_run(offline_app):
+    report = load_test.run_load_test(sessions=2, steps=2, workers=1, timeout=60, seed=7, memory_sessions=0)
+    assert report['errors'] == []
+    # Primeira renderização + 2 interações por sessão
+    assert report['script_runs'] == 6
+    latency = report['latency_ms']
+    assert 0 < latency['p50'] <= latency['p95'] <= latency['p99'] <= latency['max']
+    assert 'memory_per_session_kb' not in report
@@ -0,0 +1,282 @@
+import sys
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+import load_test
+import media_engine
+from request_cache import SingleFlightCache
+
+
+def test_alertas_are_deduplicated_across_groups():
+    [item] = media_engine.annotate_news_records([{'Título': 'Expoagro reúne produtores', 'Link': 'x'}])
+    assert item['Alertas'] == ['Expoagro']
+
+
+def test_simulated_radio_does_not_record_alerts(tmp_path, monkeypatch):
+    alerts_file = tmp_path / 'alerts.jsonl'
+    monkeypatch.setattr(media_engine, 'ALERTS_FILE', str(alerts_file))
+    media_engine.simulate_radio_listening('pt-br')
+    assert not alerts_file.exists()
+
+
+def test_attribute_terms_marks_unmatched_article_as_unknown():
+    batch = ('soja', 'Agro en Punta')
+    assert media_engine._attribute_terms({'title': 'Colheita de soja avança', 'url': ''}, batch) == ('soja',)
+    assert media_engine._attribute_terms(
+        {'title': 'Mercado fecha em alta', 'url': 'https://x.com/agro-en-punta-2026'}, batch
+    ) == ('Agro en Punta',)
+    assert media_engine._attribute_terms({'title': 'Mercado fecha em alta', 'url': ''}, batch) == (
+        media_engine.UNKNOWN_TERM,
+    )
+
+
+def test_search_terms_feed_tags_and_alerts():
+    [item] = media_engine.annotate_news_records([
+        {'Título': 'Mercado fecha em alta', 'Link': 'https://x.com/a', 'Termos': ['Agro en Punta', 'milho']}
+    ])
+    assert item['Categoria'] == 'Agro en Punta'
+    assert 'grãos' in item['Tags']
+    assert 'Agro en Punta' in item['Alertas']
+
+
+def test_unknown_term_is_ignored():
+    [item] = media_engine.annotate_news_records([
+        {'Título': 'Mercado fecha em alta', 'Link': 'https://x.com/b', 'Termos': [media_engine.UNKNOWN_TERM]}
+    ])
+    assert item['Categoria'] == 'Outros'
+    assert item['Alertas'] == []
+
+
+def test_googlenews_rows_carry_their_search_term(monkeypatch):
+    monkeypatch.setattr(media_engine, '_search_googlenews', lambda term, lang, period, seen_links: (
+        {'title': 'Feira abre', 'media': 'Agrolink', 'link': 'https://x.com/feira', 'date': '1 hora atrás'},
+    ))
+    [row] = media_engine._googlenews_term_news('Expoagro', 'pt-br')
+    assert row.termos == ('Expoagro',)
+
+
+def test_googlenews_paginates_one_endpoint_with_fresh_clients(monkeypatch):
+    from GoogleNews import GoogleNews
+
+    clients = []
+
+    def fake_page_at(self, page=1):
+        clients.append((self, page, self._GoogleNews__key))
+        return [{'title': f'p{page}', 'link': f'https://x.com/{page}-{i}', 'datetime': None} for i in range(2)]
+
+    def fail_search(self, key):
+        raise AssertionError('search() consulta outro endpoint')
+
+    monkeypatch.setattr(GoogleNews, 'page_at', fake_page_at)
+    monkeypatch.setattr(GoogleNews, 'search', fail_search)
+    results = media_engine._search_googlenews('boi gordo', 'pt-br', period='7d', max_pages=3)
+    assert [item['title'] for item in results] == ['p1', 'p1', 'p2', 'p2', 'p3', 'p3']
+    assert sorted(page for _, page, _ in clients) == [1, 2, 3]
+    assert len({id(client) for client, _, _ in clients}) == 3
+    assert {key for _, _, key in clients} == {'boi%20gordo'}
+
+
+def test_googlenews_adapter_refuses_unverified_versions():
+    import googlenews_adapter
+
+    googlenews_adapter.check_version('1.6.16')
+    with pytest.raises(googlenews_adapter.UnsupportedGoogleNewsVersion):
+        googlenews_adapter.check_version('1.7.0')
+
+
+def _hold_store_lock(ready, seconds):
+    import time
+    with media_engine._news_store_lock():
+        ready.set()
+        time.sleep(seconds)
+
+
+def test_news_store_lock_excludes_other_processes(data_dir):
+    import multiprocessing
+    import time
+
+    ctx = multiprocessing.get_context('fork')
+    ready = ctx.Event()
+    child = ctx.Process(target=_hold_store_lock, args=(ready, 0.5))
+    child.start()
+    try:
+        assert ready.wait(5)
+        started = time.monotonic()
+        with media_engine._news_store_lock():
+            waited = time.monotonic() - started
+    finally:
+        child.join()
+    assert waited >= 0.3
+
+
+def test_find_similar_seeds_index_from_store_on_first_use(data_dir, monkeypatch):
+    from clustering import NearDuplicateIndex
+    from similarity import TfidfIndex
+
+    media_engine.backfill_news([
+        {'Hora': 'Agora', 'Veículo': 'A', 'Título': 'Colheita de soja bate recorde no Uruguai', 'Link': 'https://a.com/1'},
+        {'Hora': 'Agora', 'Veículo': 'B', 'Título': 'Soja: colheita recorde no Uruguai', 'Link': 'https://b.com/2'},
+        {'Hora': 'Agora', 'Veículo': 'C', 'Título': 'Juros do crédito rural sobem', 'Link': 'https://c.com/3'},
+    ])
+    # Processo novo (seguidor ou partida pelo snapshot): índices vazios, nada mesclado
+    monkeypatch.setattr(media_engine, 'SIMILARITY_INDEX', TfidfIndex())
+    monkeypatch.setattr(media_engine, 'NEWS_CLUSTERS', NearDuplicateIndex())
+    monkeypatch.setattr(media_engine, '_indexes_version', None)
+
+    related = media_engine.find_similar('https://a.com/1', k=2)
+    assert related[0]['id'] == 'https://b.com/2'
+    assert related[0]['kind'] == 'news'
+
+
+def test_find_similar_latency_benchmark():
+    import load_test
+
+    result = load_test.benchmark_similarity(3000, queries=50)
+    assert result['docs'] == 3000
+    # Folga ampla para CI; com 100 mil documentos o p95 fica em poucos ms
+    assert result['p95_ms'] < 50
+
+
+def _has_tags(df):
+    return 'Tags' in df.columns and df['Tags'].map(lambda tags: isinstance(tags, list)).all()
+
+
+def test_follower_with_empty_store_returns_tagged_news(data_dir, monkeypatch):
+    monkeypatch.setattr(media_engine, 'is_fetch_leader', lambda: False)
+    df = media_engine.get_web_news('pt-br')
+    assert _has_tags(df)
+    assert any('Agro en Punta' in tags for tags in df['Tags'])
+
+
+def test_failed_fetch_returns_tagged_news(data_dir, monkeypatch):
+    import sys
+
+    monkeypatch.setitem(sys.modules, 'GoogleNews', None)  # import falha → dados simulados
+    assert _has_tags(media_engine.get_web_news('es-uy'))
+
+
+def test_fresh_results_are_tagged_when_store_is_empty(data_dir, monkeypatch):
+    from schema import NewsRecord
+
+    class Feed:
+        name, lang = 'Feed', 'pt-br'
+
+        def fetch(self):
+            return [NewsRecord('10:00', 'Canal Rural', 'Soja bate recorde no porto', 'https://f/1',
+                               categoria='Outros').to_row()]
+
+    monkeypatch.setattr(media_engine, 'SEARCH_TERMS', [])
+    monkeypatch.setattr(media_engine, 'FEED_ADAPTERS', [Feed()])
+    monkeypatch.setattr(media_engine, 'save_news_to_cache', lambda df: None)
+    df = media_engine.get_web_news('pt-br')
+    assert list(df['Link']) == ['https://f/1']
+    assert _has_tags(df)
+
+
+def test_deadline_returns_fast_sources_and_merges_late_ones(offline_app, monkeypatch):
+    release = threading.Event()
+
+    def slow_gdelt(request, timeout=None):
+        if 'gdeltproject' in getattr(request, 'full_url', str(request)):
+            release.wait(10)
+        return load_test._mock_urlopen(request, timeout)
+
+    executor = ThreadPoolExecutor(max_workers=16)
+    monkeypatch.setattr(media_engine, 'FETCH_EXECUTOR', executor)
+    monkeypatch.setattr(media_engine, 'urlopen', slow_gdelt)
+    try:
+        start = time.monotonic()
+        news = media_engine.get_web_news('pt-br', deadline=0.5)
+        assert time.monotonic() - start < 5
+        timed_out = news.attrs['timed_out_sources']
+        assert timed_out and all(source.startswith('gdelt:') for source in timed_out)
+        assert not news['Link'].str.contains('gdelt.mock.local').any()
+    finally:
+        release.set()
+        executor.shutdown(wait=True)
+    # A GDELT respondeu depois do prazo: o resultado entrou no cache em segundo plano
+    cached = media_engine.load_cached_news(include_all=True)
+    assert cached['Link'].str.contains('gdelt.mock.local').any()
+
+
+def test_new_links_are_classified_and_alerted_once(data_dir):
+    news = pd.DataFrame([
+        {'Hora': '10:00', 'Veículo': 'El País', 'Título': 'Agro en Punta recebe o MGAP', 'Link': 'https://a/1'},
+        {'Hora': '11:00', 'Veículo': 'Agrolink', 'Título': 'Chuva no Sul', 'Link': 'https://a/2'},
+    ])
+    media_engine.save_news_to_cache(news)
+    media_engine.save_news_to_cache(news)
+    stored = media_engine.load_cached_news(include_all=True).set_index('Link')
+    assert stored.loc['https://a/1', 'Categoria'] == 'Agro en Punta'
+    assert stored.loc['https://a/2', 'Categoria'] == 'Outros'
+    # Link repetido não gera alerta de novo
+    [alert] = media_engine.get_recent_alerts()
+    assert alert['link'] == 'https://a/1' and set(alert['terms']) == {'Agro en Punta', 'MGAP'}
+
+
+def test_page_exhausted_ignores_seen_and_old_items():
+    cutoff = datetime(2026, 1, 1)
+    old = {'link': 'https://x.com/velha', 'datetime': cutoff - timedelta(days=1)}
+    seen = {'link': 'https://x.com/vista', 'datetime': None}
+    fresh = {'link': 'https://x.com/nova', 'datetime': cutoff + timedelta(days=1)}
+    assert media_engine._page_exhausted([old, seen], {'https://x.com/vista'}, cutoff)
+    assert not media_engine._page_exhausted([old, seen, fresh], {'https://x.com/vista'}, cutoff)
+
+
+def test_googlenews_harvest_stops_at_first_page_without_news(monkeypatch):
+    pages = {
+        1: [{'title': 'a', 'link': 'https://x.com/a'}, {'title': 'b', 'link': 'https://x.com/b'}],
+        2: [{'title': 'c', 'link': 'https://x.com/c'}],
+        3: [{'title': 'a', 'link': 'https://x.com/a'}],
+        4: [{'title': 'd', 'link': 'https://x.com/d'}],
+    }
+    requested = []
+
+    class FakeGoogleNews:
+        def __init__(self, lang='pt', region='BR'):
+            self._results = []
+
+        def set_period(self, period):
+            pass
+
+        def search(self, key):
+            self._results = self.page_at(1)
+
+        def results(self):
+            return self._results
+
+        def page_at(self, page=1):
+            requested.append(page)
+            return list(pages[page])
+
+    fake_module = types.ModuleType('GoogleNews')
+    fake_module.GoogleNews = FakeGoogleNews
+    monkeypatch.setitem(sys.modules, 'GoogleNews', fake_module)
+    monkeypatch.setattr(media_engine, 'UPSTREAM_CACHE', SingleFlightCache())
+    results = media_engine._search_googlenews('soja', 'pt-br', max_pages=4)
+    assert [item['title'] for item in results] == ['a', 'b', 'c']
+    # A página 3 só repete links: a 4 nem é pedida
+    assert 4 not in requested
+
+
+def test_gdelt_terms_are_batched_into_or_queries(monkeypatch):
+    assert media_engine._gdelt_query(('soja',)) == '"soja" sourcelang:por'
+    assert media_engine._gdelt_query(('soja', 'milho')) == '("soja" OR "milho") sourcelang:por'
+    monkeypatch.setattr(media_engine, 'GDELT_MAX_BATCH_TERMS', 2)
+    assert media_engine.gdelt_batches(['a', 'b', 'c']) == [('a', 'b'), ('c',)]
+    monkeypatch.setattr(media_engine, 'GDELT_MAX_URL_LENGTH', 0)
+    assert media_engine.gdelt_batches(['a', 'b']) == [('a',), ('b',)]
+
+
+def test_gdelt_articles_are_attributed_to_the_terms_they_mention():
+    batch = ('soja', 'Agro en Punta')
+    assert media_engine._attribute_terms({'title': 'Colheita de SOJA avança', 'url': ''}, batch) == ('soja',)
+    assert media_engine._attribute_terms(
+        {'title': 'Mercado fecha em alta', 'url': 'https://x.com/agro-en-punta-2026'}, batch
+    ) == ('Agro en Punta',)
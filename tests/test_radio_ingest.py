@@ -0,0 +1,139 @@
+import json
+import os
+import time
+from datetime import datetime
+
+import media_engine
+from radio_ingest import RadioSpoolWatcher, chunk_timestamp
+from schema import RadioRecord
+from text_utils import classify_sentiment
+
+
+def _chunk(spool, station, stamp, text=None, age=60):
+    station_dir = spool / station
+    station_dir.mkdir(parents=True, exist_ok=True)
+    audio = station_dir / f'{stamp}.wav'
+    audio.write_bytes(b'RIFF' + b'\0' * 64)
+    if text is not None:
+        (station_dir / f'{stamp}.wav.txt').write_text(text, encoding='utf-8')
+    if age:
+        past = time.time() - age
+        os.utime(audio, (past, past))
+    return audio
+
+
+def _checkpointed(spool):
+    path = spool / '.checkpoint.jsonl'
+    if not path.exists():
+        return {}
+    return {row['chunk']: row.get('status') for row in map(json.loads, path.read_text().splitlines())}
+
+
+def test_classify_sentiment():
+    assert classify_sentiment('Produtores comemoram safra recorde') == 'Positivo'
+    assert classify_sentiment('Seca preocupa e provoca perdas') == 'Negativo'
+    assert classify_sentiment('Previsão para amanhã') == 'Neutro'
+
+
+def test_chunk_timestamp_from_name(tmp_path):
+    audio = _chunk(tmp_path, 'Radio', '20260301103000')
+    assert chunk_timestamp(str(audio)) == datetime(2026, 3, 1, 10, 30)
+
+
+def test_missing_transcript_is_retried_not_checkpointed(tmp_path):
+    spool = tmp_path / 'spool'
+    _chunk(spool, 'Rural AM', '20260301100000', 'Safra recorde anima produtores')
+    _chunk(spool, 'Rural AM', '20260301100500')  # .txt ainda não gravado
+    delivered = []
+    watcher = RadioSpoolWatcher(str(spool), delivered.extend, workers=1, poll_interval=0.05)
+    # Uma passada: o primeiro é entregue, o segundo continua pendente
+    watcher.run(should_stop=lambda: True)
+    assert [r.transcricao for r in delivered] == ['Safra recorde anima produtores']
+    assert _checkpointed(spool) == {'Rural AM/20260301100000.wav': 'ok'}
+
+    (spool / 'Rural AM' / '20260301100500.wav.txt').write_text('Chuva volta ao Sul', encoding='utf-8')
+    stats = watcher.run(once=True)
+    assert [r.transcricao for r in delivered][-1] == 'Chuva volta ao Sul'
+    assert 'Rural AM/20260301100500.wav' in _checkpointed(spool)
+    assert stats['waiting'] == 0
+
+
+def test_chunk_still_being_written_waits_for_stable_size(tmp_path):
+    spool = tmp_path / 'spool'
+    audio = _chunk(spool, 'Rural AM', '20260301110000', 'Leilão de gado', age=0)
+    watcher = RadioSpoolWatcher(str(spool), lambda records: None, workers=1, settle_seconds=3600)
+    assert watcher.pending_chunks() == []
+    assert watcher.waiting == 1
+    with open(audio, 'ab') as f:
+        f.write(b'\0' * 32)  # gravador ainda escrevendo
+    assert watcher.pending_chunks() == []
+    # Tamanho igual ao da varredura anterior: completo
+    assert watcher.pending_chunks() == ['Rural AM/20260301110000.wav']
+
+
+def test_stored_transcripts_reach_the_app_process(data_dir, monkeypatch):
+    from similarity import TfidfIndex
+    from trending import TrendingTerms
+
+    before = media_engine.get_data_version()
+    now = datetime.now().replace(microsecond=0)
+    media_engine.store_radio_records([
+        RadioRecord(now, 'Rural AM', 'Expoagro recebe compradores de soja', 'Positivo'),
+        RadioRecord(now, 'Rural AM', 'Expoagro recebe compradores de soja na segunda', 'Positivo'),
+    ])
+    # Versão persistida em disco: outro processo enxerga a mudança
+    assert media_engine.get_data_version() == before + 1
+    assert (data_dir / 'data_version').read_text() == str(before + 1)
+    # Processo do dashboard: índices próprios, alimentados a partir do arquivo
+    monkeypatch.setattr(media_engine, 'SIMILARITY_INDEX', TfidfIndex())
+    monkeypatch.setattr(media_engine, 'TRENDING', TrendingTerms())
+    monkeypatch.setattr(media_engine, '_indexes_version', None)
+    monkeypatch.setattr(media_engine, '_radio_offset', 0)
+
+    terms = {row['term'] for row in media_engine.get_trending_terms(k=20)}
+    assert 'expoagro' in terms
+    related = media_engine.find_similar('radio:Rural AM:Expoagro recebe compradores de soja', k=1)
+    assert related[0]['kind'] == 'radio'
+    # Alertas gravados pela ingestão
+    assert 'Expoagro' in (data_dir / 'alerts.jsonl').read_text(encoding='utf-8')
+
+
+def test_radio_alerts_are_recorded_under_the_store_lock(data_dir, monkeypatch):
+    import fcntl
+
+    held = []
+
+    def record_alerts(alerts_file, alerts):
+        # Outro descritor (como outro processo) não consegue o lock do armazenamento
+        with open(f'{media_engine.NEWS_CACHE_FILE}.lock', 'a') as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                held.append(True)
+            else:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+                held.append(False)
+
+    monkeypatch.setattr(media_engine, 'record_alerts', record_alerts)
+    monkeypatch.setattr(media_engine, '_recent_radio_alerts', {})
+    media_engine.store_radio_records([
+        RadioRecord(datetime.now(), 'Rural AM', 'Expointer abre com soja em alta', 'Positivo'),
+    ])
+    assert held == [True]
+
+
+def test_watcher_delivers_each_chunk_once(tmp_path):
+    spool = tmp_path / 'spool'
+    _chunk(spool, 'Rural AM', '20260301100000', 'Safra recorde anima produtores')
+    _chunk(spool, 'Rádio Campo', '20260301100500', 'Seca provoca perdas no Sul')
+    delivered = []
+    stats = RadioSpoolWatcher(str(spool), delivered.extend, workers=1).run(once=True)
+    assert sorted((r.emissora, r.sentimento) for r in delivered) == [
+        ('Rural AM', 'Positivo'), ('Rádio Campo', 'Negativo'),
+    ]
+    assert stats['checkpointed'] == 2
+    assert set(_checkpointed(spool)) == {'Rural AM/20260301100000.wav', 'Rádio Campo/20260301100500.wav'}
+
+    # Novo processo: o checkpoint evita entregar de novo
+    RadioSpoolWatcher(str(spool), delivered.extend, workers=1).run(once=True)
+    assert len(delivered) == 2
@@ -0,0 +1,89 @@
+import sqlite3
+import time
+
+from replica import ReplicaCoordinator
+
+
+def test_single_leader_and_failover(tmp_path):
+    db = str(tmp_path / 'coordination.db')
+    first = ReplicaCoordinator(db, replica_id='a', lease_ttl=30)
+    second = ReplicaCoordinator(db, replica_id='b', lease_ttl=30)
+    assert first.try_acquire()
+    assert not second.try_acquire()
+    assert first.leader() == 'a'
+    first.release()
+    assert second.try_acquire()
+
+
+def test_expired_lease_is_taken_over(tmp_path, monkeypatch):
+    db = str(tmp_path / 'coordination.db')
+    first = ReplicaCoordinator(db, replica_id='a', lease_ttl=30)
+    second = ReplicaCoordinator(db, replica_id='b', lease_ttl=30)
+    assert first.try_acquire()
+    # Líder parou de renovar: após o TTL, outra réplica assume
+    now = time.time() + 31
+    monkeypatch.setattr(time, 'time', lambda: now)
+    assert first.leader() is None
+    assert second.try_acquire() and second.is_leader()
+    assert not first.try_acquire() and not first.is_leader()
+
+
+def test_leadership_lapses_with_the_lease_without_a_heartbeat(tmp_path, monkeypatch):
+    db = str(tmp_path / 'coordination.db')
+    leader = ReplicaCoordinator(db, replica_id='a', lease_ttl=30)
+    assert leader.try_acquire() and leader.is_leader()
+    # Heartbeat atrasado: o flag do último heartbeat não basta para gravar
+    later = time.monotonic() + 30
+    monkeypatch.setattr(time, 'monotonic', lambda: later)
+    assert not leader.is_leader()
+
+
+def test_data_version_is_shared(tmp_path):
+    db = str(tmp_path / 'coordination.db')
+    leader = ReplicaCoordinator(db, replica_id='a')
+    follower = ReplicaCoordinator(db, replica_id='b')
+    assert follower.data_version() == 0
+    assert leader.bump_version() == 1
+    assert leader.bump_version() == 2
+    assert follower.data_version() == 2
+
+
+def test_data_version_reuses_one_connection_per_thread(tmp_path, monkeypatch):
+    import threading
+
+    db = str(tmp_path / 'coordination.db')
+    follower = ReplicaCoordinator(db, replica_id='b')
+    connects = []
+    original = follower._connect
+    monkeypatch.setattr(follower, '_connect', lambda: connects.append(1) or original())
+    for _ in range(5):
+        follower.data_version()
+    assert len(connects) == 1
+    # Outra thread abre a própria conexão (sqlite3 não compartilha entre threads)
+    thread = threading.Thread(target=follower.data_version)
+    thread.start()
+    thread.join()
+    assert len(connects) == 2
+    ReplicaCoordinator(db, replica_id='a').bump_version()
+    assert follower.data_version() == 1
+
+
+def test_read_only_replica_never_takes_lease(tmp_path):
+    db = str(tmp_path / 'coordination.db')
+    reader = ReplicaCoordinator(db, replica_id='cli', participate=False)
+    reader.start_heartbeat()
+    assert not reader.try_acquire()
+    assert reader.leader() is None
+    # Ainda acompanha (e pode anunciar) novas versões de dados
+    version = reader.bump_version()
+    assert ReplicaCoordinator(db, replica_id='app').data_version() == version
+
+
+def test_uses_rollback_journal(tmp_path):
+    db = str(tmp_path / 'coordination.db')
+    ReplicaCoordinator(db)
+    conn = sqlite3.connect(db)
+    try:
+        assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'delete'
+    finally:
+        conn.close()
@@ -0,0 +1,71 @@
+import threading
+import time
+
+import pytest
+
+from request_cache import SingleFlightCache
+
+
+def test_concurrent_callers_share_one_fetch():
+    cache = SingleFlightCache()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return 'resultado'
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(cache.get_or_fetch('k', fetch)))
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=lambda: results.append(cache.get_or_fetch('k', fetch))) for _ in range(4)]
+    for thread in followers:
+        thread.start()
+    while cache.stats()['coalesced'] < 4:
+        time.sleep(0.01)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+    assert calls == [1]
+    assert results == ['resultado'] * 5
+    assert cache.get_or_fetch('k', fetch) == 'resultado'
+    assert cache.stats()['hits'] == 1
+
+
+def test_lru_eviction_and_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+    cache = SingleFlightCache(max_entries=2, ttl=10)
+    for key in ('a', 'b'):
+        cache.get_or_fetch(key, lambda key=key: key.upper())
+    cache.get_or_fetch('a', lambda: 'novo')          # 'a' vira o mais recente
+    cache.get_or_fetch('c', lambda: 'C')             # evicta 'b'
+    assert cache.get_or_fetch('b', lambda: 'B2') == 'B2'
+    assert cache.stats()['evictions'] == 2
+
+    now[0] += 11
+    assert cache.get_or_fetch('c', lambda: 'C2') == 'C2'
+    assert cache.get_or_fetch('x', lambda: 'curto', ttl=1) == 'curto'
+    now[0] += 2
+    assert cache.get_or_fetch('x', lambda: 'renovado') == 'renovado'
+
+
+def test_errors_reach_every_caller_and_are_not_cached():
+    cache = SingleFlightCache()
+
+    def fail():
+        raise TimeoutError('fonte fora do ar')
+
+    with pytest.raises(TimeoutError):
+        cache.get_or_fetch('k', fail)
+    assert cache.get_or_fetch('k', lambda: 'ok') == 'ok'
+    assert cache.stats()['errors'] == 1
+
+    cache.invalidate('k')
+    assert cache.get_or_fetch('k', lambda: 'de novo') == 'de novo'
+    cache.invalidate()
+    assert cache.stats()['size'] == 0
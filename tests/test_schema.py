@@ -0,0 +1,37 @@
+from datetime import datetime
+
+import pandas as pd
+
+from schema import NewsRecord, RadioRecord, SocialRecord, SOCIAL_PLATFORMS, news_frame, radio_frame, social_frame
+
+
+def test_news_frame_uses_categoricals_and_accepts_rows():
+    df = news_frame([
+        NewsRecord('10:00', 'El País', 'Soja em alta', 'https://a/1', 'Mercado'),
+        {'Hora': '11:00', 'Veículo': 'El País', 'Título': 'Gado', 'Link': 'https://a/2', 'Categoria': 'Pecuária'},
+    ])
+    assert isinstance(df['Veículo'].dtype, pd.CategoricalDtype)
+    assert isinstance(df['Categoria'].dtype, pd.CategoricalDtype)
+    assert list(df['Link']) == ['https://a/1', 'https://a/2']
+
+
+def test_radio_frame_sorts_chronologically_across_midnight():
+    df = radio_frame([
+        RadioRecord(datetime(2026, 3, 1, 23, 55), 'Radio Rural', 'antes', 'Neutro'),
+        RadioRecord(datetime(2026, 3, 2, 0, 5), 'Radio Rural', 'depois', 'Positivo'),
+    ])
+    assert list(df['Transcrição']) == ['depois', 'antes']
+    assert pd.api.types.is_datetime64_any_dtype(df['Timestamp'])
+    assert list(df['Sentimento'].cat.categories) == ['Positivo', 'Neutro', 'Negativo']
+
+
+def test_social_frame_counts_are_int32_with_total():
+    df = social_frame([SocialRecord(datetime(2026, 3, 1, 9), {'X': 3, 'Instagram': 2})])
+    assert df.loc[0, 'Hora'] == '09:00'
+    assert df.loc[0, 'Total'] == 5
+    assert all(df[platform].dtype == 'int32' for platform in SOCIAL_PLATFORMS)
+
+
+def test_empty_frames_stay_empty():
+    assert news_frame([]).empty
+    assert radio_frame([]).empty
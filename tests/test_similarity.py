@@ -0,0 +1,44 @@
+from similarity import TfidfIndex
+
+
+def _index():
+    index = TfidfIndex()
+    index.add('a', 'Colheita de soja bate recorde no Uruguai')
+    index.add('b', 'Recorde na colheita da soja uruguaia')
+    index.add('c', 'Leilão de gado movimenta remates em Tacuarembó')
+    index.add('d', 'Crédito rural: juros do plano safra sobem')
+    return index
+
+
+def test_find_similar_ranks_by_cosine():
+    index = _index()
+    neighbours = index.find_similar('a', k=2)
+    assert neighbours[0][0] == 'b'
+    assert all(item_id != 'a' for item_id, _, _ in neighbours)
+    assert index.find_similar('desconhecido') == []
+
+
+def test_search_ignores_accents_and_case():
+    [(item_id, score, _)] = _index().search('LEILÃO gado', k=1)
+    assert item_id == 'c'
+    assert 0 < score <= 1
+
+
+def test_repeated_id_is_ignored_unless_replaced():
+    index = _index()
+    index.add('d', 'Texto totalmente diferente sobre gado')
+    assert index.search('gado', k=5)[0][0] == 'c'
+    index.add('d', 'Leilão de gado em Durazno atrai compradores', replace=True)
+    assert len(index) == 4
+    hits = [item_id for item_id, _, _ in index.search('leilão gado', k=5)]
+    assert hits.count('d') == 1
+    # O texto antigo saiu das buscas
+    assert 'd' not in [item_id for item_id, _, _ in index.search('juros plano safra')]
+
+
+def test_index_scales_past_idf_refresh():
+    index = TfidfIndex(refresh_ratio=0.1)
+    for i in range(500):
+        index.add(f'n{i}', f'notícia {i} sobre soja milho trigo lote{i % 7}')
+    assert len(index) == 500
+    assert len(index.find_similar('n0', k=5)) == 5
@@ -0,0 +1,58 @@
+from datetime import datetime
+
+import pandas as pd
+
+from data_service import freeze_frame
+from schema import NewsRecord, RadioRecord, news_frame, radio_frame
+from snapshot import load_snapshot, save_snapshot
+from tagging import build_tag_index
+
+
+def test_published_frames_round_trip(data_dir):
+    news = freeze_frame(news_frame([
+        {**NewsRecord('10:00', 'Canal Rural', 'Soja em alta', 'https://a/1', 'Agro en Punta').to_row(),
+         'Tags': ['Agro en Punta', 'Soja']},
+        {**NewsRecord('11:00', 'Agrolink', 'Chuva no Sul', 'https://a/2', 'Outros').to_row(), 'Tags': []},
+    ]))
+    radio = radio_frame([RadioRecord(datetime(2026, 3, 1, 9), 'Rural AM', 'Safra recorde', 'Positivo')])
+    save_snapshot('pt-br', news, radio, radio.iloc[0:0], {'Positivo': 1, 'Neutro': 0, 'Negativo': 0})
+
+    loaded_news, loaded_radio, _, sentiment, manifest = load_snapshot('pt-br')
+    assert build_tag_index(loaded_news).lookup('Agro en Punta') == [0]
+    assert loaded_radio['Transcrição'].tolist() == ['Safra recorde']
+    assert sentiment['Positivo'] == 1 and manifest['rows']['news'] == 2
+
+
+def _frames():
+    news = pd.DataFrame({
+        'Hora': ['10:00', '11:00'], 'Veículo': ['Canal Rural', 'Agrolink'],
+        'Título': ['Soja em alta', 'Chuva no Sul'], 'Link': ['https://a/1', 'https://a/2'],
+    })
+    radio = pd.DataFrame({'Emissora': ['Rural AM'], 'Transcrição': ['Safra recorde'], 'Sentimento': ['Positivo']})
+    social = pd.DataFrame({'Plataforma': ['X'], 'Menções': [3]})
+    return news, radio, social
+
+
+def test_snapshot_round_trip_per_language(data_dir):
+    news, radio, social = _frames()
+    save_snapshot('es-uy', news, radio, social, {'Positivo': 1, 'Neutro': 0, 'Negativo': 2})
+
+    loaded_news, loaded_radio, loaded_social, sentiment, manifest = load_snapshot('es-uy')
+    assert loaded_news['Título'].tolist() == ['Soja em alta', 'Chuva no Sul']
+    assert loaded_radio['Emissora'].tolist() == ['Rural AM']
+    assert loaded_social['Menções'].tolist() == [3]
+    assert sentiment == {'Positivo': 1, 'Neutro': 0, 'Negativo': 2}
+    assert manifest['lang'] == 'es-uy' and manifest['rows']['news'] == 2
+    assert load_snapshot('pt-br') is None
+
+
+def test_snapshot_without_manifest_or_with_broken_file_is_ignored(data_dir):
+    news, radio, social = _frames()
+    save_snapshot('pt-br', news, radio, social, {'Positivo': 0, 'Neutro': 0, 'Negativo': 0})
+    snapshot_dir = data_dir / 'snapshot' / 'pt-br'
+    (snapshot_dir / 'news.arrow').write_bytes(b'corrompido')
+    assert load_snapshot('pt-br') is None
+    # O manifesto é gravado por último: sem ele o snapshot não vale
+    save_snapshot('pt-br', news, radio, social, {'Positivo': 0, 'Neutro': 0, 'Negativo': 0})
+    (snapshot_dir / 'manifest.json').unlink()
+    assert load_snapshot('pt-br') is None
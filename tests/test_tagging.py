@@ -0,0 +1,43 @@
+import pandas as pd
+
+import media_engine
+from tagging import TagIndex, TopicTagger, build_tag_index
+
+
+def test_tagger_assigns_several_topics_in_catalog_order():
+    tagger = TopicTagger()
+    assert tagger.tag('Exportación de CARNE BOVINA y soja crece pese a la sequía') == [
+        'soja', 'pecuária', 'exportação', 'clima',
+    ]
+    assert tagger.tag('Resultado do campeonato') == []
+
+
+def test_tag_index_lookups():
+    index = TagIndex()
+    index.add('a', ['soja', 'clima'])
+    index.add('b', ['clima'])
+    index.add('c', ['crédito rural'])
+    assert index.lookup('clima') == ['a', 'b']
+    assert index.lookup('inexistente') == []
+    assert index.lookup_any(['clima', 'soja', 'crédito rural']) == ['a', 'b', 'c']
+    assert index.search_tags('CREDITO') == ['crédito rural']
+    assert TagIndex(index.to_dict()).lookup('soja') == ['a']
+
+
+def test_build_tag_index_uses_row_positions():
+    df = pd.DataFrame({'Tags': [['soja'], None, ['soja', 'clima']]})
+    index = build_tag_index(df)
+    assert index.lookup('soja') == [0, 2]
+    assert build_tag_index(pd.DataFrame()).tags() == []
+
+
+def test_store_keeps_tags_and_tag_index(data_dir):
+    media_engine.save_news_to_cache(pd.DataFrame([
+        {'Hora': '10:00', 'Veículo': 'El País', 'Título': 'Punta del Este recebe leilão de gado', 'Link': 'https://a/1'},
+        {'Hora': '11:00', 'Veículo': 'Agrolink', 'Título': 'Chuva atrasa plantio de soja', 'Link': 'https://a/2'},
+    ]))
+    stored = media_engine.load_cached_news(include_all=True).set_index('Link')
+    assert list(stored.loc['https://a/1', 'Tags']) == ['Agro en Punta', 'pecuária']
+    index = media_engine.load_tag_index()
+    assert index.lookup('soja') == ['https://a/2']
+    assert index.lookup('Agro en Punta') == ['https://a/1']
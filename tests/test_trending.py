@@ -0,0 +1,62 @@
+from trending import CountMinSketch, TrendingTerms, extract_terms
+
+
+def test_count_min_never_underestimates():
+    sketch = CountMinSketch(width=64, depth=4)
+    counts = {f'termo{i}': i % 7 + 1 for i in range(200)}
+    for term, count in counts.items():
+        sketch.add(term, count)
+    for term, count in counts.items():
+        assert sketch.estimate(term) >= count
+    sketch.clear()
+    assert sketch.estimate('termo1') == 0
+
+
+def test_extract_terms_drops_stopwords_and_builds_bigrams():
+    terms = extract_terms('A colheita de soja em Punta')
+    assert 'colheita' in terms
+    assert 'soja' in terms
+    assert 'de' not in terms
+
+
+def test_growth_uses_only_observed_baseline_slots():
+    trending = TrendingTerms(slot_seconds=60, slots=12, recent_slots=3, clock=lambda: 0)
+    # 1 fatia de base observada (t=0) com 2 menções, depois 3 fatias recentes com 2 cada
+    trending.add_terms(['soja'] * 2, now=0)
+    for minute in (1, 2, 3):
+        trending.add_terms(['soja'] * 2, now=minute * 60)
+    [row] = trending.trending(k=1, now=3 * 60)
+    assert row['count'] == 6
+    assert row['baseline'] == 2
+    # taxa recente 6/3 = 2; taxa de base (2+1)/1 = 3 (não (2+1)/9)
+    assert row['growth'] == round(2 / 3, 2)
+
+
+def test_new_term_outranks_steady_term():
+    trending = TrendingTerms(slot_seconds=60, slots=12, recent_slots=3, clock=lambda: 0)
+    for minute in range(12):
+        trending.add_terms(['milho'] * 2, now=minute * 60)
+    trending.add_terms(['expoagro'] * 6, now=11 * 60)
+    top = trending.trending(k=2, now=11 * 60)
+    assert top[0]['term'] == 'expoagro'
+
+
+def test_candidates_stay_within_capacity():
+    trending = TrendingTerms(slot_seconds=60, slots=12, recent_slots=3, capacity=4, clock=lambda: 0)
+    for i in range(20):
+        trending.add_terms([f'termo{i}'], now=0)
+    trending.add_terms(['soja'] * 5, now=0)
+    assert len(trending._candidates) <= 4
+    top = trending.trending(k=1, now=0)
+    assert top[0]['term'] == 'soja'
+
+
+def test_eviction_heap_drops_the_weakest_and_stays_bounded():
+    trending = TrendingTerms(slot_seconds=60, slots=12, recent_slots=3, capacity=3, clock=lambda: 0)
+    trending.add_terms(['soja'] * 3 + ['milho'] * 2 + ['trigo'], now=0)
+    # Contagens atualizadas deixam entradas antigas no heap (removidas preguiçosamente)
+    for _ in range(50):
+        trending.add_terms(['soja', 'milho'], now=0)
+    trending.add_terms(['arroz'] * 2, now=0)
+    assert set(trending._candidates) == {'soja', 'milho', 'arroz'}
+    assert len(trending._heap) <= 2 * trending.capacity + 16
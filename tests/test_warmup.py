@@ -0,0 +1,96 @@
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+import keep_alive
+import load_test
+import media_engine
+import warmup
+
+TIMEOUT = 30
+
+
+class _HealthHandler(BaseHTTPRequestHandler):
+    """Stand-in do servidor Streamlit: só o endpoint de saúde."""
+
+    def do_GET(self):
+        status = 200 if self.path == keep_alive.HEALTH_PATH else 404
+        self.send_response(status)
+        self.end_headers()
+        self.wfile.write(b'ok')
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_warmup_page_url():
+    assert keep_alive.warmup_page_url('https://agropulse.streamlit.app/', token='') == \
+        'https://agropulse.streamlit.app/?warmup=1'
+    assert keep_alive.warmup_page_url('http://localhost:8501/?embed=true', token='a b&c') == \
+        'http://localhost:8501/?embed=true&warmup=1&token=a%20b%26c'
+
+
+def test_query_param_warms_the_app_process(offline_app, monkeypatch):
+    monkeypatch.setenv('AGROPULSE_WARMUP_TOKEN', 'segredo')
+    at = AppTest.from_file(load_test.APP_FILE, default_timeout=TIMEOUT)
+    at.query_params[keep_alive.WARMUP_PARAM] = '1'
+    at.query_params[keep_alive.WARMUP_TOKEN_PARAM] = 'segredo'
+    at.run()
+    assert not at.exception
+    assert at.success[0].value == keep_alive.WARMUP_DONE
+    fetches = media_engine.UPSTREAM_CACHE.stats()['misses']
+    assert fetches > 0
+
+    # Sessão seguinte no mesmo processo: dados já carregados, nenhuma busca nova
+    session = AppTest.from_file(load_test.APP_FILE, default_timeout=TIMEOUT).run()
+    assert not session.exception
+    assert media_engine.UPSTREAM_CACHE.stats()['misses'] == fetches
+
+
+@pytest.mark.parametrize('server_token, params', [
+    ('segredo', {'warmup': 'sim', 'token': 'segredo'}),
+    ('segredo', {'warmup': '1', 'token': 'errado'}),
+    ('segredo', {'warmup': '1'}),
+    ('', {'warmup': '1', 'token': ''}),
+])
+def test_warmup_needs_flag_one_and_the_shared_token(offline_app, monkeypatch, server_token, params):
+    monkeypatch.setenv('AGROPULSE_WARMUP_TOKEN', server_token)
+    at = AppTest.from_file(load_test.APP_FILE, default_timeout=TIMEOUT)
+    for key, value in params.items():
+        at.query_params[key] = value
+    at.run()
+    assert not at.exception
+    # Dashboard normal, sem o relatório de aquecimento
+    assert all(success.value != keep_alive.WARMUP_DONE for success in at.success)
+    assert len(at.markdown) > 1
+
+
+def test_default_mode_is_http(monkeypatch):
+    calls = []
+    monkeypatch.setattr(keep_alive, 'run_http', lambda url, warmup_url: calls.append('http') or True)
+    monkeypatch.setattr(keep_alive, 'run_selenium', lambda url: calls.append('selenium') or True)
+    monkeypatch.setattr('sys.argv', ['keep_alive.py'])
+    keep_alive.run()
+    monkeypatch.setattr('sys.argv', ['keep_alive.py', '--selenium'])
+    keep_alive.run()
+    assert calls == ['http', 'selenium']
+
+
+def test_http_keep_alive_against_local_http_servers(offline_app, local_http_server, capsys):
+    app_url = local_http_server(_HealthHandler)
+    warmup_url = local_http_server(warmup.WarmupHandler)
+    assert keep_alive.run_http(app_url, warmup_url)
+    out = capsys.readouterr().out
+    assert 'Health 200' in out and 'Warm-up 200' in out
+    for lang in warmup.WARMUP_LANGS:
+        assert (offline_app / 'snapshot' / lang / 'manifest.json').exists()
+
+    state = warmup.cache_state()
+    assert state['news_cache']['present']
+    assert all(snapshot['present'] for snapshot in state['snapshots'].values())
+
+
+def test_http_keep_alive_fails_when_app_is_down(local_http_server):
+    app_url = local_http_server(_HealthHandler)
+    assert not keep_alive.run_http(app_url + '/missing', '')
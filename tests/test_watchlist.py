@@ -0,0 +1,64 @@
+import json
+
+from watchlist import AhoCorasick, Watchlist, DEFAULT_WATCHLIST, load_recent_alerts, load_watchlist, record_alerts
+
+
+def test_aho_corasick_matches_on_word_boundaries():
+    automaton = AhoCorasick([('soja', 'soja'), ('boi gordo', 'boi'), ('so', 'so')])
+    text = 'soja e boi gordo; sojas'
+    found = [(text[start:end], payload) for start, end, payload in automaton.iter_matches(text)]
+    assert found == [('soja', 'soja'), ('boi gordo', 'boi')]
+
+
+def test_match_is_accent_and_case_insensitive():
+    watchlist = Watchlist(DEFAULT_WATCHLIST)
+    terms = {m['term'] for m in watchlist.match('Colheita de MAÍZ e Soja no Uruguai')}
+    assert {'maíz', 'soja'} <= terms
+
+
+def test_acronyms_are_case_sensitive():
+    watchlist = Watchlist(DEFAULT_WATCHLIST)
+    assert not any(m['term'] == 'MAPA' for m in watchlist.match('Novo mapa da safra de soja'))
+    assert {'term': 'MAPA', 'group': 'Ministros'} in watchlist.match('MAPA anuncia crédito rural')
+
+
+def test_term_in_two_groups_reports_both_groups():
+    watchlist = Watchlist(DEFAULT_WATCHLIST)
+    groups = {m['group'] for m in watchlist.match('Expoagro abre portas') if m['term'] == 'Expoagro'}
+    assert groups == {'Marcas', 'Concorrentes'}
+
+
+def test_load_watchlist_from_file_or_defaults(tmp_path):
+    path = tmp_path / 'watchlist.json'
+    path.write_text(json.dumps({'Evento': ['Agro en Punta'], 'Marcas': ['Tractorcito']}), encoding='utf-8')
+    watchlist = load_watchlist(str(path))
+    assert watchlist.is_event('Começa o AGRO EN PUNTA')
+    assert watchlist.match('Tractorcito lança modelo') == [{'term': 'Tractorcito', 'group': 'Marcas'}]
+    assert load_watchlist(str(tmp_path / 'ausente.json')).groups == DEFAULT_WATCHLIST
+
+
+def test_recent_alerts_newest_first(tmp_path):
+    alerts_file = str(tmp_path / 'alerts.jsonl')
+    for i in range(10):
+        record_alerts(alerts_file, [{'kind': 'news', 'n': i}])
+    record_alerts(alerts_file, [])
+    recent = load_recent_alerts(alerts_file, limit=3)
+    assert [a['n'] for a in recent] == [9, 8, 7]
+    assert all('at' in a for a in recent)
+
+
+def test_alert_log_tail_and_rotation(tmp_path):
+    alerts_file = str(tmp_path / 'alerts.jsonl')
+    for i in range(30):
+        record_alerts(alerts_file, [{'kind': 'news', 'n': i}], max_bytes=400)
+    # Rotacionou: o arquivo atual ficou pequeno e a geração anterior foi mantida
+    assert (tmp_path / 'alerts.jsonl.1').exists()
+    assert (tmp_path / 'alerts.jsonl').stat().st_size < 400 + 100
+    recent = load_recent_alerts(alerts_file, limit=5)
+    assert [a['n'] for a in recent] == [29, 28, 27, 26, 25]
+
+
+def test_load_recent_alerts_skips_truncated_line(tmp_path):
+    alerts_file = tmp_path / 'alerts.jsonl'
+    alerts_file.write_text(json.dumps({'n': 1}) + '\n' + '{"n": 2', encoding='utf-8')
+    assert load_recent_alerts(str(alerts_file), limit=10) == [{'n': 1}]